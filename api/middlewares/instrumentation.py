@@ -0,0 +1,293 @@
+"""
+Module for request instrumentation: per endpoint latency, sql query count
+and database time, reported in a Server-Timing header and a /metrics
+endpoint in the prometheus text format.
+
+The metrics are kept per process, each api worker reports its own.
+"""
+
+from collections import OrderedDict, defaultdict
+from threading import Lock
+from time import perf_counter
+
+from flask import Response, current_app, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..models.connection_pool import (CHECKOUT_WAIT_BUCKETS,
+                                      InstrumentedQueuePool)
+from ..models.database import db
+from ..utilities.record_count import count_cache
+from ..utilities.timing import is_instrumented
+from .token_required import token_cache
+
+# Upper bounds in seconds of the request latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def format_labels(labels):
+    """Renders prometheus labels, escaping their values"""
+
+    return ','.join('{}="{}"'.format(
+        name,
+        str(value).replace('\\', '\\\\').replace('"', '\\"').replace(
+            '\n', '\\n')) for name, value in labels)
+
+
+def format_metric(name, metric_type, help_text, samples):
+    """
+    Renders a metric in the prometheus text format
+    :param samples: (suffix, labels, value) tuples
+    """
+
+    lines = [f'# HELP {name} {help_text}', f'# TYPE {name} {metric_type}']
+    for suffix, labels, value in samples:
+        labels = f'{{{format_labels(labels)}}}' if labels else ''
+        lines.append(f'{name}{suffix}{labels} {value}')
+    return lines
+
+
+class RequestMetrics:
+    """
+    Aggregates of the instrumented requests of this process.
+
+    Named collectors, functions returning the rendered lines of other
+    metrics, can be registered to be exported along.
+    """
+
+    def __init__(self):
+        """Constructor to initialize an instance of the class."""
+        self.lock = Lock()
+        self.collectors = OrderedDict()
+        self.reset()
+
+    def reset(self):
+        """Drops every aggregate"""
+        with self.lock:
+            self.requests = defaultdict(int)
+            self.latencies = defaultdict(
+                lambda: [[0] * len(LATENCY_BUCKETS), 0.0, 0])
+            self.queries = defaultdict(lambda: [0, 0.0])
+
+    def register_collector(self, name, collector):
+        """
+        Exports the lines returned by collector along the metrics, replacing
+        the collector previously registered under name
+        """
+        self.collectors[name] = collector
+
+    def observe(self, method, endpoint, status, duration, query_count,
+                db_time):
+        """Records a request"""
+        with self.lock:
+            self.requests[(method, endpoint, status)] += 1
+
+            latency = self.latencies[(method, endpoint)]
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if duration <= bound:
+                    latency[0][index] += 1
+            latency[1] += duration
+            latency[2] += 1
+
+            queries = self.queries[(method, endpoint)]
+            queries[0] += query_count
+            queries[1] += db_time
+
+    def render(self):
+        """Returns the metrics in the prometheus text format"""
+        with self.lock:
+            lines = format_metric(
+                'activo_http_requests_total', 'counter',
+                'Number of requests handled', [
+                    ('', (('method', method), ('endpoint', endpoint),
+                          ('status', status)), count)
+                    for (method, endpoint, status), count in sorted(
+                        self.requests.items())
+                ])
+
+            samples = []
+            for (method, endpoint), (buckets, total, count) in sorted(
+                    self.latencies.items()):
+                labels = (('method', method), ('endpoint', endpoint))
+                for bound, bucket in zip(LATENCY_BUCKETS, buckets):
+                    samples.append(
+                        ('_bucket', labels + (('le', bound), ), bucket))
+                samples.extend([('_bucket', labels + (('le', '+Inf'), ),
+                                 count), ('_sum', labels, total),
+                                ('_count', labels, count)])
+            lines += format_metric('activo_http_request_duration_seconds',
+                                   'histogram', 'Latency of the requests',
+                                   samples)
+
+            query_items = sorted(self.queries.items())
+            lines += format_metric(
+                'activo_db_queries_total', 'counter',
+                'Number of sql queries run by the requests', [
+                    ('', (('method', method), ('endpoint', endpoint)), count)
+                    for (method, endpoint), (count, _) in query_items
+                ])
+            lines += format_metric(
+                'activo_db_query_duration_seconds_total', 'counter',
+                'Time spent running the sql queries of the requests', [
+                    ('', (('method', method), ('endpoint', endpoint)), total)
+                    for (method, endpoint), (_, total) in query_items
+                ])
+
+        for collector in list(self.collectors.values()):
+            lines += collector()
+
+        return '\n'.join(lines) + '\n'
+
+
+metrics = RequestMetrics()
+
+
+def cache_collector(name, cache):
+    """Returns a collector of the hit, miss and entry counts of a cache"""
+
+    def collect():
+        stats = cache.stats()
+        return (format_metric(f'activo_{name}_hits_total', 'counter',
+                              f'Number of {name} hits',
+                              [('', (), stats['hits'])]) +
+                format_metric(f'activo_{name}_misses_total', 'counter',
+                              f'Number of {name} misses',
+                              [('', (), stats['misses'])]) +
+                format_metric(f'activo_{name}_entries', 'gauge',
+                              f'Number of entries in the {name}',
+                              [('', (), stats['entries'])]))
+
+    return collect
+
+
+def pool_collector(get_engines):
+    """
+    Returns a collector of the usage of the connection pools of the engines
+    returned by get_engines, as (bind, engine) pairs, and of the time waited
+    for their connections
+    """
+
+    def collect():
+        usage = {'size': [], 'checked_out': [], 'overflow': []}
+        waits, timeouts = [], []
+
+        for bind, engine in get_engines():
+            pool = engine.pool
+            if not isinstance(pool, InstrumentedQueuePool):
+                continue
+
+            labels = (('bind', bind), )
+            usage['size'].append(('', labels, pool.size()))
+            usage['checked_out'].append(('', labels, pool.checkedout()))
+            usage['overflow'].append(('', labels, max(pool.overflow(), 0)))
+
+            buckets, total, count, timeout_count = \
+                pool.checkout_stats.snapshot()
+            for bound, bucket in zip(CHECKOUT_WAIT_BUCKETS, buckets):
+                waits.append(('_bucket', labels + (('le', bound), ), bucket))
+            waits.extend([('_bucket', labels + (('le', '+Inf'), ), count),
+                          ('_sum', labels, total), ('_count', labels, count)])
+            timeouts.append(('', labels, timeout_count))
+
+        return (format_metric('activo_db_pool_size', 'gauge',
+                              'Number of connections kept by the pool',
+                              usage['size']) +
+                format_metric('activo_db_pool_checked_out', 'gauge',
+                              'Number of connections in use',
+                              usage['checked_out']) +
+                format_metric('activo_db_pool_overflow', 'gauge',
+                              'Number of connections opened beyond the size',
+                              usage['overflow']) +
+                format_metric('activo_db_pool_checkout_wait_seconds',
+                              'histogram', 'Time waited for a connection',
+                              waits) +
+                format_metric('activo_db_pool_checkout_timeouts_total',
+                              'counter',
+                              'Number of checkouts which timed out', timeouts))
+
+    return collect
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context,
+                          executemany):
+    """Starts the timer of a sql query"""
+    conn.info['query_started'] = perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context,
+                         executemany):
+    """Adds a sql query and its duration to the current request"""
+    if is_instrumented():
+        started = conn.info['query_started']
+        g.request_timings['db'] += perf_counter() - started
+        g.query_count += 1
+
+
+def start_request_timer():
+    """Starts the instrumentation of a request"""
+    g.request_timings = defaultdict(float)
+    g.query_count = 0
+    g.request_started = perf_counter()
+
+
+def record_request(response):
+    """
+    Records the metrics of a request, adds its Server-Timing header and logs
+    it when it exceeds the latency or query count thresholds
+    """
+
+    if 'request_started' not in g:
+        return response
+
+    duration = perf_counter() - g.request_started
+    timings = g.request_timings
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    metrics.observe(request.method, endpoint, response.status_code, duration,
+                    g.query_count, timings['db'])
+
+    server_timing = [f'total;dur={duration * 1000:.1f}']
+    server_timing.append(f'db;dur={timings["db"] * 1000:.1f};'
+                         f'desc="{g.query_count} queries"')
+    server_timing.extend(f'{name};dur={seconds * 1000:.1f}'
+                         for name, seconds in sorted(timings.items())
+                         if name != 'db')
+    response.headers['Server-Timing'] = ', '.join(server_timing)
+
+    slow_request_ms = current_app.config['SLOW_REQUEST_MS']
+    query_limit = current_app.config['REQUEST_QUERY_LIMIT']
+    if (slow_request_ms and duration * 1000 > slow_request_ms) or (
+            query_limit and g.query_count > query_limit):
+        current_app.logger.warning(
+            'Slow request %s %s: %.1fms, %d queries in %.1fms',
+            request.method, request.full_path, duration * 1000,
+            g.query_count, timings['db'] * 1000)
+
+    return response
+
+
+def metrics_view():
+    """Returns the metrics of this process in the prometheus text format"""
+    return Response(metrics.render(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+
+def init_instrumentation(app):
+    """Instruments the requests and sql queries of an app"""
+
+    for name, listener in (('before_cursor_execute', before_cursor_execute),
+                           ('after_cursor_execute', after_cursor_execute)):
+        if not event.contains(Engine, name, listener):
+            event.listen(Engine, name, listener)
+
+    app.before_request(start_request_timer)
+    app.after_request(record_request)
+
+    metrics.register_collector('token_cache',
+                               cache_collector('token_cache', token_cache))
+    metrics.register_collector('count_cache',
+                               cache_collector('count_cache', count_cache))
+    metrics.register_collector('db_pool',
+                               pool_collector(lambda: db.get_engines(app)))
+
+    if app.config['METRICS_ENABLED']:
+        app.add_url_rule('/metrics', 'metrics', metrics_view)
@@ -0,0 +1,89 @@
+"""
+Module for the lazily registered plugins of the app.
+
+Optional subsystems with heavy dependencies, eg image storage, are
+registered on an app on the first request to a route that requires them
+rather than in create_app, so that workers which never serve those routes
+neither import nor initialize them.
+"""
+
+import os
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+
+from flask import current_app
+
+IMAGE_STORAGE = 'image_storage'
+
+
+class LazyPlugins:
+    """
+    The plugins which can be registered on an app, as functions of the app
+    registering the plugin and returning its handle.
+    """
+
+    def __init__(self):
+        """Constructor to initialize an instance of the class."""
+        self.lock = Lock()
+        self.loaders = OrderedDict()
+
+    def plugin(self, name):
+        """Decorator adding a plugin loader under name"""
+
+        def decorator(loader):
+            self.loaders[name] = loader
+            return loader
+
+        return decorator
+
+    def load(self, app, name):
+        """Returns the handle of a plugin, registering it on app if new"""
+
+        loaded = app.extensions['plugins']
+        if name not in loaded:
+            with self.lock:
+                if name not in loaded:
+                    loaded[name] = self.loaders[name](app)
+        return loaded[name]
+
+    def get(self, name):
+        """Returns the handle of a plugin of the current app"""
+        return self.load(current_app._get_current_object(), name)
+
+    def requires(self, *names):
+        """Decorator registering plugins before a view is called"""
+
+        def decorator(view):
+            @wraps(view)
+            def decorated(*args, **kwargs):
+                for name in names:
+                    self.get(name)
+                return view(*args, **kwargs)
+
+            return decorated
+
+        return decorator
+
+
+plugins = LazyPlugins()
+
+
+@plugins.plugin(IMAGE_STORAGE)
+def load_image_storage(app):
+    """Configures the cloudinary account storing the images"""
+
+    import cloudinary
+    import cloudinary.api
+
+    cloudinary.config(
+        cloud_name=os.environ.get('CLOUDINARY_CLOUD_NAME'),
+        api_key=os.environ.get('CLOUDINARY_API_KEY'),
+        api_secret=os.environ.get('CLOUDINARY_API_SECRET'))
+    return cloudinary
+
+
+def init_plugins(app):
+    """Prepares an app for lazily registered plugins"""
+
+    app.extensions['plugins'] = {}
@@ -3,12 +3,103 @@
 from os import getenv as env
 from functools import wraps
 from base64 import b64decode
+from hashlib import sha256
+from time import time
 
-from flask import request
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
+from flask import current_app, request
 import jwt
 
+from api.utilities.cache import ExpiringCache
 from api.utilities.constants import CHARSET
 from api.utilities.messages.error_messages import jwt_errors
+from api.utilities.timing import timed
+
+# Audience a token may be issued for, tokens without audience are accepted
+JWT_AUDIENCE = 'andela.com'
+
+# Decoded payloads of verified tokens, keyed by a hash of the token and kept
+# until the token expires, so that repeated requests skip the RSA verify
+token_cache = ExpiringCache(max_entries=4096, clock=time)
+
+
+def load_public_key():
+    """
+    Returns the public key verifying the tokens of the environment parsed
+    into a key object, or None when it is not set or invalid
+    """
+
+    try:
+        if env('FLASK_ENV') == 'testing':
+            public_key = env('JWT_PUBLIC_KEY_TEST')
+        elif env('FLASK_ENV') == 'production':
+            public_key = b64decode(env('JWT_PUBLIC_KEY')).decode(CHARSET)
+        else:
+            public_key = b64decode(
+                env('JWT_PUBLIC_KEY_STAGING')).decode(CHARSET)
+
+        return load_pem_public_key(
+            public_key.encode(CHARSET), backend=default_backend())
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def init_public_key(app):
+    """Parses the public key verifying tokens once for the app"""
+
+    app.extensions['jwt_public_key'] = load_public_key()
+
+
+def verify_token(token):
+    """
+    Verifies the signature, expiry and audience of a token in a single
+    decoding pass and returns its payload
+    """
+
+    from .base_validator import ValidationError
+
+    public_key = current_app.extensions.get('jwt_public_key')
+    if public_key is None:
+        raise ValidationError(
+            {'message': jwt_errors['SERVER_ERROR_MESSAGE']}, 500)
+
+    try:
+        decoded_token = jwt.decode(
+            token,
+            public_key,
+            algorithms=['RS256'],
+            options={
+                'verify_signature': True,
+                'verify_exp': True,
+                'verify_aud': False
+            }
+        )
+
+    except jwt.ExpiredSignatureError:
+        raise ValidationError({'message': jwt_errors['EXPIRED_TOKEN_MSG']}, 401)
+
+    except jwt.DecodeError as error:
+        if str(error) == 'Signature verification failed':
+            raise ValidationError(
+                    {'message': jwt_errors['SIGNATURE_ERROR']}, 500
+                )
+
+        else:
+            raise ValidationError(
+                    {'message': jwt_errors['INVALID_TOKEN_MSG']}, 401
+                )
+
+    except jwt.InvalidTokenError:
+        raise ValidationError({'message': jwt_errors['INVALID_TOKEN_MSG']}, 401)
+
+    audience = decoded_token.get('aud')
+    if isinstance(audience, str):
+        audience = [audience]
+    if audience is not None and JWT_AUDIENCE not in audience:
+        raise ValidationError({'message': jwt_errors['INVALID_TOKEN_MSG']}, 401)
+
+    return decoded_token
 
 
 def token_required(function):
@@ -25,61 +116,18 @@ def token_required(function):
         elif 'bearer' not in token.lower():
             raise ValidationError({'message': jwt_errors['NO_BEARER_MSG']}, 401)
 
-        try:
-            token = token.split(' ')[-1]
-            if env('FLASK_ENV') == 'testing':
-                public_key = env('JWT_PUBLIC_KEY_TEST')
-            elif env('FLASK_ENV') == 'production':
-                public_key64 = env('JWT_PUBLIC_KEY')
-                public_key = b64decode(public_key64).decode(CHARSET)
-            else:
-                public_key64 = env('JWT_PUBLIC_KEY_STAGING')
-                public_key = b64decode(public_key64).decode(CHARSET)
-
-            decoded_token = jwt.decode(
-                token,
-                public_key,
-                algorithms=['RS256'],
-                options={
-                    'verify_signature': True,
-                    'verify_exp': True
-                }
-            )
-        except ValueError as error:
-            raise ValidationError({
-                    'message': jwt_errors['SERVER_ERROR_MESSAGE']}, 500
-                )
-        
-        except jwt.exceptions.InvalidAudienceError:
-            decoded_token = jwt.decode(
-                token,
-                public_key,
-                algorithms=['RS256'],
-                audience='andela.com',
-                options={
-                    'verify_signature': True,
-                    'verify_exp': True
-                }
-            )
-
-        except TypeError:
-            raise ValidationError(
-                    {'message': jwt_errors['SERVER_ERROR_MESSAGE']}, 500
-                )
-
-        except jwt.ExpiredSignatureError:
-            raise ValidationError({'message': jwt_errors['EXPIRED_TOKEN_MSG']}, 401)
+        token = token.split(' ')[-1]
+        token_key = sha256(token.encode(CHARSET)).digest()
 
-        except jwt.DecodeError as error:
-            if str(error) == 'Signature verification failed':
-                raise ValidationError(
-                        {'message': jwt_errors['SIGNATURE_ERROR']}, 500
-                    )
+        with timed('jwt'):
+            decoded_token = token_cache.get(token_key)
 
-            else:
-                raise ValidationError(
-                        {'message': jwt_errors['INVALID_TOKEN_MSG']}, 401
-                    )
+            if decoded_token is None:
+                decoded_token = verify_token(token)
+                expires_at = decoded_token.get('exp')
+                token_cache.set(
+                    token_key, decoded_token,
+                    None if expires_at is None else expires_at - time())
 
         # setting the payload to the request object and can be accessed with \
         # request.decoded_token from the view
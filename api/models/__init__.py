@@ -1,22 +1,28 @@
 from sqlalchemy import event
 from .user import User
 from .asset import Asset
+from .asset_count import AssetCount
 from .asset_category import AssetCategory
 from .attribute import Attribute
 from .center import Center
-from .push_id import PushID
+from .export_job import ExportJob
+from .push_id import PushID, push_id_generator
 from .role import Role
+from .user_write import UserWrite
 
 
 def fancy_id_generator(mapper, connection, target):
-    """A function to generate unique identifiers on insert."""
-    push_id = PushID()
-    target.id = push_id.next_id()
+    """
+    A function to generate unique identifiers on insert, unless one was
+    already assigned, eg from a batch of PushID.next_ids.
+    """
+    if target.id is None:
+        target.id = push_id_generator.next_id()
 
 
 # associate the listener function with models, to execute during the
 # "before_insert" event
-tables = [Asset, AssetCategory, Attribute, Center, User, Role]
+tables = [Asset, AssetCategory, Attribute, Center, User, Role, ExportJob]
 
 for table in tables:
     event.listen(table, 'before_insert', fancy_id_generator)
@@ -1,4 +1,6 @@
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import DDL, event, false
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import deferred
 from .base.auditable_model import AuditableBaseModel
 from .database import db
 
@@ -9,10 +11,12 @@ class Asset(AuditableBaseModel):
     """
     tag = db.Column(db.String(60), nullable=False, unique=True)
     serial = db.Column(db.String(60), nullable=True)
-    custom_attributes = db.Column(JSON, nullable=True)
+    custom_attributes = db.Column(JSONB, nullable=True)
     asset_category_id = db.Column(
         db.String, db.ForeignKey('asset_categories.id'), nullable=False)
     center_id = db.Column(db.String, db.ForeignKey('centers.id'))
+    # Maintained by the ASSET_SEARCH_TRIGGERS, never loaded with the assets
+    search_vector = deferred(db.Column(TSVECTOR, nullable=True))
 
     def get_child_relationships(self):
         """
@@ -23,3 +27,78 @@ class Asset(AuditableBaseModel):
 
     def __repr__(self):
         return '<Asset {}>'.format(self.tag)
+
+
+# Keeps the search_vector of the assets current from row level triggers on
+# asset and asset_categories. The tag and serial weigh the most, then the
+# category name and the values of the custom attributes. The same
+# statements are run by the migration adding the column.
+ASSET_SEARCH_TRIGGERS = '''
+CREATE OR REPLACE FUNCTION asset_search_vector(
+    asset_tag varchar, asset_serial varchar, category_name varchar,
+    attributes jsonb)
+RETURNS tsvector AS $$
+    SELECT setweight(to_tsvector('simple', coalesce(asset_tag, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(asset_serial, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(category_name, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(
+            (SELECT string_agg(value, ' ')
+             FROM jsonb_each_text(CASE WHEN jsonb_typeof(attributes) = 'object'
+                                        THEN attributes END)), '')), 'C');
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION asset_search_trigger() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := asset_search_vector(
+        NEW.tag, NEW.serial,
+        (SELECT name FROM asset_categories
+         WHERE id = NEW.asset_category_id),
+        NEW.custom_attributes);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION asset_category_search_trigger()
+RETURNS trigger AS $$
+BEGIN
+    UPDATE asset SET search_vector = asset_search_vector(
+        tag, serial, NEW.name, custom_attributes)
+    WHERE asset_category_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS asset_search_rows ON asset;
+CREATE TRIGGER asset_search_rows
+    BEFORE INSERT OR UPDATE OF tag, serial, asset_category_id,
+        custom_attributes
+    ON asset FOR EACH ROW EXECUTE PROCEDURE asset_search_trigger();
+
+DROP TRIGGER IF EXISTS asset_category_search_rows ON asset_categories;
+CREATE TRIGGER asset_category_search_rows
+    AFTER UPDATE OF name ON asset_categories FOR EACH ROW
+    WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE PROCEDURE asset_category_search_trigger();
+'''
+
+# Indexes for the filters every asset list query applies, see DynamicFilter
+db.Index('ix_asset_asset_category_id_active', Asset.asset_category_id,
+         postgresql_where=Asset.deleted == false())
+db.Index('ix_asset_center_id_active', Asset.center_id,
+         postgresql_where=Asset.deleted == false())
+db.Index('ix_asset_created_at', Asset.created_at)
+db.Index('ix_asset_tag_pattern', Asset.tag,
+         postgresql_ops={'tag': 'varchar_pattern_ops'})
+db.Index('ix_asset_tag_trgm', Asset.tag, postgresql_using='gin',
+         postgresql_ops={'tag': 'gin_trgm_ops'})
+db.Index('ix_asset_serial_trgm', Asset.serial, postgresql_using='gin',
+         postgresql_ops={'serial': 'gin_trgm_ops'})
+db.Index('ix_asset_custom_attributes', Asset.custom_attributes,
+         postgresql_using='gin',
+         postgresql_ops={'custom_attributes': 'jsonb_path_ops'})
+db.Index('ix_asset_search_vector', Asset.search_vector,
+         postgresql_using='gin')
+
+# The triggers are created once every table exists, for databases built
+# with create_all
+event.listen(db.metadata, 'after_create', DDL(ASSET_SEARCH_TRIGGERS))
@@ -1,7 +1,7 @@
 from sqlalchemy.orm import column_property
-from sqlalchemy import select, func
+from sqlalchemy import select, func, false
 
-from . import Asset
+from .asset_count import AssetCount
 from .database import db
 from .base.auditable_model import AuditableBaseModel
 
@@ -18,7 +18,15 @@ class AssetCategory(AuditableBaseModel):
                              cascade='save-update, delete', lazy='dynamic')
     attributes = db.relationship('Attribute', backref='asset_category',
                                  cascade='save-update, delete', lazy='dynamic')
-    eager_loaded_attributes = db.relationship('Attribute', lazy='joined', viewonly=True)
+    # The non deleted attributes, never loaded unless a query asks for them
+    # with a loader option, see api/utilities/helpers/include_expansion.py
+    eager_loaded_attributes = db.relationship(
+        'Attribute',
+        primaryjoin='and_(AssetCategory.id == Attribute.asset_category_id, '
+        'Attribute.deleted.is_(False))',
+        order_by='Attribute.id',
+        lazy='noload',
+        viewonly=True)
 
     def get_child_relationships(self):
         return (self.assets,)
@@ -27,7 +35,15 @@ class AssetCategory(AuditableBaseModel):
         return '<AssetCategory {}>'.format(self.name)
 
 
+# Deferred as it is a correlated subquery run once per category, lists of
+# categories count their assets with a grouped aggregate instead, see
+# api/utilities/helpers/asset_category_stats.py
 AssetCategory.assets_count = column_property(
-    select([func.count(Asset.id)])
-    .where(Asset.asset_category_id == AssetCategory.id))
+    select([func.coalesce(func.sum(AssetCount.assets_count), 0)])
+    .where(AssetCount.asset_category_id == AssetCategory.id)
+    .where(AssetCount.deleted == false()),
+    deferred=True)
 
+
+db.Index('ix_asset_categories_name_trgm', AssetCategory.name,
+         postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
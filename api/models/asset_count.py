@@ -0,0 +1,108 @@
+"""Module for asset count rollup model"""
+
+from sqlalchemy import DDL, event, func, text
+
+from .database import db
+
+# Keeps asset_counts current, one row per category, center and deleted
+# state, from row level triggers on asset. The same statements are run by
+# the migration creating the table.
+# An asset write holds the lock of its count row until commit, so the
+# concurrent writes of assets of a category and center, bulk import chunks
+# included, serialize on it. Append delta rows compacted periodically
+# instead if they contend.
+ASSET_COUNTS_TRIGGERS = '''
+CREATE OR REPLACE FUNCTION asset_counts_add(
+    category_id varchar, center varchar, is_deleted boolean, delta integer)
+RETURNS void AS $$
+BEGIN
+    INSERT INTO asset_counts AS counts
+        (asset_category_id, center_id, deleted, assets_count)
+    VALUES (category_id, center, coalesce(is_deleted, false), delta)
+    ON CONFLICT ((coalesce(asset_category_id, '')),
+                 (coalesce(center_id, '')), deleted)
+    DO UPDATE SET assets_count = counts.assets_count + delta;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION asset_counts_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM asset_counts;
+        RETURN NULL;
+    END IF;
+    IF TG_OP = 'UPDATE'
+        AND OLD.asset_category_id IS NOT DISTINCT FROM NEW.asset_category_id
+        AND OLD.center_id IS NOT DISTINCT FROM NEW.center_id
+        AND coalesce(OLD.deleted, false) = coalesce(NEW.deleted, false) THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM asset_counts_add(
+            OLD.asset_category_id, OLD.center_id, OLD.deleted, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM asset_counts_add(
+            NEW.asset_category_id, NEW.center_id, NEW.deleted, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS asset_counts_rows ON asset;
+CREATE TRIGGER asset_counts_rows
+    AFTER INSERT OR DELETE OR UPDATE OF asset_category_id, center_id, deleted
+    ON asset FOR EACH ROW EXECUTE PROCEDURE asset_counts_trigger();
+
+DROP TRIGGER IF EXISTS asset_counts_truncate ON asset;
+CREATE TRIGGER asset_counts_truncate AFTER TRUNCATE ON asset
+    FOR EACH STATEMENT EXECUTE PROCEDURE asset_counts_trigger();
+'''
+
+
+class AssetCount(db.Model):
+    """
+    Model for the rollup of the number of assets per asset category, center
+    and deleted state, maintained by triggers on the asset table
+    """
+
+    __tablename__ = 'asset_counts'
+
+    id = db.Column(db.Integer, primary_key=True)
+    asset_category_id = db.Column(db.String(36), nullable=True)
+    center_id = db.Column(db.String(36), nullable=True)
+    deleted = db.Column(db.Boolean, nullable=False)
+    assets_count = db.Column(db.Integer, nullable=False)
+
+    @classmethod
+    def rebuild(cls):
+        """
+        Recounts the rollup from the asset table. Writes to asset are
+        blocked until the transaction is committed.
+        """
+
+        db.session.execute('LOCK TABLE asset IN SHARE MODE')
+        db.session.execute(cls.__table__.delete())
+        db.session.execute('''
+            INSERT INTO asset_counts
+                (asset_category_id, center_id, deleted, assets_count)
+            SELECT asset_category_id, center_id, coalesce(deleted, false),
+                   count(*)
+            FROM asset
+            GROUP BY asset_category_id, center_id, coalesce(deleted, false)
+            ''')
+        db.session.commit()
+
+    def __repr__(self):
+        return f'<AssetCount {self.asset_category_id} {self.center_id}>'
+
+
+db.Index('ix_asset_counts_key',
+         func.coalesce(AssetCount.asset_category_id, text("''")),
+         func.coalesce(AssetCount.center_id, text("''")),
+         AssetCount.deleted,
+         unique=True)
+
+# The triggers are created once every table exists, for databases built
+# with create_all
+event.listen(db.metadata, 'after_create', DDL(ASSET_COUNTS_TRIGGERS))
@@ -1,3 +1,5 @@
+from sqlalchemy import false
+
 from .base.base_model import BaseModel
 from .database import db
 
@@ -25,3 +27,7 @@ class Attribute(BaseModel):
 
     def __repr__(self):
         return '<Attribute {}>'.format(self.label)
+
+
+db.Index('ix_attribute_asset_category_id_active', Attribute.asset_category_id,
+         postgresql_where=Attribute.deleted == false())
@@ -0,0 +1,101 @@
+"""
+Module for the connection pools of the database engines.
+
+The pools of the postgres engines are configured by the DATABASE_POOL_*
+settings of the config, see pool_options, and record the time waited for
+their connections, exported with their usage on /metrics.
+"""
+
+from threading import Lock, local
+from time import perf_counter
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+# Upper bounds in seconds of the checkout wait histogram buckets
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1,
+                         2.5, 5, 10, 30)
+
+
+class CheckoutStats:
+    """The time waited for the connections of a pool and its timeouts"""
+
+    def __init__(self):
+        """Constructor to initialize an instance of the class."""
+        self.lock = Lock()
+        self.buckets = [0] * len(CHECKOUT_WAIT_BUCKETS)
+        self.total = 0.0
+        self.count = 0
+        self.timeouts = 0
+
+    def observe(self, wait, timed_out):
+        """Records a checkout, which waited wait seconds"""
+        with self.lock:
+            for index, bound in enumerate(CHECKOUT_WAIT_BUCKETS):
+                if wait <= bound:
+                    self.buckets[index] += 1
+            self.total += wait
+            self.count += 1
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self):
+        """Returns the buckets, total wait, checkout and timeout counts"""
+        with self.lock:
+            return list(self.buckets), self.total, self.count, self.timeouts
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool recording the time its checkouts wait for a connection, the
+    time to open a new one included, see CheckoutStats.
+
+    QueuePool._do_get calls itself again on its retry paths, so only the
+    outermost call of a thread records the checkout.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Constructor to initialize an instance of the class."""
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = CheckoutStats()
+        self.checkout_state = local()
+
+    def _do_get(self):
+        """Returns a connection of the pool, timing the wait for it"""
+
+        if getattr(self.checkout_state, 'timing', False):
+            return super()._do_get()
+
+        self.checkout_state.timing = True
+        started, timed_out = perf_counter(), False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.checkout_state.timing = False
+            self.checkout_stats.observe(perf_counter() - started, timed_out)
+
+
+def pool_options(config):
+    """
+    Returns the create_engine options of the pool of a postgres engine
+
+    Behind pgbouncer the connections are pooled by pgbouncer, so they are
+    opened per checkout and closed on checkin. psycopg2 never prepares
+    statements on the server, which a transaction pooling pgbouncer would
+    run on other server connections.
+    """
+
+    if config['DATABASE_PGBOUNCER']:
+        return {'poolclass': NullPool}
+
+    return {
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': config['DATABASE_POOL_SIZE'],
+        'max_overflow': config['DATABASE_MAX_OVERFLOW'],
+        'pool_timeout': config['DATABASE_POOL_TIMEOUT'],
+        'pool_recycle': config['DATABASE_POOL_RECYCLE'],
+        'pool_pre_ping': config['DATABASE_POOL_PRE_PING'],
+    }
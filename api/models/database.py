@@ -1,6 +1,37 @@
 """Database setup module."""
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import DDL, event, orm
+
+from .connection_pool import pool_options
+from .routing_session import RoutingSession
+
+
+class RoutingSQLAlchemy(SQLAlchemy):
+    """
+    SQLAlchemy whose sessions route the reads to the read replicas and whose
+    postgres engines pool their connections as configured
+    """
+
+    def create_session(self, options):
+        """Returns the factory of the RoutingSession sessions"""
+        return orm.sessionmaker(class_=RoutingSession, db=self, **options)
+
+    def apply_driver_hacks(self, app, info, options):
+        """Adds the pool options of the config to those of postgres urls"""
+        super().apply_driver_hacks(app, info, options)
+        if info.drivername.startswith('postgresql'):
+            options.update(pool_options(app.config))
+
+    def get_engines(self, app):
+        """Returns the engines of the primary and of the read replicas"""
+        return [(bind or 'primary', self.get_engine(app, bind=bind))
+                for bind in [None] + list(app.config['READ_REPLICA_BINDS'])]
 
 
 # Initialize database object
-db = SQLAlchemy()
+db = RoutingSQLAlchemy()
+
+# The trigram indexes of the like filter need the pg_trgm extension, it is
+# created by the migrations and here for databases built with create_all
+event.listen(db.metadata, 'before_create',
+             DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
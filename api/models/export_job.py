@@ -0,0 +1,40 @@
+"""Module for export job model"""
+
+from sqlalchemy.dialects.postgresql import JSONB
+
+from .base.auditable_model import AuditableBaseModel
+from .database import db
+from ..utilities.enums import ExportStatusEnum
+
+
+class ExportJob(AuditableBaseModel):
+    """
+    Model for export jobs, ie csv files generated in the background and
+    downloaded once done
+    """
+
+    __tablename__ = 'export_jobs'
+
+    export_type = db.Column(db.String(60), nullable=False)
+    params = db.Column(JSONB, nullable=False, default=dict)
+    status = db.Column(
+        db.String(20),
+        nullable=False,
+        default=ExportStatusEnum.PENDING.value)
+    processed_rows = db.Column(db.Integer, nullable=False, default=0)
+    total_rows = db.Column(db.Integer, nullable=True)
+    file_name = db.Column(db.String, nullable=False)
+    file_path = db.Column(db.String, nullable=True)
+    error = db.Column(db.String, nullable=True)
+
+    def get_child_relationships(self):
+        """
+        Method to get all child relationships of this model
+
+        Returns:
+             None: an export job has no children
+        """
+        return None
+
+    def __repr__(self):
+        return f'<ExportJob {self.export_type} {self.status}>'
@@ -3,9 +3,14 @@
 import re
 
 from flask import request
+from sqlalchemy.exc import IntegrityError
 
 from .database import db
+from .push_id import push_id_generator
 from api.utilities.dynamic_filter import DynamicFilter
+from api.utilities.record_count import count_cache
+from api.utilities.rows_query import RowsQuery
+from api.utilities.timing import timed
 from ..utilities.validators.delete_validator import delete_validator
 from ..middlewares.base_validator import ValidationError
 from ..utilities.messages.error_messages import database_errors
@@ -19,8 +24,37 @@ class ModelOperations(object):
         """
         db.session.add(self)
         db.session.commit()
+        count_cache.invalidate(self.__tablename__)
         return self
 
+    @classmethod
+    def bulk_save(cls, instances, chunk_size):
+        """
+        Save model instances in chunks, committing once per chunk.
+        A chunk which fails on an integrity error is rolled back and the
+        remaining chunks are still saved.
+        The ids of a chunk are generated in a single batch.
+        :param instances: the model instances to save
+        :param chunk_size: the number of instances committed together
+        :return: the instances of the chunks that failed
+        """
+        failed_instances = []
+
+        for start in range(0, len(instances), chunk_size):
+            chunk = instances[start:start + chunk_size]
+            for instance, push_id in zip(
+                    chunk, push_id_generator.next_ids(len(chunk))):
+                instance.id = push_id
+            db.session.add_all(chunk)
+            try:
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
+                failed_instances.extend(chunk)
+
+        count_cache.invalidate(cls.__tablename__)
+        return failed_instances
+
     def _update(self, **kwargs):
         """
         update entries
@@ -28,6 +62,7 @@ class ModelOperations(object):
         for field, value in kwargs.items():
             setattr(self, field, value)
         db.session.commit()
+        count_cache.invalidate(self.__tablename__)
 
     @classmethod
     def get(cls, id):
@@ -37,12 +72,12 @@ class ModelOperations(object):
         return cls.query.filter_by(id=id, deleted=False).first()
 
     @classmethod
-    def get_or_404(cls, id):
+    def get_or_404(cls, id, query=None):
         """
-        return entries by id
+        return entries by id, from query if given, eg with loader options
         """
 
-        record = cls.query.get(id)
+        record = (cls.query if query is None else query).get(id)
 
         if not record or record.deleted:
             raise ValidationError({
@@ -74,6 +109,7 @@ class ModelOperations(object):
                 self.deleted_by = request.decoded_token['UserInfo']['name']
             db.session.add(self)
             db.session.commit()
+            count_cache.invalidate(self.__tablename__)
         else:
             relationship_names = []
             for relationship in relationships:
@@ -96,10 +132,27 @@ class ModelOperations(object):
         """
         
         if filter_condition:
-            dynamic_filter = DynamicFilter(cls)
-            return dynamic_filter.filter_query(filter_condition)
+            with timed('filter'):
+                dynamic_filter = DynamicFilter(cls)
+                return dynamic_filter.filter_query(filter_condition)
         return cls.query.filter_by(deleted=False)
 
+    @classmethod
+    def _query_rows(cls, filter_condition=None, columns=None, **filters):
+        """
+        Returns the rows of the non deleted entries matching the
+        filter_condition, as _query, and the filters, eg
+        Asset._query_rows(columns=['tag'], asset_category_id=id).
+        The rows are read with Core selects into lightweight tuples rather
+        than model instances, for read only views.
+        :param filter_condition: the where query strings
+        :param columns: the names of the columns read, all by default
+        :param filters: the values of the columns of the entries
+        :return: a RowsQuery of the rows
+        """
+
+        return RowsQuery(cls, filter_condition, columns, filters)
+
 
     @classmethod
     def count(cls):
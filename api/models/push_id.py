@@ -1,6 +1,12 @@
-from random import random
+from os import getpid
+from random import getrandbits
+from threading import Lock
 from time import time
-import numpy
+
+# Modeled after base64 web-safe chars, but ordered by ASCII.
+PUSH_CHARS = ('-0123456789'
+              'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+              '_abcdefghijklmnopqrstuvwxyz')
 
 
 class PushID(object):
@@ -16,59 +22,74 @@ class PushID(object):
        in the same timestamp, the latter ones will sort after the former ones.
        We do this by using the previous random bits but "incrementing" them by
        1 (only in the case of a timestamp collision).
+
+    An id is handled as a single 120-bit integer, the 48-bit millisecond
+    timestamp followed by the 72 random bits, so incrementing it carries
+    over into the timestamp, and it is encoded 12 bits, ie 2 characters, at
+    a time.
+    An instance is thread safe, use the process wide push_id_generator
+    rather than a new instance per id to keep ids monotonic.
     '''
 
-    # Modeled after base64 web-safe chars, but ordered by ASCII.
-    PUSH_CHARS = ('-0123456789'
-                  'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-                  '_abcdefghijklmnopqrstuvwxyz')
+    PUSH_CHARS = PUSH_CHARS
+
+    # Every pair of characters, indexed by the 12 bits they encode
+    PUSH_CHAR_PAIRS = tuple(first + second for first in PUSH_CHARS
+                            for second in PUSH_CHARS)
+
+    # Shifts of the 12-bit chunks of an id, most significant first
+    CHUNK_SHIFTS = tuple(range(108, -1, -12))
+
+    RANDOM_BITS = 72
+    TIMESTAMP_BITS = 48
 
     def __init__(self):
+        self.lock = Lock()
+        self.reset()
 
-        # Timestamp of last push, used to prevent local collisions if you
-        # pushtwice in one ms.
-        self.last_push_time = 0
+    def reset(self):
+        # The last generated id as an integer, the timestamp of the last
+        # push is its high bits. It is used to prevent local collisions if
+        # you push twice in one ms.
+        self.last_id = 0
 
-        # We generate 72-bits of randomness which get turned into 12
-        # characters and appended to the timestamp to prevent
-        # collisions with other clients.  We store the last characters
-        # we generated because in the event of a collision, we'll use
-        # those same characters except "incremented" by one.
-        self.last_rand_chars = numpy.empty(12, dtype=int)
+        # A process forked after generating ids starts over so that it does
+        # not increment the same random bits as its parent.
+        self.pid = getpid()
 
-    def next_id(self):
-        now = int(time() * 1000)
-        duplicate_time = (now == self.last_push_time)
-        self.last_push_time = now
-        time_stamp_chars = numpy.empty(8, dtype=str)
+    def encode(self, push_id):
+        '''Returns the 20 characters of an id given as an integer'''
+        pairs = self.PUSH_CHAR_PAIRS
+        return ''.join([pairs[(push_id >> shift) & 0xFFF]
+                        for shift in self.CHUNK_SHIFTS])
 
-        for i in range(7, -1, -1):
-            time_stamp_chars[i] = self.PUSH_CHARS[now % 64]
-            now = int(now / 64)
+    def next_ids(self, count):
+        '''Returns count monotonically increasing ids, eg for bulk inserts'''
+        now = int(time() * 1000)
 
-        if now != 0:
+        if now >> self.TIMESTAMP_BITS:
             raise ValueError('We should have converted the entire timestamp.')
 
-        unique_id = ''.join(time_stamp_chars)
-
-        if not duplicate_time:
-            for i in range(12):
-                # random() returns a floating point number in the
-                # range(0.0, 1.0)
-                self.last_rand_chars[i] = int(random() * 64)
-        else:
-            # If the timestamp hasn't changed since last push, use the
-            # same random number, except incremented by 1.
-            for i in range(11, -1, -1):
-                if self.last_rand_chars[i] == 63:
-                    self.last_rand_chars[i] = 0
-                else:
-                    break
-            self.last_rand_chars[i] += 1
-
-        for i in range(12):
-            unique_id += self.PUSH_CHARS[self.last_rand_chars[i]]
-
-        if len(unique_id) != 20:
-            raise ValueError('Length should be 20.')
-        return unique_id
\ No newline at end of file
+        with self.lock:
+            if self.pid != getpid():
+                self.reset()
+
+            if now > self.last_id >> self.RANDOM_BITS:
+                first_id = (now << self.RANDOM_BITS) | getrandbits(
+                    self.RANDOM_BITS)
+            else:
+                # If the timestamp hasn't changed since last push, or the
+                # clock went back, use the same random number, except
+                # incremented by 1.
+                first_id = self.last_id + 1
+            self.last_id = first_id + count - 1
+
+        return [self.encode(push_id)
+                for push_id in range(first_id, first_id + count)]
+
+    def next_id(self):
+        return self.next_ids(1)[0]
+
+
+# Process wide generator of the ids of the models
+push_id_generator = PushID()
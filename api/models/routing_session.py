@@ -0,0 +1,130 @@
+"""
+Module for the session routing the reads of the GET requests to the read
+replicas of the database.
+
+The replicas are the binds of READ_REPLICA_BINDS. The reads of a GET request
+are served by one of them, picked in turn, and every read outside of a GET
+request, as well as every flush, by the primary database. A user who writes
+reads from the primary for READ_YOUR_WRITES_SECONDS, as the replicas may not
+have replayed the write yet.
+
+The time of the last write of each user, as per the id of its token, is kept
+in the user_writes table of the primary, so that the window holds whichever
+api worker and client serve the next requests of the user. It costs the GET
+requests of the authenticated users a primary key lookup on the primary.
+"""
+
+from datetime import timedelta
+from itertools import count
+
+from flask import has_request_context, request
+from flask_sqlalchemy import SignallingSession, get_state
+from sqlalchemy import and_, event, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+READ_METHODS = ('GET', 'HEAD')
+
+# Counter of the requests served by a replica, picking them in turn
+replica_turns = count()
+
+
+def request_user_id():
+    """Returns the id of the user of the token of the current request"""
+
+    decoded_token = getattr(request, 'decoded_token', None) or {}
+    return decoded_token.get('UserInfo', {}).get('id')
+
+
+def in_read_your_writes_window(app, user_id):
+    """Returns True if the user wrote within READ_YOUR_WRITES_SECONDS"""
+
+    # imported here as the models import the db of this module's importer
+    from .user_write import UserWrite
+
+    window = app.config['READ_YOUR_WRITES_SECONDS']
+    if user_id is None or not window:
+        return False
+
+    user_writes = UserWrite.__table__
+    query = select([user_writes.c.user_id]).where(
+        and_(user_writes.c.user_id == user_id,
+             user_writes.c.written_at > func.now() - timedelta(
+                 seconds=window)))
+    return get_state(app).db.get_engine(app).execute(
+        query).first() is not None
+
+
+def read_replica_bind(app):
+    """
+    Returns the bind key of the replica serving the reads of the current
+    request, or None if they are served by the primary.
+
+    The replica is picked on the first read of a request, which sticks to it.
+    """
+
+    if not has_request_context() or request.method not in READ_METHODS:
+        return None
+
+    # The bind is set on the request, as its decoded_token
+    if not hasattr(request, 'read_replica_bind'):
+        replica_binds = app.config['READ_REPLICA_BINDS']
+        replica_bind = None
+        if replica_binds and not in_read_your_writes_window(
+                app, request_user_id()):
+            replica_bind = replica_binds[next(replica_turns) %
+                                         len(replica_binds)]
+        setattr(request, 'read_replica_bind', replica_bind)
+
+    return request.read_replica_bind
+
+
+def record_write(session, flush_context):  #pylint: disable=W0613
+    """
+    Serves the reads following a flush from the primary, for the rest of its
+    request and, with replicas, for the read your writes window of its user.
+
+    The last write of the user is saved in the transaction of the flush, so
+    the concurrent writes of a user wait on its user_writes row.
+    """
+
+    if not has_request_context():
+        return
+
+    setattr(request, 'read_replica_bind', None)
+
+    user_id = request_user_id()
+    if user_id is None or not session.app.config['READ_REPLICA_BINDS']:
+        return
+
+    from .user_write import UserWrite
+
+    statement = insert(UserWrite.__table__).values(
+        user_id=user_id, written_at=func.clock_timestamp())
+    session.execute(
+        statement.on_conflict_do_update(
+            index_elements=['user_id'],
+            set_={'written_at': statement.excluded.written_at}))
+
+
+class RoutingSession(SignallingSession):
+    """
+    Session reading from the read replicas in GET requests, see
+    read_replica_bind, and from the primary database otherwise.
+
+    Its flushes, as from ModelOperations.save, _update or delete, always
+    write to the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None):
+        """Returns the engine of the replica or of the primary"""
+
+        if not self._flushing:
+            replica_bind = read_replica_bind(self.app)
+            if replica_bind is not None:
+                return get_state(self.app).db.get_engine(
+                    self.app, bind=replica_bind)
+
+        return super().get_bind(mapper, clause)
+
+
+event.listen(RoutingSession, 'after_flush', record_write)
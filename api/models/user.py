@@ -1,5 +1,7 @@
 """Module for User model."""
 
+from sqlalchemy import false
+
 from .database import db
 from .base.base_model import BaseModel
 
@@ -24,3 +26,9 @@ class User(BaseModel):
 
     def __repr__(self):
         return f'<User {self.name}>'
+
+
+db.Index('ix_users_center_id_active', User.center_id,
+         postgresql_where=User.deleted == false())
+db.Index('ix_users_role_id_active', User.role_id,
+         postgresql_where=User.deleted == false())
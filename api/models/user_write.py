@@ -0,0 +1,19 @@
+"""Module for the last write of the users model"""
+
+from .database import db
+
+
+class UserWrite(db.Model):
+    """
+    Model for the time of the last write of each user, on the primary
+    database, from which the read your writes window of a user is decided,
+    see api/models/routing_session.py
+    """
+
+    __tablename__ = 'user_writes'
+
+    user_id = db.Column(db.String(36), primary_key=True)
+    written_at = db.Column(db.DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f'<UserWrite {self.user_id} {self.written_at}>'
@@ -0,0 +1,234 @@
+"""
+Module for export jobs, ie csv files written to the local disk by a pool of
+worker processes so that big exports do not hold the api workers.
+"""
+
+import os
+from datetime import datetime, timedelta
+from multiprocessing import get_context
+from threading import Lock
+from time import time
+
+from flask import current_app
+from sqlalchemy import and_, func
+from werkzeug.datastructures import ImmutableMultiDict
+
+from ..models.asset_category import AssetCategory
+from ..models.database import db
+from ..models.export_job import ExportJob
+from ..utilities.constants import CHARSET
+from ..utilities.enums import ExportStatusEnum
+from ..utilities.helpers.asset_category_stats import asset_counts_query
+from ..utilities.helpers.asset_export import (
+    EXPORT_BATCH_SIZE, get_asset_column_names, get_asset_records,
+    get_asset_rows)
+from ..utilities.helpers.csv_export import generate_csv
+from ..utilities.messages.error_messages import serialization_errors
+
+ASSETS = 'assets'
+ASSET_CATEGORIES = 'asset-categories'
+
+# Number of exported rows between two progress updates of a job
+PROGRESS_INTERVAL = 1000
+
+_pool = None
+_pool_lock = Lock()
+
+
+def export_assets(params):
+    """
+    Returns the row count, header and records of the assets export of an
+    asset category
+    """
+
+    asset_category = AssetCategory.get_or_404(params['assetCategoryId'])
+    asset_rows = get_asset_rows(asset_category.id)
+
+    return (asset_rows.count(), get_asset_column_names(asset_rows),
+            get_asset_records(asset_rows))
+
+
+def get_asset_categories_query(params):
+    """Returns the asset categories matched by the where filters of a job"""
+
+    return AssetCategory._query(
+        ImmutableMultiDict([('where', where)
+                            for where in params.get('where', [])]))
+
+
+def export_asset_categories(params):
+    """
+    Returns the row count, header and records of the asset categories export
+    """
+
+    query = get_asset_categories_query(params)
+    rows = asset_counts_query(query).yield_per(EXPORT_BATCH_SIZE)
+    records = ({
+        'name': row.name,
+        'assets_count': row.assets_count
+    } for row in rows)
+
+    return query.count(), ['name', 'assets_count'], records
+
+
+EXPORT_SOURCES = {
+    ASSETS: export_assets,
+    ASSET_CATEGORIES: export_asset_categories,
+}
+
+
+def update_job(job_id, **values):
+    """
+    Updates an export job on a connection of its own, so that its progress
+    is visible while the transaction reading the exported rows is open
+    """
+
+    db.engine.execute(ExportJob.__table__.update().where(
+        ExportJob.id == job_id).values(updated_at=datetime.utcnow(), **values))
+
+
+def track_progress(job_id, records):
+    """Generator of records saving the number of rows exported so far"""
+
+    processed_rows = 0
+    for processed_rows, record in enumerate(records, 1):
+        yield record
+        if processed_rows % PROGRESS_INTERVAL == 0:
+            update_job(job_id, processed_rows=processed_rows)
+
+    update_job(job_id, processed_rows=processed_rows)
+
+
+def run_export_job(job_id):
+    """
+    Writes the csv file of an export job to the export directory.
+    The file is written under a temporary name and renamed once complete,
+    so a download never serves a partial file.
+    """
+
+    job = ExportJob.query.get(job_id)
+    export_dir = current_app.config['EXPORT_DIR']
+    file_path = os.path.join(export_dir, f'{job.id}.csv')
+    partial_file_path = f'{file_path}.part'
+
+    update_job(job_id, status=ExportStatusEnum.RUNNING.value)
+    try:
+        total_rows, column_names, records = EXPORT_SOURCES[job.export_type](
+            job.params)
+        update_job(job_id, total_rows=total_rows)
+
+        os.makedirs(export_dir, exist_ok=True)
+        with open(partial_file_path, 'w', encoding=CHARSET,
+                  newline='') as csv_file:
+            for chunk in generate_csv(column_names,
+                                      track_progress(job_id, records)):
+                csv_file.write(chunk)
+        os.replace(partial_file_path, file_path)
+    except Exception as error:  #pylint: disable=W0703
+        current_app.logger.exception('Export job %s failed', job_id)
+        db.session.rollback()
+        if os.path.exists(partial_file_path):
+            os.remove(partial_file_path)
+        update_job(
+            job_id, status=ExportStatusEnum.FAILED.value, error=str(error))
+    else:
+        db.session.rollback()
+        update_job(
+            job_id, status=ExportStatusEnum.DONE.value, file_path=file_path)
+
+
+def remove_expired_export_files(export_dir, retention_hours):
+    """
+    Removes the files of the export directory last written more than
+    retention_hours ago, and returns their number. A job whose file was
+    removed answers its download with a 404.
+    """
+
+    if not os.path.isdir(export_dir):
+        return 0
+
+    expired_before = time() - retention_hours * 3600
+    removed = 0
+    for entry in os.scandir(export_dir):
+        try:
+            if entry.is_file() and entry.stat().st_mtime < expired_before:
+                os.remove(entry.path)
+                removed += 1
+        except FileNotFoundError:
+            # removed meanwhile by another api worker
+            continue
+
+    return removed
+
+
+def fail_stale_export_jobs(stale_minutes):
+    """
+    Marks failed the pending and running export jobs which made no progress
+    for stale_minutes, eg as the api process or the worker running them
+    stopped, and returns their number
+    """
+
+    now = datetime.utcnow()
+    result = db.engine.execute(ExportJob.__table__.update().where(
+        and_(
+            ExportJob.status.in_([
+                ExportStatusEnum.PENDING.value, ExportStatusEnum.RUNNING.value
+            ]),
+            func.coalesce(ExportJob.updated_at, ExportJob.created_at) <
+            now - timedelta(minutes=stale_minutes))).values(
+                status=ExportStatusEnum.FAILED.value,
+                error=serialization_errors['export_stale'],
+                updated_at=now))
+
+    return result.rowcount
+
+
+def init_worker():
+    """
+    Initializes a worker process of the pool with its own app, and hence its
+    own database engine, and keeps its app context pushed
+    """
+
+    from main import create_app
+    from config import config
+
+    app = create_app(config[os.getenv('FLASK_ENV', default='production')])
+    app.app_context().push()
+
+
+def run_export_job_in_worker(job_id):
+    """Runs an export job in a worker process of the pool"""
+
+    try:
+        run_export_job(job_id)
+    finally:
+        db.session.remove()
+
+
+def get_pool(workers):
+    """
+    Returns the pool of export workers of this process, starting it on first
+    use. The workers are spawned rather than forked so that they do not
+    share the database connections of the api process.
+    """
+
+    global _pool  #pylint: disable=W0603
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = get_context('spawn').Pool(workers, initializer=init_worker)
+        return _pool
+
+
+def submit_export_job(job):
+    """
+    Enqueues a saved export job to the pool of export workers, or runs it
+    right away when EXPORT_WORKERS is 0
+    """
+
+    workers = current_app.config['EXPORT_WORKERS']
+
+    if workers:
+        get_pool(workers).apply_async(run_export_job_in_worker, (job.id, ))
+    else:
+        run_export_job(job.id)
@@ -0,0 +1,136 @@
+"""Module for the cached attribute specs of the asset categories"""
+
+from collections import namedtuple
+
+from flask import current_app
+
+from ..models import Attribute
+from .cache import ExpiringCache
+from .validators.attribute_value_validator import compile_value_validator
+
+# The attributes of an asset category as validated on asset writes.
+# keys and required_keys are frozensets of attribute keys, input_controls
+# maps every key to its input control, choices maps the keys of the
+# attributes with choices to a frozenset of them and value_validators maps
+# every key to the function validating its values.
+AttributeSpec = namedtuple('AttributeSpec', [
+    'keys', 'required_keys', 'input_controls', 'choices', 'value_validators'
+])
+
+
+class AttributeSpecCache(ExpiringCache):
+    """
+    A per process cache of the attribute specs keyed by asset category id.
+
+    Entries expire after the configured ttl and are dropped as soon as the
+    attributes of their category are created or updated through the asset
+    category endpoints.
+    """
+
+    def invalidate(self, asset_category_id):
+        """Drops the cached spec of an asset category"""
+        with self.lock:
+            self.entries.pop(asset_category_id, None)
+
+
+attribute_spec_cache = AttributeSpecCache()
+
+# The lower cased input controls of the attributes of a key across asset
+# categories, keyed by the attribute key, as filtered by the dynamic filter
+input_control_cache = ExpiringCache()
+
+
+def invalidate_attribute_specs(asset_category_id):
+    """
+    Drops the cached spec of an asset category and the cached input
+    controls, which its attributes may change
+    """
+
+    attribute_spec_cache.invalidate(asset_category_id)
+    input_control_cache.clear()
+
+
+def build_attribute_spec(attributes):
+    """Returns the AttributeSpec of the non deleted attributes given"""
+
+    keys, required_keys, input_controls, choices = set(), set(), {}, {}
+
+    for attribute in attributes:
+        key = attribute._key  #pylint: disable=W0212
+        keys.add(key)
+        if attribute.is_required:
+            required_keys.add(key)
+        input_controls[key] = attribute.input_control.lower()
+        if attribute.choices:
+            choices[key] = frozenset(
+                choice.lower() for choice in attribute.choices.split(',')
+                if choice)
+
+    value_validators = {
+        key: compile_value_validator(input_control, choices.get(key))
+        for key, input_control in input_controls.items()
+    }
+
+    return AttributeSpec(
+        frozenset(keys), frozenset(required_keys), input_controls, choices,
+        value_validators)
+
+
+def get_attribute_specs(asset_category_ids):
+    """
+    Returns the AttributeSpecs of asset categories keyed by their id, the
+    ones missing from the cache are loaded with a single query
+    """
+
+    specs, missing_ids = {}, []
+    for asset_category_id in asset_category_ids:
+        spec = attribute_spec_cache.get(asset_category_id)
+        if spec is None:
+            missing_ids.append(asset_category_id)
+        else:
+            specs[asset_category_id] = spec
+
+    if missing_ids:
+        category_attributes = {
+            asset_category_id: []
+            for asset_category_id in missing_ids
+        }
+        for attribute in Attribute.query.filter(
+                Attribute.asset_category_id.in_(missing_ids),
+                Attribute.deleted.is_(False)):
+            category_attributes[attribute.asset_category_id].append(attribute)
+
+        ttl = current_app.config['ATTRIBUTE_SPEC_CACHE_TTL']
+        for asset_category_id, attributes in category_attributes.items():
+            spec = build_attribute_spec(attributes)
+            attribute_spec_cache.set(asset_category_id, spec, ttl)
+            specs[asset_category_id] = spec
+
+    return specs
+
+
+def get_attribute_spec(asset_category_id):
+    """Returns the AttributeSpec of an asset category"""
+
+    return get_attribute_specs([asset_category_id])[asset_category_id]
+
+
+def get_input_controls(key):
+    """
+    Returns the frozenset of the input controls of the non deleted
+    attributes of a key, across asset categories
+    """
+
+    input_controls = input_control_cache.get(key)
+    if input_controls is None:
+        input_controls = frozenset(
+            input_control.lower()
+            for input_control, in Attribute.query.with_entities(
+                Attribute.input_control).filter(
+                    Attribute._key == key,  #pylint: disable=W0212
+                    Attribute.deleted.is_(False)).distinct())
+        input_control_cache.set(
+            key, input_controls,
+            current_app.config['ATTRIBUTE_SPEC_CACHE_TTL'])
+
+    return input_controls
@@ -0,0 +1,69 @@
+"""Module for in process caches"""
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+
+class ExpiringCache:
+    """
+    A per process, thread safe, least recently used cache whose entries
+    expire after a time to live.
+
+    It counts its hits and misses so that its efficiency can be monitored.
+    """
+
+    def __init__(self, max_entries=1024, clock=monotonic):
+        """
+        Constructor to initialize an instance of the class.
+        :param max_entries: the number of entries kept before the least
+        recently used ones are evicted
+        :param clock: the function returning the current time in seconds
+        that the time to live of the entries is measured against
+        """
+        self.max_entries = max_entries
+        self.clock = clock
+        self.entries = OrderedDict()
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Returns the cached value of a key or None if missing or expired"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] is not None and \
+                    entry[1] <= self.clock():
+                del self.entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key, value, ttl=None):
+        """Caches the value of a key for ttl seconds, or until evicted"""
+        expires_at = None if ttl is None else self.clock() + ttl
+        with self.lock:
+            self.entries[key] = (value, expires_at)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """Drops every cached value"""
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        """Returns the hit and miss counters and the size of the cache"""
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self.entries)
+            }
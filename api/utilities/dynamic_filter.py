@@ -1,15 +1,98 @@
 import re
-from datetime import datetime, date, time
+import json
+from collections import namedtuple
+from datetime import datetime, date, time, timedelta
+from decimal import Decimal, InvalidOperation
+from math import isfinite
 
 from flask import request
-from sqlalchemy import func
-from sqlalchemy.types import Unicode
+from sqlalchemy import and_, bindparam, case, or_
+from sqlalchemy.types import Boolean, Date, DateTime, Numeric, Unicode
 
-from .filter_functions import (like, is_equal, less_than, not_equal,
-                               greater_than, less_or_equal, greater_or_equal)
+from .cache import ExpiringCache
+from .enums import InputControlChoiceEnum
+from .filter_functions import (like, like_pattern, starts_with,
+                               starts_with_pattern, is_equal, less_than,
+                               not_equal, greater_than, less_or_equal,
+                               greater_or_equal)
 from api.middlewares.base_validator import ValidationError
 from api.utilities.messages.error_messages import filter_errors
 
+# A parsed where query string, eg where=tag,like,AND/ or where=tag,in,A,B
+FilterNode = namedtuple('FilterNode', ['key', 'op', 'values'])
+
+# The filter clause of a filter signature, see DynamicFilter.plan. Its
+# values are bound to the parameters named after the nodes, through their
+# value converters.
+FilterPlan = namedtuple('FilterPlan', ['signature', 'clause', 'converters'])
+
+# Filter plans keyed by their signature, shared by the requests of a process
+filter_plans = ExpiringCache(max_entries=512)
+
+# Number of values taken by the operators other than the single valued
+# ones, None for one or more
+OPERATOR_ARITIES = {'in': None, 'between': 2}
+
+DATE_FORMAT = '%Y-%m-%d'
+
+# Kinds of the filtered columns, deciding how values are coerced
+BOOLEAN = 'boolean'
+DATETIME = 'datetime'
+COLUMN = 'column'
+
+# Kinds of the filtered custom attributes. Range comparisons of attributes
+# with a date input control or of numbers cast the attribute values, the
+# values which do not match the pattern of their type are never compared.
+TEXT = 'text'
+JSON = 'json'
+NUMBER = 'number'
+DATE = 'date'
+CUSTOM_KINDS = (TEXT, JSON, NUMBER, DATE)
+RANGE_OPERATORS = ('lt', 'le', 'gt', 'ge', 'between')
+NUMBER_PATTERN = r'^-?[0-9]+(\.[0-9]+)?$'
+DATE_PATTERN = r'^[0-9]{4}-[0-9]{2}-[0-9]{2}$'
+
+# Operators not applicable to a kind of column
+UNSUPPORTED_OPERATORS = {
+    BOOLEAN: ('like', 'startswith', 'lt', 'le', 'gt', 'ge', 'between'),
+    DATETIME: ('like', 'startswith', 'in'),
+}
+
+
+def to_date(value):
+    """Coerces a filter value to a date"""
+    try:
+        return datetime.strptime(value, DATE_FORMAT).date()
+    except ValueError:
+        raise ValidationError(
+            dict(message=filter_errors['INVALID_DATE'].format(value)))
+
+
+def to_number(value):
+    """Coerces a filter value to a decimal number"""
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValidationError(
+            dict(message=filter_errors['INVALID_NUMBER'].format(value)))
+
+
+def is_number(value):
+    """Returns whether a filter value is a number"""
+    return re.match(NUMBER_PATTERN, value) is not None
+
+
+def boolean_coercer(key):
+    """Returns the function coercing the filter values of a boolean key"""
+
+    def to_boolean(value):
+        if value not in ('true', 'false'):
+            raise ValidationError(
+                dict(message=filter_errors['INVALID_BOOLEAN'].format(key)))
+        return value == 'true'
+
+    return to_boolean
+
 
 class DynamicFilter:
     """
@@ -27,6 +110,7 @@ class DynamicFilter:
 
     mapper = {
         'like': like,
+        'startswith': starts_with,
         'eq': is_equal,
         'lt': less_than,
         'ne': not_equal,
@@ -35,6 +119,8 @@ class DynamicFilter:
         'ge': greater_or_equal,
     }
 
+    operators = tuple(mapper) + ('in', 'between', 'isnull')
+
     def validate_query(self, key, value, op):
         """
         Validate parameters passed to any endpoint for filtering.
@@ -76,15 +162,19 @@ class DynamicFilter:
             'deleted', 'created_at', 'updated_at', 'deleted_at', 'warranty'
         ]
 
-        if op not in self.mapper:
+        if op not in self.operators:
             raise ValidationError(
                 dict(message=filter_errors['INVALID_OPERATOR']))
 
+        if op == 'isnull' and value not in ('true', 'false'):
+            raise ValidationError(
+                dict(message=filter_errors['INVALID_BOOLEAN'].format(op)))
+
         try:
-            if key in fields:
+            if key in fields and op != 'isnull':
                 if key in ('created_at', 'updated_at', 'deleted_at',
                            'warranty'):
-                    datetime.strptime(value, "%Y-%m-%d")
+                    datetime.strptime(value, DATE_FORMAT)
                 elif key == 'deleted' and value not in ('true', 'false'):
                     raise ValidationError(
                         dict(
@@ -93,46 +183,297 @@ class DynamicFilter:
             raise ValidationError(
                 dict(message=filter_errors['INVALID_DATE'].format(value)))
 
-    def filter_query(self, args):
+    def parse(self, args):
         """
-        Returns filtered database entries.
-        An example of filter_condition is: User._query('name,like,john').
-        Apart from 'like', other comparators are
-        eq(equal to), ne(not equal to), lt(less than), le(less than or equal
-        to)
-        gt(greater than), ge(greater than or equal to)
-        :param filter_condition:
-        :return: an array of filtered records
+        Returns the FilterNodes of the where query strings, sorted by key and
+        operator as the filters are combined with AND whatever their order.
+
+        A where query string is the key, the operator and its values
+        separated by commas. in takes one or more values, between two and
+        the other operators one. isnull,false is parsed as the internal
+        notnull operator.
         """
 
-        raw_filters = args.getlist('where')
-        result = self.query
+        nodes = []
+        for raw in args.getlist('where'):
+            parts = raw.split(',')
+            if len(parts) < 3:
+                raise ValidationError(
+                    dict(message=filter_errors['INVALID_FILTER_FORMAT'].format(
+                        raw)))
 
-        for raw in raw_filters:
-            try:
-                key, op, value = raw.split(',', 3)
-            except ValueError:
+            key, op, values = parts[0], parts[1], parts[2:]
+            arity = OPERATOR_ARITIES.get(op, 1)
+            if op in self.operators and arity is not None \
+                    and len(values) != arity:
                 raise ValidationError(
                     dict(message=filter_errors['INVALID_FILTER_FORMAT'].format(
                         raw)))
 
-            self.validate_query(key, value, op)
+            for value in values:
+                self.validate_query(key, value, op)
+
+            if op == 'isnull':
+                op, values = 'isnull' if values[0] == 'true' else 'notnull', []
+            nodes.append(FilterNode(key, op, tuple(values)))
 
-            column = getattr(self.model, key, None)
-            json_field = getattr(self.model, 'custom_attributes', None)
-            db_filter = self.mapper.get(op)
+        return tuple(sorted(nodes, key=lambda node: node[:2]))
 
-            if not column and not json_field:
+    @staticmethod
+    def json_value(value):
+        """
+        Returns the json number or boolean a filter value is also a valid
+        form of, or None
+        """
+
+        try:
+            json_value = json.loads(
+                value, parse_constant=lambda constant: None)
+        except ValueError:
+            return None
+        # Overflowing numbers, eg 1e400, are loaded as infinity which is no
+        # json value
+        if isinstance(json_value, float) and not isfinite(json_value):
+            return None
+        if isinstance(json_value, (bool, int, float)):
+            return json_value
+        return None
+
+    def custom_attribute_kind(self, node):
+        """
+        Returns the kind of a filtered custom attribute.
+
+        Range comparisons are made on dates when the attributes of the key
+        have a date input control and on numbers when the values are
+        numbers, other comparisons are made on text.
+        """
+
+        if node.op == 'eq' and self.json_value(node.values[0]) is not None:
+            return JSON
+
+        if node.op in RANGE_OPERATORS:
+            from .attribute_spec import get_input_controls
+
+            if get_input_controls(node.key) == {
+                    InputControlChoiceEnum.DATE.value
+            }:
+                return DATE
+            if all(is_number(value) for value in node.values):
+                return NUMBER
+
+        return TEXT
+
+    def node_kind(self, node):
+        """
+        Returns the kind of column a node filters, which with its key and
+        operator decides the shape of its clause
+        """
+
+        column = getattr(self.model, node.key, None)
+        if column is None:
+            if getattr(self.model, 'custom_attributes', None) is None:
                 raise ValidationError(
-                    dict(message=filter_errors['INVALID_COLUMN'].format(key)))
-            elif not column and json_field:
-                result = result.filter(
-                    db_filter(
-                        self.model.custom_attributes[key].astext.cast(Unicode),
-                        value))
-            elif str(column.type) == 'DATETIME':
-                result = result.filter(db_filter(func.date(column), value))
+                    dict(message=filter_errors['INVALID_COLUMN'].format(
+                        node.key)))
+            return self.custom_attribute_kind(node)
+
+        column_type = getattr(column, 'type', None)
+        if column_type is None:
+            raise ValidationError(
+                dict(message=filter_errors['INVALID_COLUMN'].format(
+                    node.key)))
+
+        if isinstance(column_type, Boolean):
+            kind = BOOLEAN
+        elif isinstance(column_type, DateTime):
+            kind = DATETIME
+        else:
+            kind = COLUMN
+
+        if node.op in UNSUPPORTED_OPERATORS.get(kind, ()):
+            raise ValidationError(
+                dict(message=filter_errors['UNSUPPORTED_OPERATOR'].format(
+                    node.op, node.key)))
+        return kind
+
+    def value_filter(self, column, op, name, coerce=None):
+        """
+        Returns the filter expression comparing a column to the values of a
+        node and the converters of its parameters, coercing the values.
+        """
+
+        def convert(value):
+            return coerce(value) if coerce else value
+
+        if op == 'in':
+            return column.in_(bindparam(name, expanding=True)), [
+                (name, lambda values: [convert(value) for value in values])
+            ]
+
+        if op == 'between':
+            return and_(
+                column >= bindparam(f'{name}_start'),
+                column <= bindparam(f'{name}_end')), [
+                    (f'{name}_start', lambda values: convert(values[0])),
+                    (f'{name}_end', lambda values: convert(values[1]))
+                ]
+
+        pattern = {'like': like_pattern, 'startswith': starts_with_pattern}
+        convert_pattern = pattern.get(op, convert)
+        return self.mapper.get(op)(column, bindparam(name)), [
+            (name, lambda values: convert_pattern(values[0]))
+        ]
+
+    @staticmethod
+    def datetime_filter(column, op, name):
+        """
+        Returns the filter expression comparing a datetime column to the
+        dates of a node as half open ranges of the raw column, so that the
+        index of the column applies, and the converters of its parameters.
+        """
+
+        start = bindparam(f'{name}_start')
+        end = bindparam(f'{name}_end')
+
+        clauses = {
+            'eq': and_(column >= start, column < end),
+            'ne': or_(column < start, column >= end),
+            'lt': column < start,
+            'le': column < end,
+            'gt': column >= end,
+            'ge': column >= start,
+            'between': and_(column >= start, column < end),
+        }
+
+        return clauses[op], [
+            (f'{name}_start', lambda values: to_date(values[0])),
+            (f'{name}_end',
+             lambda values: to_date(values[-1]) + timedelta(days=1)),
+        ]
+
+    def custom_attribute_filter(self, key, op, name, kind):
+        """
+        Returns the filter expression of a key of the custom_attributes
+        column and the converters of its parameters.
+
+        eq filters are compiled to jsonb containment (@>) so that they are
+        served by the GIN index of the column. A value which is also a valid
+        json number or boolean matches both its string and its json form, as
+        the text comparison did.
+        """
+
+        if op == 'eq':
+            json_type = self.model.custom_attributes.type
+            clause = self.model.custom_attributes.contains(
+                bindparam(name, type_=json_type))
+            converters = [(name, lambda values: {key: values[0]})]
+            if kind == JSON:
+                clause = or_(clause,
+                             self.model.custom_attributes.contains(
+                                 bindparam(f'{name}_json', type_=json_type)))
+                converters.append((f'{name}_json', lambda values: {
+                    key: DynamicFilter.json_value(values[0])
+                }))
+            return clause, converters
+
+        text = self.model.custom_attributes[key].astext
+        if kind == NUMBER:
+            return self.value_filter(
+                case([(text.op('~')(NUMBER_PATTERN), text.cast(Numeric))]),
+                op, name, to_number)
+        if kind == DATE:
+            return self.value_filter(
+                case([(text.op('~')(DATE_PATTERN), text.cast(Date))]), op,
+                name, to_date)
+
+        return self.value_filter(text.cast(Unicode), op, name)
+
+    def compile_node(self, name, key, op, kind):
+        """
+        Returns the clause of a node of a filter signature and the
+        converters of its parameters, functions of the node values
+        """
+
+        if kind in CUSTOM_KINDS:
+            if op in ('isnull', 'notnull'):
+                column = self.model.custom_attributes[key].astext
             else:
-                result = result.filter(db_filter(column, value))
+                return self.custom_attribute_filter(key, op, name, kind)
+        else:
+            column = getattr(self.model, key)
+
+        if op == 'isnull':
+            return column.is_(None), []
+        if op == 'notnull':
+            return column.isnot(None), []
+
+        if kind == DATETIME:
+            return self.datetime_filter(column, op, name)
+
+        return self.value_filter(
+            column, op, name,
+            boolean_coercer(key) if kind == BOOLEAN else None)
+
+    def compile_plan(self, signature):
+        """Returns the FilterPlan of a filter signature"""
+
+        clauses, converters = [], []
+
+        for index, (key, op, kind) in enumerate(signature[1]):
+            clause, node_converters = self.compile_node(
+                f'{self.model.__tablename__}_where_{index}', key, op, kind)
+            clauses.append(clause)
+            converters.append(node_converters)
+
+        return FilterPlan(signature, and_(*clauses), tuple(converters))
+
+    def plan(self, args):
+        """
+        Returns the FilterPlan of the where query strings and the values of
+        its parameters, or None and no values without filters.
+
+        Requests filtering the same columns with the same operators share
+        the plan of their signature, the model and the (key, operator,
+        kind) of their nodes, and only bind different values, coerced to
+        the type of their column.
+        """
+
+        nodes = self.parse(args)
+        if not nodes:
+            return None, {}
+
+        signature = (self.model.__name__,
+                     tuple((node.key, node.op, self.node_kind(node))
+                           for node in nodes))
+        plan = filter_plans.get(signature)
+        if plan is None:
+            plan = self.compile_plan(signature)
+            filter_plans.set(signature, plan)
+
+        params = {}
+        for node, node_converters in zip(nodes, plan.converters):
+            for name, converter in node_converters:
+                params[name] = converter(node.values)
+
+        return plan, params
+
+    def filter_query(self, args):
+        """
+        Returns filtered database entries.
+        An example of filter_condition is: User._query('name,like,john').
+        Apart from 'like', other comparators are
+        eq(equal to), ne(not equal to), lt(less than), le(less than or equal
+        to), gt(greater than), ge(greater than or equal to),
+        startswith(starts with, case sensitive), in(equal to one of the
+        values, eg 'tag,in,A,B'), between(between two values inclusive, eg
+        'created_at,between,2018-01-01,2018-12-31') and isnull(null when
+        true, not null when false, eg 'serial,isnull,true')
+        :param filter_condition:
+        :return: an array of filtered records
+        """
+
+        plan, params = self.plan(args)
+        if plan is None:
+            return self.query
 
-        return result
+        return self.query.filter(plan.clause).params(**params)
@@ -26,3 +26,14 @@ class InputControlChoiceEnum(Enum):
     @classmethod
     def get_all_choices(cls):
         return cls.get_multichoice_fields() + cls.get_singlechoice_fields()
+
+
+class ExportStatusEnum(Enum):
+    """
+    Export job status enums
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
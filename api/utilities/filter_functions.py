@@ -1,6 +1,20 @@
 
 def like(column, value):
-	return column.ilike('%{}%'.format(value))
+	return column.ilike(value)
+
+
+def like_pattern(value):
+	return '%{}%'.format(value)
+
+
+def starts_with(column, value):
+	return column.like(value)
+
+
+def starts_with_pattern(value):
+	escaped = value.replace('\\', '\\\\').replace('%', '\\%').replace(
+		'_', '\\_')
+	return '{}%'.format(escaped)
 
 
 def is_equal(column, value):
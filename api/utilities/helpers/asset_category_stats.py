@@ -0,0 +1,118 @@
+"""Module for the asset counts of asset categories."""
+from sqlalchemy import false, func, true
+
+from ...middlewares.base_validator import ValidationError
+from ...models.asset_count import AssetCount
+from ...models.asset_category import AssetCategory
+from ..messages.error_messages import serialization_errors
+
+CENTER = 'center'
+DELETED = 'deleted'
+BREAKDOWNS = (CENTER, DELETED)
+
+
+def validate_breakdown(arg_value):
+    """Returns the breakdowns of the comma separated breakdown query string
+
+    :param arg_value: The value of the breakdown query string, eg
+    center,deleted
+    :type arg_value: string
+    """
+
+    if not arg_value:
+        return set()
+
+    breakdown = set(arg_value.split(','))
+    if not breakdown.issubset(BREAKDOWNS):
+        raise ValidationError(
+            dict(message=serialization_errors['invalid_query_strings'].format(
+                'breakdown', arg_value)))
+
+    return breakdown
+
+
+def asset_counts_query(categories_query, breakdown=()):
+    """Returns the rows of the categories of a query with their assets count
+
+    The counts are summed from the asset_counts rollup in a single grouped
+    aggregate, so the assets themselves are never scanned.
+    The rows have the id, name and assets_count columns, as well as the
+    deleted_assets_count column with the deleted breakdown, and a row per
+    center of a category with its center_id with the center breakdown.
+
+    :param categories_query: The query of the asset categories to count
+    :type categories_query: Query
+    :param breakdown: The breakdowns of the counts, see BREAKDOWNS
+    :type breakdown: set
+    """
+
+    def assets_count(deleted):
+        """Returns the sum of the counts of the deleted or kept assets"""
+        return func.coalesce(
+            func.sum(AssetCount.assets_count).filter(
+                AssetCount.deleted == deleted), 0)
+
+    columns = [
+        AssetCategory.id, AssetCategory.name,
+        assets_count(false()).label('assets_count')
+    ]
+    group_by = [AssetCategory.id]
+    order_by = [AssetCategory.id]
+
+    if DELETED in breakdown:
+        columns.append(assets_count(true()).label('deleted_assets_count'))
+    if CENTER in breakdown:
+        columns.append(AssetCount.center_id)
+        group_by.append(AssetCount.center_id)
+        order_by.append(AssetCount.center_id)
+
+    return categories_query.outerjoin(
+        AssetCount,
+        AssetCount.asset_category_id == AssetCategory.id).with_entities(
+            *columns).group_by(*group_by).order_by(*order_by)
+
+
+def get_asset_category_stats(categories_query, breakdown=()):
+    """Returns the asset categories of a query with their assets count
+
+    :param categories_query: The query of the asset categories to count
+    :type categories_query: Query
+    :param breakdown: The breakdowns of the counts, see BREAKDOWNS
+    :type breakdown: set
+
+    Returns a list of dicts with the id, name and assetsCount of the
+    categories, the deletedAssetsCount with the deleted breakdown and the
+    centers, with the centerId and assetsCount of the centers holding
+    assets of the category, with the center breakdown.
+    """
+
+    stats = []
+
+    for row in asset_counts_query(categories_query, breakdown):
+        if not stats or stats[-1]['id'] != row.id:
+            stats.append({'id': row.id, 'name': row.name, 'assetsCount': 0})
+            if DELETED in breakdown:
+                stats[-1]['deletedAssetsCount'] = 0
+            if CENTER in breakdown:
+                stats[-1]['centers'] = []
+
+        category_stats = stats[-1]
+        category_stats['assetsCount'] += row.assets_count
+        if DELETED in breakdown:
+            category_stats['deletedAssetsCount'] += row.deleted_assets_count
+        if CENTER in breakdown and row.assets_count:
+            category_stats['centers'].append({
+                'centerId': row.center_id,
+                'assetsCount': row.assets_count
+            })
+
+    return stats
+
+
+def get_assets_counts(categories_query):
+    """Returns the assets count of the categories of a query by id"""
+
+    return {
+        row.id: row.assets_count
+        for row in asset_counts_query(categories_query)
+    }
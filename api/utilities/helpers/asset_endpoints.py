@@ -1,5 +1,16 @@
 """Module for asset endpoints helpers."""
+import csv
+from io import StringIO
+
+from flask import current_app
+
 from ..model_serializers.asset import AssetSchema
+from ..messages.error_messages import serialization_errors
+from ...middlewares.base_validator import ValidationError
+
+# CSV columns mapped to the asset fields, the other columns are custom
+# attributes
+ASSET_CSV_COLUMNS = ('tag', 'serial', 'assetCategoryId')
 
 
 def create_asset_response(asset_instance, message, handle_many=False):
@@ -26,3 +37,75 @@ def create_asset_response(asset_instance, message, handle_many=False):
     }
 
     return response
+
+
+def parse_assets_csv(content):
+    """Helper function to convert a CSV file of assets to asset data
+
+    :param content: The CSV file content. The tag, serial and assetCategoryId
+                    columns are the asset fields and any other column is a
+                    custom attribute.
+    :type content: string
+
+    :return: The list of asset data, one per CSV row
+    """
+
+    assets_data = []
+
+    for record in csv.DictReader(StringIO(content)):
+        asset_data = {'customAttributes': {}}
+        for column, value in record.items():
+            # values of rows longer than the header are keyed by None
+            if column is None or value in (None, ''):
+                continue
+            if column in ASSET_CSV_COLUMNS:
+                asset_data[column] = value
+            else:
+                asset_data['customAttributes'][column] = value
+        assets_data.append(asset_data)
+
+    return assets_data
+
+
+def parse_bulk_assets(request):
+    """Helper function to parse the assets of a bulk import request
+
+    :param request: The flask request object of the endpoint, its body is
+                    either a JSON array, a CSV file uploaded in the file field
+                    or a text/csv body
+    :type request: Flask Request Object
+
+    :return: The list of asset data
+    """
+
+    if request.is_json:
+        assets_data = request.get_json()
+    else:
+        upload = request.files.get('file')
+        try:
+            if upload:
+                content = upload.read().decode('utf-8-sig')
+            elif request.mimetype == 'text/csv':
+                content = request.get_data().decode('utf-8-sig')
+            else:
+                content = None
+        except UnicodeDecodeError:
+            content = None
+        assets_data = parse_assets_csv(content) if content else None
+
+    if not isinstance(assets_data, list):
+        raise ValidationError(
+            {'message': serialization_errors['bulk_import_type']}, 400)
+
+    if not assets_data:
+        raise ValidationError(
+            {'message': serialization_errors['bulk_import_empty']}, 400)
+
+    max_rows = current_app.config['ASSET_IMPORT_MAX_ROWS']
+    if len(assets_data) > max_rows:
+        raise ValidationError({
+            'message':
+            serialization_errors['bulk_import_size'].format(max_rows)
+        }, 400)
+
+    return assets_data
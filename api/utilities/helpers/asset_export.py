@@ -0,0 +1,53 @@
+"""Module for the asset csv export helpers."""
+from sqlalchemy import func
+
+from ...models.asset import Asset
+
+# Number of assets fetched from the database cursor at a time
+EXPORT_BATCH_SIZE = 1000
+ASSET_COLUMNS = ('tag', 'serial', 'created_at')
+
+
+def get_asset_rows(asset_category_id):
+    """Returns the RowsQuery of the exported assets of an asset category"""
+
+    return Asset._query_rows(  #pylint: disable=W0212
+        columns=ASSET_COLUMNS + ('custom_attributes', ),
+        asset_category_id=asset_category_id)
+
+
+def get_asset_column_names(asset_rows):
+    """
+    Returns the csv header of assets, ie the asset columns and the custom
+    attribute keys found in the assets, which may be more than the
+    attributes of their category
+    """
+
+    custom_attributes = Asset.__table__.c.custom_attributes
+    attribute_keys = asset_rows.derive(
+        'attribute_keys', lambda rows: rows.with_only_columns([
+            func.jsonb_object_keys(custom_attributes)
+        ]).where(func.jsonb_typeof(custom_attributes) == 'object').distinct())
+
+    return sorted(
+        set(ASSET_COLUMNS)
+        | {key
+           for key, in asset_rows.execute(attribute_keys)})
+
+
+def get_asset_records(asset_rows):
+    """
+    Generator of the csv records of assets, read from a server side cursor
+    in batches of EXPORT_BATCH_SIZE.
+    The custom attributes are flattened so as to have them as separate
+    columns in the csv file.
+    """
+
+    for tag, serial, created_at, custom_attributes in asset_rows.stream(
+            EXPORT_BATCH_SIZE):
+        record = dict(custom_attributes or {})
+        record.update(
+            tag=tag,
+            serial=serial,
+            created_at=created_at.date() if created_at else None)
+        yield record
@@ -0,0 +1,51 @@
+"""Module for the full text search of assets."""
+from sqlalchemy import bindparam, func
+
+from ...middlewares.base_validator import ValidationError
+from ...models.asset import Asset
+from ..messages.error_messages import filter_errors
+from ..paginator import QueryRecords
+
+# The text search configuration of the search vectors, tags and serials
+# are not words so they are neither stemmed nor dropped as stop words
+SEARCH_CONFIG = 'simple'
+
+
+def search_terms(search_query):
+    """
+    Returns the tsquery text matching the records containing every word of
+    a search query, or a prefix of a word, eg 'c02x':* & 'apple':*
+
+    Every word is quoted so that the tsquery operators it may contain are
+    matched literally.
+    """
+
+    words = search_query.split()
+    if not words:
+        raise ValidationError(
+            dict(message=filter_errors['INVALID_SEARCH_QUERY']))
+
+    return ' & '.join(
+        "'{}':*".format(word.replace('\\', '\\\\').replace("'", "''"))
+        for word in words)
+
+
+def search_assets(search_query, filter_args):
+    """
+    Returns the QueryRecords of the non deleted assets matching a search
+    query and the where filters, the most relevant first.
+
+    :param search_query: The words searched in the tags, serials, category
+    names and custom attribute values
+    :param filter_args: The where query strings, see DynamicFilter
+    """
+
+    tsquery = func.to_tsquery(SEARCH_CONFIG,
+                              bindparam('search_terms',
+                                        search_terms(search_query)))
+
+    query = Asset._query(filter_args).filter_by(  #pylint: disable=W0212
+        deleted=False).filter(Asset.search_vector.op('@@')(tsquery)).order_by(
+            func.ts_rank(Asset.search_vector, tsquery).desc(), Asset.id)
+
+    return QueryRecords(query)
@@ -0,0 +1,67 @@
+"""Module for csv export helpers."""
+import csv
+from urllib.parse import quote
+
+from flask import Response, stream_with_context
+
+# Number of csv rows sent to the client in a chunk
+CSV_CHUNK_ROWS = 500
+
+
+class CsvLine:
+    """File like object returning the line written by a csv writer"""
+
+    def write(self, line):  #pylint: disable=R0201
+        """Returns the written line instead of storing it"""
+        return line
+
+
+def generate_csv(column_names, records):
+    """Generator of the chunks of a csv file
+
+    :param column_names: The header of the csv file
+    :type column_names: list
+    :param records: The rows of the csv file as dicts keyed by column name
+    :type records: iterable
+
+    Yields the csv file in chunks of CSV_CHUNK_ROWS lines
+    """
+
+    writer = csv.writer(CsvLine())
+    chunk = [writer.writerow(column_names)]
+
+    for record in records:
+        chunk.append(
+            writer.writerow([record.get(column) for column in column_names]))
+        if len(chunk) >= CSV_CHUNK_ROWS:
+            yield ''.join(chunk)
+            chunk = []
+
+    if chunk:
+        yield ''.join(chunk)
+
+
+def make_csv_response(column_names, records, file_name):
+    """Creates a response streaming records as a csv file attachment
+
+    The records are only read while the response is sent, so the rows can
+    come from a server side cursor without holding the whole file in
+    memory.
+
+    :param column_names: The header of the csv file
+    :type column_names: list
+    :param records: The rows of the csv file as dicts keyed by column name
+    :type records: iterable
+    :param file_name: The name of the file without its extension
+    :type file_name: string
+    """
+
+    response = Response(
+        stream_with_context(generate_csv(column_names, records)),
+        content_type='text/csv')
+    url_encoded_file_name = quote(f'{file_name}.csv')
+    response.headers['Content-Disposition'] = (
+        f"attachment; filename={url_encoded_file_name};"
+        f"filename*=utf-8''{url_encoded_file_name}")
+
+    return response
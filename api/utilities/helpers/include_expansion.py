@@ -0,0 +1,86 @@
+"""Module for the expansions of the include query string."""
+from sqlalchemy.orm import selectinload
+
+from ...middlewares.base_validator import ValidationError
+from ...models.asset_category import AssetCategory
+from ..messages.error_messages import serialization_errors
+
+ASSETS_COUNT = 'assets_count'
+ATTRIBUTES = 'attributes'
+
+# The loader options of the expansions of the asset categories. The assets
+# count is summed with a grouped aggregate rather than loaded with the
+# categories, see get_assets_counts.
+ASSET_CATEGORY_EXPANSIONS = {
+    ASSETS_COUNT: (),
+    ATTRIBUTES: (selectinload(AssetCategory.eager_loaded_attributes),),
+}
+
+# The fields of EagerLoadAssetCategoryAttributesSchema dumping the
+# expansions of the asset categories
+ASSET_CATEGORY_INCLUDE_FIELDS = {
+    ASSETS_COUNT: 'assets_count',
+    ATTRIBUTES: 'custom_attributes',
+}
+
+
+def parse_include(arg_value, expansions, default=()):
+    """Returns the expansions of the comma separated include query string
+
+    :param arg_value: The value of the include query string, eg
+    assets_count,attributes
+    :type arg_value: string
+    :param expansions: The expansions of the endpoint, eg
+    ASSET_CATEGORY_EXPANSIONS
+    :type expansions: dict
+    :param default: The expansions of the endpoint without the query string
+    :type default: tuple
+    """
+
+    if arg_value is None:
+        return set(default)
+
+    include = {name.strip() for name in arg_value.lower().split(',')}
+    if not include.issubset(expansions):
+        raise ValidationError(
+            dict(message=serialization_errors['invalid_query_strings'].format(
+                'include', arg_value)))
+
+    return include
+
+
+def include_options(include, expansions):
+    """Returns the loader options of the expansions included
+
+    :param include: The expansions included, see parse_include
+    :type include: set
+    :param expansions: The expansions of the endpoint
+    :type expansions: dict
+    """
+
+    return [
+        option for name in sorted(include) for option in expansions[name]
+    ]
+
+
+def expand_query(query, include, expansions):
+    """Returns the query loading the relationships of the expansions included
+
+    The records already in the session are loaded anew, their expanded
+    relationships being left unloaded by their previous queries. The
+    session is flushed beforehand as populate_existing skips the autoflush.
+
+    :param query: The query of the records to expand
+    :type query: Query
+    :param include: The expansions included, see parse_include
+    :type include: set
+    :param expansions: The expansions of the endpoint
+    :type expansions: dict
+    """
+
+    options = include_options(include, expansions)
+    if not options:
+        return query
+    if query.session.autoflush:
+        query.session.flush()
+    return query.options(*options).populate_existing()
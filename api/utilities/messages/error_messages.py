@@ -28,6 +28,10 @@ serialization_errors = {  #pylint: disable=C0103
     'The attribute {} is required',
     'unrelated_attribute':
     'The attribute {} is not related to this asset category',
+    'attribute_value':
+    'The attribute {} must be {}',
+    'attribute_choice':
+    'The attribute {} must be one of {}',
     'invalid_category_id':
     'This asset category id is invalid',
     'category_not_found':
@@ -44,10 +48,28 @@ serialization_errors = {  #pylint: disable=C0103
     'invalid field supplied',
     'invalid_query_strings':
     '{0} contains invalid parameter {1}',
+    'invalid_cursor':
+    'cursor contains invalid parameter {}',
     'json_type_required':
     'Content-Type should be application/json',
     'duplicate_asset':
     'Asset with the tag {} already exists',
+    'bulk_import_type':
+    'Assets should be provided as a JSON array or a CSV file',
+    'bulk_import_size':
+    'At most {} assets can be imported at once',
+    'bulk_import_empty':
+    'Please provide at least one asset',
+    'bulk_import_chunk_failed':
+    'Asset could not be saved, its batch conflicted with existing data',
+    'export_type':
+    'Export type should be one of {}',
+    'export_where':
+    'where should be an array of filters',
+    'export_not_done':
+    'The export job is {}, its file can only be downloaded once done',
+    'export_stale':
+    'The export job stopped without finishing, please export again',
     'asset_category_assets':
     'Assets for category {} fetched successfully',
     'exists':
@@ -88,7 +110,15 @@ filter_errors = {
 : Y-M-D',
     'INVALID_OPERATOR':
     '''invalid operator, valid operators are \
-'like, eq, lt, ne, gt, le, ge' ''',
+'like, startswith, eq, lt, ne, gt, le, ge, in, between, isnull' ''',
+    'UNSUPPORTED_OPERATOR':
+    'The operator {} is not supported on {}',
+    'INVALID_BOOLEAN':
+    '{} should be either true or false',
+    'INVALID_NUMBER':
+    'Invalid number {}',
+    'INVALID_SEARCH_QUERY':
+    'The search query q should contain at least one word',
     'INVALID_COLUMN':
     'Invalid filter column: {}',
     'INVALID_FILTER_FORMAT':
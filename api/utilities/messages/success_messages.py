@@ -3,7 +3,9 @@
 SUCCESS_MESSAGES = {
     'asset_created': 'Asset successfully created',
     'asset_edited': 'Asset successfully edited',
+    'assets_imported': '{0} of {1} assets successfully imported',
     'created': '{} successfully created',
+    'export_queued': 'Export job successfully queued',
     'person_deleted': '{} deleted successfully',
     'fetched': '{} fetched successfully',
     'deleted': '{0} successfully deleted',
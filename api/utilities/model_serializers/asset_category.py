@@ -5,6 +5,7 @@ from api.middlewares.base_validator import ValidationError
 
 from .base_schemas import BaseSchema
 from .attribute import AttributeSchema
+from .schema_registry import schemas
 from api.models.asset_category import AssetCategory
 from .base_schemas import BaseSchema
 from ..validators.name_validator import name_validator
@@ -36,6 +37,13 @@ class AssetCategorySchema(BaseSchema):
         raise ValidationError({'message': 'Asset Category already exist'}, 409)
 
     def get_asset_counts(self, obj):
+        """
+        Returns the assets count of a category, read from the assets_counts
+        of the context when counted beforehand, see get_assets_counts
+        """
+        assets_counts = self.context.get('assets_counts')
+        if assets_counts is not None:
+            return assets_counts.get(obj.id, 0)
         return obj.assets_count
 
 
@@ -55,6 +63,7 @@ class EagerLoadAssetCategoryAttributesSchema(AssetCategorySchema):
     def get_eager_loaded_attributes(self, obj):
         """Get serialized eager loaded attributes"""
 
-        attribute_schema = AttributeSchema(many=True, exclude=['deleted'])
-        return attribute_schema.dump(obj.eager_loaded_attributes).data
+        attribute_serializer = schemas.serializer(
+            AttributeSchema, exclude=['deleted'])
+        return attribute_serializer(obj.eager_loaded_attributes)
 
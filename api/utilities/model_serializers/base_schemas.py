@@ -2,6 +2,7 @@
 from marshmallow import Schema, fields
 
 from ...middlewares.base_validator import ValidationError
+from ..timing import timed
 
 
 class BaseSchema(Schema):
@@ -9,6 +10,11 @@ class BaseSchema(Schema):
     id = fields.String(dump_only=True)
     deleted = fields.Boolean(dump_only=True)
 
+    def dump(self, *args, **kwargs):
+        """Serializes an object, timing it as part of the request"""
+        with timed('dump'):
+            return super().dump(*args, **kwargs)
+
     def load_json_into_schema(self, data):
         """Helper function to load raw json request data into schema"""
         data, errors = self.loads(data)
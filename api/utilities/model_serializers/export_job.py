@@ -0,0 +1,18 @@
+"""Module for export job schema"""
+
+from marshmallow import fields
+
+from .base_schemas import AuditableBaseSchema
+
+
+class ExportJobSchema(AuditableBaseSchema):
+    """
+    Export job model schema
+    """
+    export_type = fields.String(dump_only=True, dump_to='type')
+    params = fields.Dict(dump_only=True)
+    status = fields.String(dump_only=True)
+    processed_rows = fields.Integer(dump_only=True, dump_to='processedRows')
+    total_rows = fields.Integer(dump_only=True, dump_to='totalRows')
+    file_name = fields.String(dump_only=True, dump_to='fileName')
+    error = fields.String(dump_only=True)
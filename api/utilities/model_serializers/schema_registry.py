@@ -0,0 +1,89 @@
+"""Module for the registry of the schema instances shared by the requests"""
+
+from ...middlewares.base_validator import ValidationError
+from ..cache import ExpiringCache
+from ..messages.error_messages import serialization_errors
+from .row_serializer import RowSerializer
+
+
+class SchemaRegistry:
+    """
+    A per process cache of schema instances keyed by their class, many,
+    only and exclude options, so that views do not build and bind the
+    fields of a schema on every request, and of the RowSerializers compiled
+    from them.
+
+    The cached instances are shared, schemas given a per request context
+    are built by their caller instead.
+    """
+
+    def __init__(self, max_entries=256):
+        """
+        Constructor to initialize an instance of the class.
+        :param max_entries: the number of schemas kept, the only options of
+        the fields query string may otherwise grow the registry unbounded
+        """
+        self.cache = ExpiringCache(max_entries=max_entries)
+
+    def get(self, schema_class, many=False, only=None, exclude=()):
+        """Returns the schema instance of a class and options"""
+
+        key = (schema_class, many, only and tuple(sorted(only)),
+               tuple(sorted(exclude)))
+        schema = self.cache.get(key)
+        if schema is None:
+            schema = schema_class(many=many, only=only, exclude=exclude)
+            self.cache.set(key, schema)
+        return schema
+
+    def serializer(self, schema_class, only=None, exclude=()):
+        """
+        Returns the RowSerializer compiled from the schema instance of a
+        class and options with many
+        """
+
+        key = (RowSerializer, schema_class, only and tuple(sorted(only)),
+               tuple(sorted(exclude)))
+        serializer = self.cache.get(key)
+        if serializer is None:
+            serializer = RowSerializer(
+                self.get(schema_class, many=True, only=only, exclude=exclude))
+            self.cache.set(key, serializer)
+        return serializer
+
+
+schemas = SchemaRegistry()
+
+
+def parse_fields(schema_class, arg_value, exclude=()):
+    """
+    Returns the names of the schema fields selected by the fields query
+    string, eg tag,serial,customAttributes, or None for every field.
+
+    A field is selected by its name or by the key it is dumped to.
+
+    Raises:
+        ValidationError: Used to raise exception if a field is unknown
+    """
+
+    if arg_value is None:
+        return None
+
+    field_names = {}
+    for name, field in schema_class._declared_fields.items():  #pylint: disable=W0212
+        if name not in exclude:
+            field_names[name] = name
+            field_names[field.dump_to or name] = name
+
+    selected = []
+    for field in arg_value.split(','):
+        if field not in field_names:
+            raise ValidationError({
+                'message':
+                serialization_errors['invalid_query_strings'].format(
+                    'fields', arg_value)
+            })
+        if field_names[field] not in selected:
+            selected.append(field_names[field])
+
+    return selected
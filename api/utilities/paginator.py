@@ -1,16 +1,29 @@
 """Module for pagination helpers"""
 
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
 from functools import wraps
 from math import ceil
+from urllib.parse import urlencode
 from werkzeug.datastructures import ImmutableMultiDict
 import re
 
 from flask import request
+from sqlalchemy import bindparam, tuple_
+from sqlalchemy.orm import load_only
 
 from .messages.error_messages import serialization_errors
 from ..middlewares.base_validator import ValidationError
-from .constants import EXCLUDED_FIELDS
+from .constants import EXCLUDED_FIELDS, CHARSET
+from .model_serializers.schema_registry import parse_fields, schemas
+from .record_count import COUNT_STRATEGIES, EXACT, ESTIMATED, compile_query
 
+CURSOR_DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+NEXT = 'next'
+PREVIOUS = 'prev'
+# The query strings of a request kept in the urls of its pages
+KEPT_QUERY_STRINGS = ('fields', 'count')
 
 def validate_pagination_args(arg_value, arg_name):
     """
@@ -43,9 +56,358 @@ def validate_pagination_args(arg_value, arg_name):
         })
 
 
-def pagination_helper(model, schema, extra_query=None):
+def validate_count_strategy(arg_value):
+    """
+    Validates the count query string.
+
+    Arguments:
+        arg_value (string): Query string value
+
+    Raises:
+        ValidationError: Use to raise exception if the strategy is unknown
+
+    Returns:
+        (string) -- The count strategy, defaults to exact
+    """
+
+    if arg_value is None:
+        return EXACT
+
+    if arg_value not in COUNT_STRATEGIES:
+        raise ValidationError({
+            'message':
+            serialization_errors['invalid_query_strings'].format(
+                'count', arg_value)
+        })
+
+    return arg_value
+
+
+def get_base_url():
+    """
+    Returns the url of the current request without its query strings.
+    """
+
+    # Removes the trailing / at the end of the root url
+    root_url = request.url_root[:-1]
+    # Removes the trailing / at the begining of the url path
+    url_path = request.path[1:]
+    return f'{root_url}/{url_path}'
+
+
+def get_pages_url(link_args=None):
+    """
+    Returns the url of the pages of the current request, ending with the
+    separator of the page query strings.
+
+    The pages keep the query strings of link_args and the fields and count
+    query strings of the request, so that every page has the same shape.
+    """
+
+    args = dict(link_args or {})
+    args.update((name, request.args[name]) for name in KEPT_QUERY_STRINGS
+                if name in request.args)
+
+    pages_url = f'{get_base_url()}?'
+    if args:
+        pages_url = f'{pages_url}{urlencode(args)}&'
+    return pages_url
+
+
+def filtered_records_query(model, extra_query=None):
+    """
+    Builds the query for the non deleted records of a model.
+
+    Arguments:
+        model (class): Model to be queried
+
+    Keyword Arguments:
+        extra_query (dict): Contains extra query to be performed on the model
+                            (default: {None})
+
+    Returns:
+        (Query): The filtered query
+    """
+
+    query = model._query(request.args)
+
+    records_query = query.filter_by(deleted=False)
+
+    # Checks if they are extra queries to perform on the model
+    if extra_query and isinstance(extra_query, dict):
+        try:
+            records_query = records_query.filter_by(**extra_query)
+        except:
+            # Raise a validation error if the keys in the extra queries are not part of the models fields
+            raise ValidationError({
+                'message':
+                serialization_errors['invalid_field']
+            })
+
+    return records_query
+
+
+class QueryRecords:
+    """
+    The records of a built query, eg ordered by rank, paginated as the
+    RowsQuery of the models.
+    """
+
+    def __init__(self, query):
+        """
+        Constructor to initialize an instance of the class.
+        :param query: The query of the records
+        """
+        self.query = query
+
+    @property
+    def cache_key(self):
+        """The compiled sql of the query, as the key of its cached count"""
+        return str(compile_query(self.query))
+
+    @property
+    def params(self):
+        """The parameters of the compiled query"""
+        return compile_query(self.query).params
+
+    def count(self):
+        """Returns the number of records"""
+        return self.query.order_by(None).count()
+
+    def load_only(self, columns):
+        """Returns the records with only the columns given loaded"""
+        return QueryRecords(self.query.options(load_only(*columns)))
+
+    def page(self, offset, limit):
+        """Returns the records of a page"""
+        return self.query.offset(offset).limit(limit).all()
+
+
+def get_serializer(model, schema):
+    """
+    Returns the RowSerializer dumping the records of a page and the names
+    of the columns to load, narrowed to the fields query string if given.
+
+    Every column is loaded when a selected field is not a column of the
+    model, eg a computed one.
+
+    Arguments:
+        model (class): Model being paginated
+        schema (class): Schema to be used for serilization
+
+    Returns:
+        (tuple): The RowSerializer and the column names, or None
+    """
+
+    only = parse_fields(
+        schema, request.args.get('fields'), exclude=EXCLUDED_FIELDS)
+    serializer = schemas.serializer(
+        schema, only=only, exclude=EXCLUDED_FIELDS)
+
+    if only is None:
+        return serializer, None
+
+    columns = tuple(
+        sorted(serializer.schema.fields[name].attribute or name
+               for name in only))
+    if not set(columns).issubset(model.__mapper__.column_attrs.keys()):
+        return serializer, None
+    return serializer, columns
+
+
+def get_seek_columns(model):
+    """
+    Returns the columns used as the seek key of a model in cursor pagination.
+
+    Models with a created_at column are seeked on (created_at, id), others on
+    their id alone since PushIDs sort lexicographically by creation time.
+    """
+
+    created_at = getattr(model, 'created_at', None)
+    if created_at is not None:
+        return [created_at, model.id]
+    return [model.id]
+
+
+def encode_cursor(model, record, direction):
+    """
+    Encodes the seek key of a record into an opaque cursor string.
+
+    Arguments:
+        model (class): Model being paginated
+        record (object): Record the cursor points at
+        direction (string): Either 'next' or 'prev'
+
+    Returns:
+        (string): The url safe cursor
+    """
+
+    seek_values = []
+    for column in get_seek_columns(model):
+        value = getattr(record, column.key)
+        if isinstance(value, datetime):
+            value = value.strftime(CURSOR_DATETIME_FORMAT)
+        seek_values.append(value)
+
+    payload = json.dumps({'d': direction, 'k': seek_values})
+    cursor = urlsafe_b64encode(payload.encode(CHARSET)).decode(CHARSET)
+
+    return cursor.rstrip('=')
+
+
+def decode_cursor(model, cursor):
+    """
+    Decodes a cursor string into its direction and seek values.
+
+    An empty cursor denotes the first page.
+
+    Raises:
+        ValidationError: Used to raise exception if the cursor is invalid
+
+    Returns:
+        (tuple): The direction and the list of seek values (or None)
+    """
+
+    if not cursor:
+        return NEXT, None
+
+    seek_columns = get_seek_columns(model)
+
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        payload = json.loads(
+            urlsafe_b64decode(cursor + padding).decode(CHARSET))
+        direction, seek_values = payload['d'], payload['k']
+
+        if direction not in (NEXT, PREVIOUS) or \
+                len(seek_values) != len(seek_columns) or \
+                not isinstance(seek_values[-1], str):
+            raise ValueError('invalid cursor payload')
+
+        if len(seek_columns) == 2:
+            seek_values[0] = datetime.strptime(seek_values[0],
+                                               CURSOR_DATETIME_FORMAT)
+    except (ValueError, TypeError, KeyError):
+        raise ValidationError({
+            'message':
+            serialization_errors['invalid_cursor'].format(cursor)
+        })
+
+    return direction, seek_values
+
+
+def cursor_pagination_helper(model, schema, extra_query=None):
+    """
+    Paginates records of a model by seeking on their (created_at, id) key.
+
+    Unlike the page mode this does not count the records nor scan the skipped
+    ones, so every page costs a single query regardless of its depth.
+
+    Arguments:
+        model (class): Model to be paginated
+        schema (class) -- Schema to be used for serilization
+
+    Keyword Arguments:
+        extra_query (dict): Contains extra query to be performed on the model
+                            (default: {None})
+
+    Returns:
+        (tuple): Returns a tuple containing the paginated data and the
+                paginated meta object
+    """
+
+    limit = validate_pagination_args(
+        request.args.get('limit', 'None'), 'limit')
+    direction, seek_values = decode_cursor(model,
+                                           request.args.get('cursor'))
+
+    pages_url = get_pages_url()
+    seek_columns = get_seek_columns(model)
+    serializer, columns = get_serializer(model, schema)
+    if columns:
+        # The seek key of the records is encoded in the cursors
+        columns = tuple(
+            sorted(set(columns) | {column.key
+                                   for column in seek_columns}))
+    rows = model._query_rows(  #pylint: disable=W0212
+        request.args, columns, **(extra_query or {}))
+
+    def build_page(rows_select):
+        """Returns the select of a page of rows from their select"""
+        if seek_values:
+            seek_key = tuple_(*seek_columns)
+            seek_params = tuple_(*(bindparam(f'seek_{index}')
+                                   for index in range(len(seek_columns))))
+            if direction == PREVIOUS:
+                rows_select = rows_select.where(seek_key < seek_params)
+            else:
+                rows_select = rows_select.where(seek_key > seek_params)
+
+        if direction == PREVIOUS:
+            order_by = [column.desc() for column in seek_columns]
+        else:
+            order_by = seek_columns
+
+        return rows_select.order_by(*order_by).limit(bindparam('page_limit'))
+
+    page_select = rows.derive(('cursor', direction, bool(seek_values)),
+                              build_page)
+
+    # One extra record is fetched to find out if there are more records
+    # beyond this page
+    records = rows.execute(
+        page_select,
+        page_limit=limit + 1,
+        **{f'seek_{index}': value
+           for index, value in enumerate(seek_values or ())}).fetchall()
+    has_more = len(records) > limit
+    records = records[:limit]
+
+    if direction == PREVIOUS:
+        records.reverse()
+        has_next_page, has_previous_page = True, has_more
+    else:
+        has_next_page, has_previous_page = has_more, bool(seek_values)
+
+    # pagination meta object
+    pagination_object = {
+        "firstPage": f'{pages_url}cursor=&limit={limit}',
+        "currentPage": request.url,
+        "nextPage": "",
+        "previousPage": "",
+        "nextCursor": "",
+        "prevCursor": "",
+        "limit": limit
+    }
+
+    if records and has_next_page:
+        next_cursor = encode_cursor(model, records[-1], NEXT)
+        pagination_object['nextCursor'] = next_cursor
+        pagination_object['nextPage'] = \
+            f'{pages_url}cursor={next_cursor}&limit={limit}'
+
+    if records and has_previous_page:
+        prev_cursor = encode_cursor(model, records[0], PREVIOUS)
+        pagination_object['prevCursor'] = prev_cursor
+        pagination_object['previousPage'] = \
+            f'{pages_url}cursor={prev_cursor}&limit={limit}'
+
+    data = serializer(records)
+
+    return data, pagination_object
+
+
+def pagination_helper(model, schema, extra_query=None, records=None,
+                      link_args=None):
     """
     Paginates records of a model.
+
+    The records are paginated by cursor when the cursor query string is
+    provided, see cursor_pagination_helper, and by page otherwise.
+
+    The count query string selects how totalCount is computed: exact
+    (default), estimated from the postgres planner or cached for a few
+    seconds per set of filters.
     
     Arguments:
         model (class): Model to be paginated
@@ -56,6 +418,11 @@ def pagination_helper(model, schema, extra_query=None):
                             (default: {None})
 
         example: {"asset_category_id": "-LHYVNP2yx8oIOJFzXS4", "deleted": False}
+        records (QueryRecords): The records to paginate instead of the
+                                rows of the model, see _query_rows
+                                (default: {None})
+        link_args (dict): The query strings kept in the page urls, eg
+                          {"q": "macbook"} (default: {None})
     
     Returns:
         (tuple): Returns a tuple containing the paginated data and the 
@@ -63,51 +430,57 @@ def pagination_helper(model, schema, extra_query=None):
                 whether the limit and page object is provided
     """
 
+    if 'cursor' in request.args:
+        return cursor_pagination_helper(model, schema, extra_query)
+
     # Validates if the query strings are digits and the digits are >= 1
     limit = validate_pagination_args(
         request.args.get('limit', 'None'), 'limit')
     current_page_count = validate_pagination_args(
         request.args.get('page', 'None'), 'page'
     )  # assign the page query string to the variable current_page_count
+    count_strategy = validate_count_strategy(request.args.get('count'))
+    serializer, columns = get_serializer(model, schema)
 
-    query = model._query(request.args)
-
-    # Removes the trailing / at the end of the root url
-    root_url = request.url_root[:-1]
-    # Removes the trailing / at the begining of the url path
-    url_path = request.path[1:]
-    base_url = f'{root_url}/{url_path}'
+    pages_url = get_pages_url(link_args)
     current_page_url = request.url
 
-    records_query = query.filter_by(deleted=False)
-
-    # Checks if they are extra queries to perform on the model
-    if extra_query and isinstance(extra_query, dict):
-        try:
-            records_query = records_query.filter_by(**extra_query)
-        except:
-            # Raise a validation error if the keys in the extra queries are not part of the models fields
-            raise ValidationError({
-                'message':
-                serialization_errors['invalid_field']
-            })
+    if records is None:
+        records_query = model._query_rows(  #pylint: disable=W0212
+            request.args, columns, **(extra_query or {}))
+    elif columns:
+        records_query = records.load_only(columns)
+    else:
+        records_query = records
 
-    records_count = records_query.count()
-    first_page = f'{base_url}?page=1&limit={limit}'
+    # The estimated count explains the query, which is built for it
+    if count_strategy != ESTIMATED:
+        count_query = records_query
+    elif records:
+        count_query = records.query
+    else:
+        count_query = filtered_records_query(model, extra_query)
+    records_count = COUNT_STRATEGIES[count_strategy](model, count_query)
+    first_page = f'{pages_url}page=1&limit={limit}'
     pages_count = ceil(records_count / limit)
 
     meta_message = None
 
-    if current_page_count > pages_count:
-        # If current current_page_count > pages_count set current_page_count to pages_count
-        current_page_count = pages_count
-        first_page = f'{base_url}?page=1&limit={limit}'
-        current_page_url = f'{base_url}?page={pages_count}&limit={limit}'
+    # The last page of no records is the first, empty, one
+    last_page_count = max(pages_count, 1)
+
+    # An estimated count may be lower than the actual one so the requested
+    # page is not clamped to it
+    if current_page_count > last_page_count and count_strategy != ESTIMATED:
+        # Returns the last page when the requested one is beyond it
+        current_page_count = last_page_count
+        first_page = f'{pages_url}page=1&limit={limit}'
+        current_page_url = f'{pages_url}page={last_page_count}&limit={limit}'
         meta_message = serialization_errors['last_page_returned']
 
     offset = (current_page_count - 1) * limit
 
-    records = records_query.offset(offset).limit(limit)
+    records = records_query.page(offset, limit)
 
     # pagination meta object
     pagination_object = {
@@ -117,14 +490,15 @@ def pagination_helper(model, schema, extra_query=None):
         "previousPage": "",
         "page": current_page_count,
         "pagesCount": pages_count,
-        "totalCount": records_count
+        "totalCount": records_count,
+        "countStrategy": count_strategy
     }
 
     previous_page_count = current_page_count - 1
     next_page_count = current_page_count + 1
 
-    next_page_url = f'{base_url}?page={next_page_count}&limit={limit}'
-    previous_page_url = f'{base_url}?page={previous_page_count}&limit={limit}'  # noqa
+    next_page_url = f'{pages_url}page={next_page_count}&limit={limit}'
+    previous_page_url = f'{pages_url}page={previous_page_count}&limit={limit}'  # noqa
 
     if current_page_count > 1:
         # if current_page_count > 1 there should be a previous page url
@@ -137,6 +511,6 @@ def pagination_helper(model, schema, extra_query=None):
     if meta_message:
         pagination_object['message'] = meta_message
 
-    data = schema(many=True, exclude=EXCLUDED_FIELDS).dump(records).data
+    data = serializer(records)
 
     return data, pagination_object
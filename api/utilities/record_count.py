@@ -0,0 +1,110 @@
+"""Module for counting the records of paginated queries"""
+
+from flask import current_app
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from .cache import ExpiringCache
+
+EXACT = 'exact'
+ESTIMATED = 'estimated'
+CACHED = 'cached'
+
+
+def compile_query(query):
+    """Compiles the statement of a query for the dialect of its session"""
+    return query.statement.compile(dialect=query.session.get_bind().dialect)
+
+
+class Explain(Executable, ClauseElement):
+    """An EXPLAIN statement of a select, rendered with its bound parameters"""
+
+    def __init__(self, statement, analyze=False, json_format=False):
+        self.statement = statement
+        self.analyze = analyze
+        self.json_format = json_format
+
+
+@compiles(Explain, 'postgresql')
+def compile_explain(element, compiler, **kwargs):
+    """Renders an Explain statement for postgres"""
+    options = []
+    if element.analyze:
+        options.append('ANALYZE')
+    if element.json_format:
+        options.append('FORMAT JSON')
+    options = f' ({", ".join(options)})' if options else ''
+
+    return f'EXPLAIN{options} {compiler.process(element.statement, **kwargs)}'
+
+
+class CountCache(ExpiringCache):
+    """
+    A per process cache of record counts keyed by the filters of the query.
+
+    Entries expire after the configured ttl and are dropped as soon as a
+    record of the counted model is saved, updated or deleted through
+    ModelOperations.
+    """
+
+    @staticmethod
+    def signature(table_name, query):
+        """
+        Returns the cache key of a query, ie the counted table, the compiled
+        sql, or the cache key of a baked query, and its parameters.
+        """
+        cache_key = getattr(query, 'cache_key', None)
+        if cache_key is not None:
+            params = query.params
+        else:
+            compiled = compile_query(query)
+            cache_key, params = str(compiled), compiled.params
+        params = sorted((key, repr(value)) for key, value in params.items())
+        return table_name, cache_key, tuple(params)
+
+    def invalidate(self, table_name):
+        """Drops every cached count of a table"""
+        with self.lock:
+            for key in [key for key in self.entries if key[0] == table_name]:
+                del self.entries[key]
+
+
+count_cache = CountCache()
+
+
+def exact_count(model, query):
+    """Returns the exact number of records matched by the query"""
+    return query.count()
+
+
+def estimated_count(model, query):
+    """
+    Returns the postgres planner's estimate of the number of records matched
+    by the query. The query is explained but never executed.
+    """
+    statement = query.enable_eagerloads(False).order_by(None).statement
+    plan = query.session.execute(Explain(statement, json_format=True)).scalar()
+
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def cached_count(model, query):
+    """
+    Returns the exact number of records matched by the query, served from
+    the count cache when the same filters were counted recently.
+    """
+    key = count_cache.signature(model.__tablename__, query)
+    count = count_cache.get(key)
+
+    if count is None:
+        count = query.count()
+        count_cache.set(key, count, current_app.config['COUNT_CACHE_TTL'])
+
+    return count
+
+
+COUNT_STRATEGIES = {
+    EXACT: exact_count,
+    ESTIMATED: estimated_count,
+    CACHED: cached_count,
+}
@@ -0,0 +1,147 @@
+"""Module for the Core read path of the models"""
+
+from sqlalchemy import bindparam, false, func, select
+from sqlalchemy.util import LRUCache
+
+from ..middlewares.base_validator import ValidationError
+from ..models.database import db
+from .cache import ExpiringCache
+from .dynamic_filter import DynamicFilter
+from .messages.error_messages import serialization_errors
+from .timing import timed
+
+# Selects of the rows of the models keyed by the cache key of their
+# RowsQuery and the key they are derived under
+row_selects = ExpiringCache(max_entries=1024)
+
+# Compiled forms of the cached selects, shared by the connections so that a
+# select is compiled once per process. Keyed by the select object itself,
+# which is why only the cached selects are executed with it.
+compiled_selects = LRUCache(1024)
+
+
+class RowsQuery:
+    """
+    The non deleted rows of a model matching the where query strings and
+    the column filters, read with Core selects.
+
+    The rows are lightweight tuples, whose values are also accessible by
+    column name, which are neither hydrated into model instances nor kept
+    in the identity map of the session. Use it for read only views.
+
+    Requests filtering the same columns with the same operators and
+    selecting the same columns share the selects, and their compiled forms,
+    only the values of their parameters change.
+    """
+
+    def __init__(self, model, filter_condition=None, columns=None,
+                 filters=None):
+        """
+        Constructor to initialize an instance of the class.
+        :param model: the model whose rows are read
+        :param filter_condition: the where query strings, see DynamicFilter
+        :param columns: the names of the selected columns, every non
+        deferred column by default
+        :param filters: the values of the columns of the rows, eg
+        {'asset_category_id': '-LHYVNP2yx8oIOJFzXS4'}
+        """
+        plan, self.params = None, {}
+        if filter_condition:
+            with timed('filter'):
+                plan, self.params = DynamicFilter(model).plan(filter_condition)
+
+        table = model.__table__
+        filters = filters or {}
+        filter_keys = tuple(sorted(filters))
+        columns = tuple(columns) if columns else None
+        # Raise a validation error if the filtered or selected columns are
+        # not part of the table
+        if not set(filter_keys + (columns or ())).issubset(table.c.keys()):
+            raise ValidationError({
+                'message': serialization_errors['invalid_field']
+            })
+        self.params.update(
+            {f'filter_{key}': filters[key]
+             for key in filter_keys})
+
+        self.cache_key = (model.__name__, plan.signature
+                          if plan else None, columns, filter_keys)
+
+        def build():
+            if columns:
+                selected = [table.c[name] for name in columns]
+            else:
+                selected = [
+                    prop.columns[0]
+                    for prop in model.__mapper__.column_attrs
+                    if not prop.deferred
+                ]
+            statement = select(selected).where(table.c.deleted == false())
+            for key in filter_keys:
+                statement = statement.where(
+                    table.c[key] == bindparam(f'filter_{key}'))
+            if plan:
+                statement = statement.where(plan.clause)
+            return statement
+
+        self.select = self.derive(None, build)
+
+    def derive(self, key, build):
+        """
+        Returns the select built from the select of the rows by build, eg a
+        page of them, cached under key along the cache key of the rows
+        """
+
+        cache_key = (self.cache_key, key)
+        statement = row_selects.get(cache_key)
+        if statement is None:
+            statement = build() if key is None else build(self.select)
+            row_selects.set(cache_key, statement)
+        return statement
+
+    def execute(self, statement, **params):
+        """
+        Executes a select cached by derive with the parameters of the rows
+        and params, and returns its result
+        """
+
+        connection = db.session.connection().execution_options(
+            compiled_cache=compiled_selects)
+        return connection.execute(statement, dict(self.params, **params))
+
+    def all(self):
+        """Returns every row"""
+        return self.execute(self.select).fetchall()
+
+    def count(self):
+        """Returns the number of rows"""
+        statement = self.derive(
+            'count', lambda rows: select([func.count()]).select_from(
+                rows.alias()))
+        return self.execute(statement).scalar()
+
+    def page(self, offset, limit):
+        """Returns the rows of a page"""
+        statement = self.derive(
+            'page', lambda rows: rows.offset(bindparam('page_offset')).limit(
+                bindparam('page_limit')))
+        return self.execute(
+            statement, page_offset=offset, page_limit=limit).fetchall()
+
+    def stream(self, batch_size):
+        """
+        Generator of the rows, read from a server side cursor in batches of
+        batch_size
+        """
+
+        connection = db.session.connection().execution_options(
+            compiled_cache=compiled_selects, stream_results=True)
+        result = connection.execute(self.select, self.params)
+        try:
+            while True:
+                rows = result.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            result.close()
@@ -0,0 +1,34 @@
+"""
+Module for the named timings of the current request, reported by the
+request instrumentation, see api/middlewares/instrumentation.py, in its
+Server-Timing header.
+"""
+
+from contextlib import contextmanager
+from time import perf_counter
+
+from flask import g, has_request_context
+
+
+def is_instrumented():
+    """Returns True in an instrumented request"""
+    return has_request_context() and 'request_timings' in g
+
+
+@contextmanager
+def timed(name):
+    """
+    Adds the time spent in the block to the timing of the current request
+    named name, eg with timed('dump'): ...
+    Does nothing outside of an instrumented request.
+    """
+
+    if not is_instrumented():
+        yield
+        return
+
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        g.request_timings[name] += perf_counter() - started
@@ -1,6 +1,7 @@
 """Module for validating asset input data"""
 from ...models import AssetCategory, Asset
 from ...middlewares.base_validator import ValidationError
+from ..attribute_spec import get_attribute_spec, get_attribute_specs
 from ..model_serializers.asset import AssetSchema
 from ..messages.error_messages import serialization_errors
 from .validate_id import is_valid_id
@@ -24,31 +25,39 @@ def validate_attributes(asset_category, request_data, edit):
                 409)
 
     if 'customAttributes' in request_data:
-        required_attributes = asset_category.attributes.filter_by(
-            deleted=False, is_required=True).all()
-        all_attributes = asset_category.attributes.filter_by(
-            deleted=False).all()
-        required_attribute_keys = [
-            attribute._key for attribute in required_attributes  #pylint: disable=W0212
-        ]
-        attribute_keys = [attribute._key for attribute in all_attributes]  #pylint: disable=W0212
-
-        for request_attribute in request_data['customAttributes']:
-            if request_attribute not in attribute_keys:
-                raise ValidationError(
-                    dict(message=serialization_errors['unrelated_attribute']
-                         .format(request_attribute)),
-                    400)
-
-            if request_attribute in required_attribute_keys:
-                required_attribute_keys.remove(request_attribute)
-
-        if required_attribute_keys:
-            for attr in required_attribute_keys:
-                raise ValidationError(
-                    dict(message=serialization_errors['attribute_required']
-                         .format(attr)),
-                    400)
+        validate_custom_attributes(request_data['customAttributes'],
+                                   get_attribute_spec(asset_category.id))
+
+
+def validate_custom_attributes(request_attributes, attribute_spec):
+    """Helper function to validate the custom attributes of an asset, their
+    keys and the values of their input controls
+
+    :param request_attributes: The custom attributes of the request data
+    :param attribute_spec: The AttributeSpec of the asset category
+    """
+
+    if not isinstance(request_attributes, dict):
+        raise ValidationError(
+            dict(message=serialization_errors['json_invalid']), 400)
+
+    for request_attribute, value in request_attributes.items():
+        if request_attribute not in attribute_spec.keys:
+            raise ValidationError(
+                dict(message=serialization_errors['unrelated_attribute']
+                     .format(request_attribute)),
+                400)
+
+        attribute_spec.value_validators[request_attribute](request_attribute,
+                                                           value)
+
+    missing_attribute_keys = attribute_spec.required_keys.difference(
+        request_attributes)
+    if missing_attribute_keys:
+        raise ValidationError(
+            dict(message=serialization_errors['attribute_required'].format(
+                min(missing_attribute_keys))),
+            400)
 
 
 def asset_data_validators(request, edit):
@@ -84,3 +93,117 @@ def asset_data_validators(request, edit):
     asset_schema = AssetSchema()
 
     return asset_schema.load_object_into_schema(request_data)
+
+
+def bulk_asset_data_validators(assets_data):
+    """Data validation helper for the bulk asset import endpoint.
+
+    Asset categories, the attributes missing from the attribute spec cache
+    and existing tags are loaded with a query each for the whole import
+    instead of per asset.
+
+    :param assets_data: The assets to import, as they would be posted to the
+                        asset POST endpoint
+    :type assets_data: list
+
+    :return: A tuple of the (row, deserialized asset data) of the valid
+             assets and the errors of the invalid ones. Rows are numbered
+             from 1.
+    """
+
+    # The rows which are not objects are reported by validate_bulk_asset
+    objects = [
+        asset_data for asset_data in assets_data
+        if isinstance(asset_data, dict)
+    ]
+    category_ids = {
+        asset_data.get('assetCategoryId')
+        for asset_data in objects
+        if isinstance(asset_data.get('assetCategoryId'), str)
+        and is_valid_id(asset_data['assetCategoryId'])
+    }
+    tags = [
+        asset_data['tag'] for asset_data in objects
+        if isinstance(asset_data.get('tag'), str)
+    ]
+
+    asset_category_ids = [
+        asset_category_id for asset_category_id, in AssetCategory.query
+        .with_entities(AssetCategory.id).filter(
+            AssetCategory.id.in_(category_ids),
+            AssetCategory.deleted.is_(False))
+    ] if category_ids else []
+    existing_tags = {
+        tag
+        for tag, in Asset.query.with_entities(Asset.tag).filter(
+            Asset.tag.in_(tags))
+    } if tags else set()
+
+    attribute_specs = get_attribute_specs(asset_category_ids)
+
+    asset_schema = AssetSchema()
+    valid_assets, errors = [], []
+
+    for row, asset_data in enumerate(assets_data, 1):
+        try:
+            validate_bulk_asset(asset_data, attribute_specs, existing_tags)
+            valid_assets.append(
+                (row, asset_schema.load_object_into_schema(asset_data)))
+            existing_tags.add(asset_data['tag'])
+        except ValidationError as error:
+            row_error = dict(row=row, **error.error)
+            del row_error['status']
+            errors.append(row_error)
+
+    return valid_assets, errors
+
+
+def validate_bulk_asset(asset_data, attribute_specs, existing_tags):
+    """Helper function to validate an asset of a bulk import
+
+    :param asset_data: The asset data
+    :param attribute_specs: The AttributeSpecs of the imported asset
+                            categories keyed by their id
+    :param existing_tags: The tags already taken
+    """
+
+    if not isinstance(asset_data, dict):
+        raise ValidationError(
+            dict(message=serialization_errors['json_invalid']), 400)
+
+    if 'assetCategoryId' not in asset_data:
+        raise ValidationError({
+            "message":
+            serialization_errors["key_error"].format("assetCategoryId")
+        }, 400)
+
+    if not isinstance(asset_data['assetCategoryId'], str) or \
+            not is_valid_id(asset_data['assetCategoryId']):
+        raise ValidationError(
+            {
+                "message": serialization_errors["invalid_category_id"]
+            }, 400)
+
+    if asset_data['assetCategoryId'] not in attribute_specs:
+        raise ValidationError({
+            'message':
+            serialization_errors['not_found'].format('Asset category')
+        }, 404)
+
+    if not isinstance(asset_data.get('tag'), str) or \
+            not asset_data['tag'].strip():
+        raise ValidationError(
+            dict(message=serialization_errors['attribute_required'].format(
+                'tag')),
+            400)
+
+    if asset_data['tag'] in existing_tags:
+        raise ValidationError(
+            dict(message=serialization_errors['duplicate_asset'].format(
+                asset_data['tag'])),
+            409)
+
+    if 'customAttributes' in asset_data:
+        validate_custom_attributes(
+            asset_data['customAttributes'],
+            attribute_specs[asset_data['assetCategoryId']])
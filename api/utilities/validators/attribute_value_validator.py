@@ -0,0 +1,77 @@
+"""Module for validating the values of the custom attributes of assets"""
+from datetime import datetime
+
+from api.utilities.enums import InputControlChoiceEnum
+from ...middlewares.base_validator import ValidationError
+from ..messages.error_messages import serialization_errors
+
+# Format of the values of the date input controls, as filtered by the
+# dynamic filter
+ATTRIBUTE_DATE_FORMAT = '%Y-%m-%d'
+
+
+def raise_invalid_value(key, expected):
+    """Raises the error of a value which is not of the expected kind"""
+
+    raise ValidationError(
+        dict(message=serialization_errors['attribute_value'].format(
+            key, expected)),
+        400)
+
+
+def validate_text(key, value):
+    """Checks that a text value is a string or a number"""
+
+    if isinstance(value, bool) or \
+            not isinstance(value, (str, int, float)):
+        raise_invalid_value(key, 'a text')
+
+
+def validate_date(key, value):
+    """Checks that a date value is a YYYY-MM-DD string"""
+
+    try:
+        datetime.strptime(value, ATTRIBUTE_DATE_FORMAT)
+    except (TypeError, ValueError):
+        raise_invalid_value(key, 'a date in the YYYY-MM-DD format')
+
+
+def choice_validator(choices, multiple):
+    """
+    Returns the validator of the values of an input control with choices,
+    a list of choices is accepted if multiple is true
+    """
+
+    def validate_choice(key, value):
+        """Checks that a value is one or more of the choices"""
+
+        values = value if multiple and isinstance(value, list) else [value]
+        for choice in values:
+            if not isinstance(choice, str) or choice.lower() not in choices:
+                raise ValidationError(
+                    dict(message=serialization_errors['attribute_choice']
+                         .format(key, ', '.join(sorted(choices)))),
+                    400)
+
+    return validate_choice
+
+
+def compile_value_validator(input_control, choices):
+    """
+    Returns the function validating the values of an attribute, called with
+    the attribute key and the value
+
+    :param input_control: The lower cased input control of the attribute
+    :param choices: The frozenset of the choices of the attribute, if any
+    """
+
+    if input_control == InputControlChoiceEnum.DATE.value:
+        return validate_date
+
+    if input_control in InputControlChoiceEnum.get_multichoice_fields() \
+            and choices:
+        return choice_validator(
+            choices,
+            multiple=input_control == InputControlChoiceEnum.CHECKBOX.value)
+
+    return validate_text
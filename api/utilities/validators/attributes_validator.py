@@ -22,8 +22,10 @@ def validate_choices_after_dump(data):
     Returns: None
     """
 
-    if not data['choices'] or data['choices'] == ['']:
-        del data['choices']
+    choices = data.get('choices')
+    if not choices or choices == ['']:
+        # The choices may be excluded from the dump
+        data.pop('choices', None)
     else:
         data['choices'] = data['choices'][0].split(',')
 
@@ -5,5 +5,6 @@ from .asset import AssetResource
 from .asset_category_csv import ExportAssetCategories
 from .asset_csv import ExportAssets
 from .center import CenterResource
+from .export_job import ExportJobResource
 from .user import UserResource
 from .role import RoleResource
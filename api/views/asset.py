@@ -2,7 +2,7 @@
 from datetime import datetime
 
 from flask_restplus import Resource
-from flask import request, jsonify
+from flask import request, jsonify, current_app
 from werkzeug.datastructures import ImmutableMultiDict
 
 from api.middlewares.token_required import token_required
@@ -16,11 +16,15 @@ from api.middlewares.base_validator import ValidationError
 from api.utilities.messages.error_messages import serialization_errors
 from api.utilities.messages.success_messages import SUCCESS_MESSAGES
 from api.utilities.validators.validate_id import validate_id
-from api.utilities.validators.asset_validator import asset_data_validators
+from api.utilities.validators.asset_validator import (
+    asset_data_validators, bulk_asset_data_validators)
 from main import api
 from ..utilities.validators.validate_json_request import validate_json_request
-from ..utilities.helpers.asset_endpoints import create_asset_response
+from ..utilities.helpers.asset_endpoints import (create_asset_response,
+                                                 parse_bulk_assets)
 from api.utilities.paginator import pagination_helper
+from api.utilities.model_serializers.schema_registry import schemas
+from ..utilities.helpers.asset_search import search_assets
 from api.utilities.messages.error_messages import filter_errors
 from api.utilities.constants import EXCLUDED_FIELDS
 
@@ -65,14 +69,67 @@ class AssetResource(Resource):
         })
 
 
+@api.route('/assets/bulk')
+class BulkAssetResource(Resource):
+    """
+    Resource class for importing assets in bulk
+    """
+
+    @token_required
+    def post(self):  #pylint: disable=R0201
+        """
+        An endpoint that imports a JSON array or a CSV file of assets
+        """
+        # parse_bulk_assets function parses the JSON array or CSV file
+        assets_data = parse_bulk_assets(request)
+        valid_assets, errors = bulk_asset_data_validators(assets_data)
+
+        created_by = request.decoded_token['UserInfo']['id']
+        created_at = datetime.utcnow()
+        assets, asset_rows = [], {}
+
+        for row, asset_data in valid_assets:
+            asset = Asset(
+                created_by=created_by, created_at=created_at, **asset_data)
+            assets.append(asset)
+            asset_rows[id(asset)] = row
+
+        failed_assets = Asset.bulk_save(
+            assets, current_app.config['ASSET_IMPORT_CHUNK_SIZE'])
+
+        for asset in failed_assets:
+            errors.append(
+                dict(
+                    row=asset_rows[id(asset)],
+                    message=serialization_errors['bulk_import_chunk_failed']))
+
+        created_count = len(assets) - len(failed_assets)
+
+        return {
+            'status': 'success' if created_count else 'error',
+            'message': SUCCESS_MESSAGES['assets_imported'].format(
+                created_count, len(assets_data)),
+            'data': {
+                'createdCount': created_count,
+                'failedCount': len(errors)
+            },
+            'errors': sorted(errors, key=lambda error: error['row'])
+        }, 201 if created_count else 400
+
+
 @api.route('/assets/search')
 class SearchAssetResource(Resource):
     @token_required
     def get(self):
         """
-        Search Asset by date and warranty
+        Search Asset by date and warranty, and by the words of their tag,
+        serial, category name and custom attribute values given the q query
+        string, in which case the assets are ranked and paginated
         """
-        qry_keys = ('start', 'end', 'warranty_start', 'warranty_end')
+        filter_keys = ('start', 'end', 'warranty_start', 'warranty_end')
+        qry_keys = filter_keys
+        if 'q' in request.args:
+            qry_keys += ('q', 'page', 'limit', 'count', 'fields')
         qry_dict = dict(request.args)
 
         for key in qry_dict:
@@ -96,13 +153,34 @@ class SearchAssetResource(Resource):
             qry_list.append(('where', f'warranty,le,{warranty_end}'))
 
         args = ImmutableMultiDict(qry_list)
+
+        search_query = request.args.get('q')
+        if search_query is not None:
+            # the pages keep the filters of the search
+            link_args = {'q': search_query}
+            link_args.update((key, request.args[key]) for key in filter_keys
+                             if key in request.args)
+            data, pagination_object = pagination_helper(
+                Asset,
+                AssetSchema,
+                records=search_assets(search_query, args),
+                link_args=link_args)
+
+            return {
+                'status': 'success',
+                'message': 'Assets fetched successfully',
+                'data': data,
+                'meta': pagination_object
+            }, 200
+
         assets = Asset._query(args)
 
-        asset_schema = AssetSchema(many=True, exclude=EXCLUDED_FIELDS)
+        asset_serializer = schemas.serializer(
+            AssetSchema, exclude=EXCLUDED_FIELDS)
 
         return {
             'status': 'success',
-            'data': asset_schema.dump(assets).data
+            'data': asset_serializer(assets)
         }, 200
 
 
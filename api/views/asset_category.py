@@ -11,6 +11,7 @@ from api.utilities.model_serializers.asset_category import (
     AssetCategorySchema, UpdateAssetCategorySchema,
     EagerLoadAssetCategoryAttributesSchema)
 from ..utilities.model_serializers.asset import AssetSchema
+from ..utilities.model_serializers.schema_registry import schemas
 from api.utilities.model_serializers.attribute import (AttributeSchema,
                                                        UpdateAttributeSchema)
 from api.middlewares.base_validator import ValidationError
@@ -18,6 +19,12 @@ from api.utilities.validators.validate_id import validate_id
 from api.utilities.messages.error_messages import serialization_errors
 from ..utilities.validators.validate_json_request import validate_json_request
 from ..utilities.constants import EXCLUDED_FIELDS
+from ..utilities.attribute_spec import invalidate_attribute_specs
+from ..utilities.helpers.asset_category_stats import (
+    get_asset_category_stats, get_assets_counts, validate_breakdown)
+from ..utilities.helpers.include_expansion import (
+    ASSET_CATEGORY_EXPANSIONS, ASSET_CATEGORY_INCLUDE_FIELDS, ASSETS_COUNT,
+    ATTRIBUTES, expand_query, parse_include)
 
 
 @api.route('/asset-categories')
@@ -56,6 +63,7 @@ class AssetCategoryResource(Resource):
             })
 
         asset_category = asset_category.save()
+        invalidate_attribute_specs(asset_category.id)
 
         response = jsonify({
             "status": 'success',
@@ -79,16 +87,17 @@ class AssetCategoryStats(Resource):
     @token_required
     def get(self):
         """
-        Gets asset categories and the corresponding asset count
+        Gets asset categories and the corresponding asset count.
+
+        The breakdown query string, eg ?breakdown=center,deleted, adds the
+        count of the assets of each center and of the deleted assets
         """
+        breakdown = validate_breakdown(request.args.get('breakdown'))
         asset_categories = AssetCategory._query(request.args)
 
-        asset_category_schema = AssetCategorySchema(
-            many=True, exclude=['deleted'])
-
         return {
             'status': 'success',
-            'data': asset_category_schema.dump(asset_categories).data
+            'data': get_asset_category_stats(asset_categories, breakdown)
         }
 
 
@@ -100,23 +109,30 @@ class AssetCategoryListResource(Resource):
     @validate_id
     def get(self, id):
         """
-        Get a single asset category
+        Get a single asset category and the expansions of the include query
+        string, eg ?include=assets_count,attributes, its attributes by
+        default
         """
 
-        single_category = AssetCategory.get_or_404(id)
-
-        attributes_schema = AttributeSchema(
-            many=True, exclude=['choices', 'id', 'deleted'])
-
-        return {
-            'status': 'success',
-            'data': {
-                'name':
-                single_category.name,
-                'customAttributes':
-                attributes_schema.dump(single_category.attributes).data
-            }
-        }, 200
+        include = parse_include(
+            request.args.get('include'),
+            ASSET_CATEGORY_EXPANSIONS,
+            default=(ATTRIBUTES, ))
+        single_category = AssetCategory.get_or_404(
+            id,
+            expand_query(AssetCategory.query, include,
+                         ASSET_CATEGORY_EXPANSIONS))
+
+        data = {'name': single_category.name}
+        if ATTRIBUTES in include:
+            attributes_serializer = schemas.serializer(
+                AttributeSchema, exclude=['choices', 'id', 'deleted'])
+            data['customAttributes'] = attributes_serializer(
+                single_category.eager_loaded_attributes)
+        if ASSETS_COUNT in include:
+            data['assetsCount'] = single_category.assets_count
+
+        return {'status': 'success', 'data': data}, 200
 
     @token_required
     @validate_json_request
@@ -151,6 +167,7 @@ class AssetCategoryListResource(Resource):
                     id=attribute.get('id')).first()
                 if attribute_result:
                     attribute_result._update(**attribute)
+            invalidate_attribute_specs(asset_category.id)
 
         attributes = attributes_schema.dump(
             asset_category.attributes.all()).data
@@ -192,24 +209,30 @@ class AssetCategoryList(Resource):
     @token_required
     def get(self):
         """
-        Gets list of asset categories and the corresponding asset count
+        Gets list of asset categories and the expansions of the include
+        query string, eg ?include=assets_count,attributes, their assets
+        count by default
         """
-        asset_categories_schema = AssetCategorySchema(
-            many=True, exclude=['deleted'])
+        include = parse_include(
+            request.args.get('include'),
+            ASSET_CATEGORY_EXPANSIONS,
+            default=(ASSETS_COUNT, ))
+        asset_categories = AssetCategory._query(request.args)
 
-        if request.args:
-            include = request.args.get('include')
-            if include and include.lower() == 'attributes':
-                asset_categories = AssetCategory._query()
-                eager_loaded_schema = EagerLoadAssetCategoryAttributesSchema(
-                    many=True, exclude=['deleted'])
-                data = eager_loaded_schema.dump(asset_categories).data
-            else:
-                asset_categories = AssetCategory._query(request.args)
-                data = asset_categories_schema.dump(asset_categories).data
+        if include == {ASSETS_COUNT}:
+            data = get_asset_category_stats(asset_categories)
         else:
-            asset_categories = AssetCategory._query()
-            data = asset_categories_schema.dump(asset_categories).data
+            context = {}
+            if ASSETS_COUNT in include:
+                context['assets_counts'] = get_assets_counts(asset_categories)
+            eager_loaded_schema = EagerLoadAssetCategoryAttributesSchema(
+                many=True,
+                only=['id', 'name'] +
+                [ASSET_CATEGORY_INCLUDE_FIELDS[name] for name in include],
+                context=context)
+            data = eager_loaded_schema.dump(
+                expand_query(asset_categories, include,
+                             ASSET_CATEGORY_EXPANSIONS)).data
 
         return {'status': 'success', 'data': data}
 
@@ -228,9 +251,10 @@ class AssetCategoryAsset(Resource):
         """
 
         asset_category = AssetCategory.get_or_404(id)
-        assets = AssetSchema(
-            many=True, exclude=EXCLUDED_FIELDS).dump(
-                asset_category.assets.filter_by(deleted=False)).data
+        asset_rows = Asset._query_rows(  #pylint: disable=W0212
+            asset_category_id=asset_category.id)
+        assets = schemas.serializer(
+            AssetSchema, exclude=EXCLUDED_FIELDS)(asset_rows.all())
 
         return {
             'status':
@@ -6,6 +6,7 @@ from main import api
 from api.utilities.validators.validate_id import validate_id
 from ..models.asset_category import AssetCategory
 from ..utilities.model_serializers.attribute import AttributeSchema
+from ..utilities.model_serializers.schema_registry import schemas
 from ..middlewares.token_required import token_required
 from ..utilities.validators.validate_json_request import validate_json_request
 
@@ -21,9 +22,10 @@ class AssetCategoryAttributes(Resource):
 
         asset_category = AssetCategory.get_or_404(id)
 
-        attributes_schema = AttributeSchema(many=True, exclude=['deleted'])
-        attributes = attributes_schema.dump(
-            asset_category.attributes.filter_by(deleted=False)).data
+        attributes_serializer = schemas.serializer(
+            AttributeSchema, exclude=['deleted'])
+        attributes = attributes_serializer(
+            asset_category.attributes.filter_by(deleted=False))
 
         return {
             'status': 'success',
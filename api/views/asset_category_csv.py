@@ -2,13 +2,14 @@
 
 from datetime import date
 
-import flask_excel as excel
 from flask import request
 from flask_restplus import Resource
 
 from main import api
 from ..middlewares.token_required import token_required
 from ..models.asset_category import AssetCategory
+from ..utilities.helpers.asset_category_stats import asset_counts_query
+from ..utilities.helpers.csv_export import make_csv_response
 
 
 @api.route('/asset-categories/export')
@@ -21,9 +22,13 @@ class ExportAssetCategories(Resource):
     def get(self):
         """Download asset categories with their assets count"""
 
-        asset_categories = AssetCategory._query(request.args).all()
-        column_names = ['name', 'assets_count']
+        asset_categories = AssetCategory._query(request.args)
+        records = ({
+            'name': row.name,
+            'assets_count': row.assets_count
+        } for row in asset_counts_query(asset_categories))
 
-        return excel.make_response_from_query_sets(
-            asset_categories, column_names, 'csv',
+        return make_csv_response(
+            ['name', 'assets_count'],
+            records,
             file_name=f'Asset Categories Export - {date.today()}')
@@ -1,14 +1,11 @@
 """Module for center resources"""
 
-import os
-
-import cloudinary
-
 from flask_restplus import Resource
 from flask import request
 
 from main import api
 from api.middlewares.token_required import token_required
+from api.middlewares.plugins import plugins, IMAGE_STORAGE
 from api.utilities.model_serializers.center import CenterSchema
 from api.models.center import Center
 from api.models.database import db
@@ -58,18 +55,11 @@ class SingleCenterResource(Resource):
 
     @token_required
     @validate_id
+    @plugins.requires(IMAGE_STORAGE)
     def delete(self, id):  #pylint: disable=C0103, W0622
         """
         A method for deleting a center
         """
-        cloudinary.config.update = ({
-            'cloud_name':
-            os.environ.get('CLOUDINARY_CLOUD_NAME'),
-            'api_key':
-            os.environ.get('CLOUDINARY_API_KEY'),
-            'api_secret':
-            os.environ.get('CLOUDINARY_API_SECRET')
-        })
         center = Center.get_or_404(id)
         if not (center.assets.all() or center.users.all()):
             db.session.delete(center)
@@ -81,6 +71,7 @@ class SingleCenterResource(Resource):
                 deleted_by=request.decoded_token['UserInfo']['name'])
             message = SUCCESS_MESSAGES['soft_delete'].format(center.name)
 
+        cloudinary = plugins.get(IMAGE_STORAGE)
         cloudinary.api.delete_resources([center.image["public_id"]])
 
         return {
@@ -0,0 +1,164 @@
+"""Module for export job resources"""
+
+from datetime import date
+from os import path
+
+from flask import request, send_file
+from flask_restplus import Resource
+
+from main import api
+from ..middlewares.base_validator import ValidationError
+from ..middlewares.token_required import token_required
+from ..models.asset_category import AssetCategory
+from ..models.export_job import ExportJob
+from ..services.export_jobs import (ASSETS, ASSET_CATEGORIES, EXPORT_SOURCES,
+                                    get_asset_categories_query,
+                                    submit_export_job)
+from ..utilities.enums import ExportStatusEnum
+from ..utilities.messages.error_messages import serialization_errors
+from ..utilities.messages.success_messages import SUCCESS_MESSAGES
+from ..utilities.model_serializers.export_job import ExportJobSchema
+from ..utilities.validators.validate_id import is_valid_id, validate_id
+from ..utilities.validators.validate_json_request import validate_json_request
+
+
+def get_export_params(request_data):
+    """
+    Validates the body of an export request and returns the parameters and
+    file name of the export job
+    """
+
+    export_type = request_data.get('type')
+
+    if export_type == ASSETS:
+        asset_category_id = request_data.get('assetCategoryId')
+        if not isinstance(asset_category_id, str) or not is_valid_id(
+                asset_category_id):
+            raise ValidationError(
+                dict(message=serialization_errors['invalid_category_id']))
+        asset_category = AssetCategory.get_or_404(asset_category_id)
+
+        return ({
+            'assetCategoryId': asset_category.id
+        }, f'{asset_category.name} Assets Export')
+
+    if export_type == ASSET_CATEGORIES:
+        where = request_data.get('where', [])
+        if not isinstance(where, list) or not all(
+                isinstance(condition, str) for condition in where):
+            raise ValidationError(
+                dict(message=serialization_errors['export_where']))
+        params = {'where': where}
+        # builds the query so that invalid filters fail now rather than in
+        # the worker
+        get_asset_categories_query(params)
+
+        return params, 'Asset Categories Export'
+
+    raise ValidationError(
+        dict(message=serialization_errors['export_type'].format(
+            ', '.join(sorted(EXPORT_SOURCES)))))
+
+
+def get_user_export_job(id):
+    """Returns an export job of the current user"""
+
+    export_job = ExportJob.get_or_404(id)
+    if export_job.created_by != request.decoded_token['UserInfo']['id']:
+        raise ValidationError(
+            dict(message=serialization_errors['not_found'].format(
+                'Export job')), 404)
+
+    return export_job
+
+
+def dump_export_job(export_job):
+    """Serializes an export job with its download url once done"""
+
+    data = ExportJobSchema(exclude=['params']).dump(export_job).data
+    if export_job.status == ExportStatusEnum.DONE.value:
+        data['downloadUrl'] = api.url_for(
+            ExportJobDownload, id=export_job.id, _external=True)
+
+    return data
+
+
+@api.route('/exports')
+class ExportJobResource(Resource):
+    """
+    Resource class for creating export jobs
+    """
+
+    @token_required
+    @validate_json_request
+    def post(self):  #pylint: disable=R0201
+        """
+        Queues an export job and returns it without waiting for the file.
+
+        Payload should have the following parameters:
+            type(str): assets or asset-categories
+            assetCategoryId(str): the asset category of an assets export
+            where(list): the filters of an asset categories export
+        """
+
+        params, file_name = get_export_params(request.get_json())
+
+        export_job = ExportJob(
+            export_type=request.get_json()['type'],
+            params=params,
+            file_name=f'{file_name} - {date.today()}.csv',
+            created_by=request.decoded_token['UserInfo']['id'])
+        export_job.save()
+        submit_export_job(export_job)
+
+        return {
+            'status': 'success',
+            'message': SUCCESS_MESSAGES['export_queued'],
+            'data': dump_export_job(export_job)
+        }, 202
+
+
+@api.route('/exports/<string:id>')
+class SingleExportJobResource(Resource):
+    """
+    Resource class for getting the progress of an export job
+    """
+
+    @token_required
+    @validate_id
+    def get(self, id):  #pylint: disable=R0201,W0622
+        """Returns the status and progress of an export job"""
+
+        return {
+            'status': 'success',
+            'message': SUCCESS_MESSAGES['fetched'].format('Export job'),
+            'data': dump_export_job(get_user_export_job(id))
+        }, 200
+
+
+@api.route('/exports/<string:id>/download')
+class ExportJobDownload(Resource):
+    """
+    Resource class for downloading the file of an export job
+    """
+
+    @token_required
+    @validate_id
+    def get(self, id):  #pylint: disable=R0201,W0622
+        """Downloads the csv file of a done export job"""
+
+        export_job = get_user_export_job(id)
+        if export_job.status != ExportStatusEnum.DONE.value:
+            raise ValidationError(
+                dict(message=serialization_errors['export_not_done'].format(
+                    export_job.status)))
+        if not path.exists(export_job.file_path):
+            raise ValidationError(
+                dict(message=serialization_errors['not_found'].format(
+                    'Export file')), 404)
+
+        return send_file(
+            export_job.file_path,
+            mimetype='text/csv',
+            as_attachment=True,
+            attachment_filename=export_job.file_name)
@@ -4,6 +4,7 @@ from flask_restplus import Resource
 from flask import jsonify
 from main import api
 from api.utilities.model_serializers.role import RoleSchema
+from api.utilities.model_serializers.schema_registry import schemas
 from api.middlewares.token_required import token_required
 from ..models.role import Role
 from ..utilities.messages.success_messages import SUCCESS_MESSAGES
@@ -22,7 +23,8 @@ class RoleResource(Resource):
         """
 
         roles = Role._query().all()
-        roles_data = RoleSchema(
+        roles_data = schemas.get(
+            RoleSchema,
             many=True,
             only=['id', 'title'],
         ).dump(roles).data
@@ -0,0 +1,79 @@
+"""
+Benchmark of the parse and compile overhead of the DynamicFilter.
+
+Times, for 1 to 10 where filters on the assets, the parsing of the filters
+into their plan with an empty and a warm plan cache, and the fetch of the
+first page of the filtered assets through the built ORM query, compiled on
+every request, and through the Core select of their rows, compiled once.
+
+Usage:
+    FLASK_ENV=development python -m benchmarks.dynamic_filter --repeat 200
+"""
+
+import argparse
+from os import getenv
+from timeit import timeit
+
+from main import create_app
+from config import config
+from api.models import Asset
+from api.utilities.dynamic_filter import DynamicFilter, filter_plans
+from api.utilities.paginator import filtered_records_query
+
+FILTERS = (
+    'tag,like,BENCH/42',
+    'serial,like,C4CA',
+    'created_at,ge,2018-01-01',
+    'updated_at,le,2030-01-01',
+    'deleted,eq,false',
+    'asset_category_id,ne,-LEiS7lgOu3VmeEBg5cUtt',
+    'center_id,ne,-LEiS7lgOu3VmeEBg5cUtt',
+    'batch,eq,42',
+    'color,like,bl',
+    'warranty,ge,2018-01-01',
+)
+
+
+def time_us(function, repeat):
+    """Returns the mean time of a call of function in microseconds"""
+    return timeit(function, number=repeat) / repeat * 1e6
+
+
+def uncached_plan(query_string):
+    """Plans the filters of a query string with an empty plan cache"""
+    filter_plans.clear()
+    return DynamicFilter(Asset).plan(query_string)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    app = create_app(config[getenv('FLASK_ENV', default='development')])
+
+    print(f'{"filters":>7} | {"plan cold":>9} | {"plan warm":>9} | '
+          f'{"page query":>10} | {"page rows":>10}   (us per request)')
+
+    for count in range(1, len(FILTERS) + 1):
+        query_string = '&'.join(f'where={where}'
+                                for where in FILTERS[:count])
+
+        with app.test_request_context(f'/assets?{query_string}') as context:
+            where = context.request.args
+
+            cold = time_us(lambda: uncached_plan(where), args.repeat)
+            warm = time_us(lambda: DynamicFilter(Asset).plan(where),
+                           args.repeat)
+            query = time_us(
+                lambda: filtered_records_query(Asset).offset(0).limit(10)
+                .all(), args.repeat)
+            rows = time_us(lambda: Asset._query_rows(where).page(0, 10),
+                           args.repeat)
+
+        print(f'{count:>7} | {cold:>9.0f} | {warm:>9.0f} | {query:>10.0f} | '
+              f'{rows:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
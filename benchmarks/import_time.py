@@ -0,0 +1,164 @@
+"""
+Startup time budget of the application factory.
+
+Imports main and calls create_app in a fresh interpreter, then prints the
+total time taken, the peak memory of the process and the modules with the
+largest self and cumulative import times. Exits with an error when the total
+exceeds the budget, which CI checks in a step of its own.
+
+The import times are taken by a meta path finder timing the execution of the
+modules, as -X importtime needs python 3.7+.
+
+Usage:
+    python -m benchmarks.import_time --top 20 --budget-ms 2000
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict, namedtuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Times the execution of the modules found by the other finders of
+# sys.meta_path, printing 'import time: self us | cumulative us | module'
+# lines to stderr, as -X importtime does
+TIMING_FINDER = '''
+import sys
+from time import perf_counter
+
+
+class TimingFinder:
+    def __init__(self):
+        self.children_us = []
+        self.import_times = []
+
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is None:
+                continue
+            loader = spec.loader
+            # The builtin and frozen loaders are classes shared by modules
+            if loader is not None and not isinstance(loader, type) and \\
+                    hasattr(loader, 'exec_module'):
+                loader.exec_module = self.timed(name, loader.exec_module)
+            return spec
+        return None
+
+    def timed(self, name, exec_module):
+        def timed_exec_module(module):
+            self.children_us.append(0)
+            started = perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                cumulative_us = int((perf_counter() - started) * 1e6)
+                children_us = self.children_us.pop()
+                if self.children_us:
+                    self.children_us[-1] += cumulative_us
+                self.import_times.append(
+                    (name, cumulative_us - children_us, cumulative_us))
+        return timed_exec_module
+
+
+timing_finder = TimingFinder()
+sys.meta_path.insert(0, timing_finder)
+'''
+
+# Imports the application factory and prints the time taken in ms, the peak
+# resident memory in kB and the names of the modules then loaded
+PROBE = '''
+import resource
+import sys
+from time import perf_counter
+started = perf_counter()
+from main import create_app
+create_app()
+print((perf_counter() - started) * 1000)
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+print(' '.join(sorted(sys.modules)))
+'''
+
+PRINT_IMPORT_TIMES = '''
+for module, self_us, cumulative_us in timing_finder.import_times:
+    print(f'import time: {self_us} | {cumulative_us} | {module}',
+          file=sys.stderr)
+'''
+
+StartUp = namedtuple('StartUp',
+                     ['elapsed_ms', 'max_rss_kb', 'modules', 'import_times'])
+
+
+def measure_create_app(import_times=False):
+    """
+    Returns the StartUp of a fresh interpreter importing main and creating
+    the app: the time taken in ms, the peak resident memory in kB, the
+    modules then loaded and, with import_times, the (module, self us,
+    cumulative us) import times
+    """
+
+    probe = PROBE
+    if import_times:
+        probe = TIMING_FINDER + PROBE + PRINT_IMPORT_TIMES
+    env = dict(os.environ)
+    env.setdefault('FLASK_ENV', 'testing')
+    result = subprocess.run(
+        [sys.executable, '-c', probe],
+        cwd=ROOT_DIR,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True)
+
+    elapsed_ms, max_rss_kb, modules = result.stdout.strip().split('\n')[-3:]
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split(
+            '|')
+        times.append((module.strip(), int(self_us), int(cumulative_us)))
+
+    return StartUp(
+        float(elapsed_ms), int(max_rss_kb), set(modules.split()), times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--top', type=int, default=20)
+    parser.add_argument('--budget-ms', type=float, default=None)
+    args = parser.parse_args()
+
+    # The total is measured without the timing finder, which slows it down
+    start_up = measure_create_app()
+    import_times = measure_create_app(import_times=True).import_times
+    elapsed_ms = start_up.elapsed_ms
+
+    packages = defaultdict(int)
+    for module, self_us, _ in import_times:
+        packages[module.split('.')[0]] += self_us
+
+    print(f'{"self ms":>10} | package')
+    for package, self_us in sorted(
+            packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f'{self_us / 1000:>10.1f} | {package}')
+
+    print(f'\n{"cumul. ms":>10} | module')
+    for module, _, cumulative_us in sorted(
+            import_times, key=lambda item: -item[2])[:args.top]:
+        print(f'{cumulative_us / 1000:>10.1f} | {module}')
+
+    print(f'\nimport main and create_app: {elapsed_ms:.1f}ms, '
+          f'peak memory {start_up.max_rss_kb / 1024:.1f}MB')
+
+    if args.budget_ms is not None and elapsed_ms > args.budget_ms:
+        sys.exit(f'over the budget of {args.budget_ms:.0f}ms')
+
+
+if __name__ == '__main__':
+    main()
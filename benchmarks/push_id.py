@@ -0,0 +1,50 @@
+"""
+Microbenchmark of the PushID generator.
+
+Prints the number of ids generated per second with a new generator per id,
+as fancy_id_generator used to do, with a shared generator and, when
+available, in batches through next_ids.
+
+Usage:
+    python -m benchmarks.push_id --ids 200000
+"""
+
+import argparse
+from time import perf_counter
+
+from api.models.push_id import PushID
+
+BATCH_SIZE = 500
+
+
+def ids_per_second(generate, count):
+    """Returns the rate at which generate() produced count ids"""
+
+    started = perf_counter()
+    generated = 0
+    while generated < count:
+        generated += generate()
+    return generated / (perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--ids', type=int, default=200000)
+    args = parser.parse_args()
+
+    generator = PushID()
+    cases = [
+        ('new generator per id', lambda: len(PushID().next_id()) // 20),
+        ('shared generator', lambda: len(generator.next_id()) // 20),
+    ]
+    if hasattr(generator, 'next_ids'):
+        cases.append((f'next_ids({BATCH_SIZE})',
+                      lambda: len(generator.next_ids(BATCH_SIZE))))
+
+    for name, generate in cases:
+        print(f'{name:>24}: {ids_per_second(generate, args.ids):>12,.0f} '
+              'ids/sec')
+
+
+if __name__ == '__main__':
+    main()
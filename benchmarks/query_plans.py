@@ -0,0 +1,149 @@
+"""
+Benchmark of the query plans of the DynamicFilter hot paths.
+
+Seeds a migrated database with a large number of assets and prints the plan
+of every hot path query twice: once with the filter indexes dropped inside a
+rolled back transaction and once with the indexes in place.
+
+Usage:
+    FLASK_ENV=development python -m benchmarks.query_plans --assets 1000000
+"""
+
+import argparse
+from os import getenv
+
+from werkzeug.datastructures import ImmutableMultiDict
+
+from main import create_app
+from config import config
+from api.models import Asset, AssetCategory, Center
+from api.models.database import db
+from api.utilities.record_count import Explain
+
+SEED_CATEGORIES = 10
+SEED_CENTERS = 5
+
+
+def get_or_create(model, **kwargs):
+    """Returns the record of a model named kwargs['name'], adding it if new"""
+
+    record = model.query.filter_by(name=kwargs['name']).first()
+    if not record:
+        record = model(**kwargs)
+        db.session.add(record)
+        db.session.flush()
+    return record
+
+
+def seed_assets(count):
+    """Tops the asset table up to count rows with generated assets"""
+
+    existing = db.session.query(db.func.count(Asset.id)).scalar()
+    if existing >= count:
+        return
+
+    categories = [
+        get_or_create(AssetCategory, name=f'Benchmark Category {index}')
+        for index in range(SEED_CATEGORIES)
+    ]
+    centers = [
+        get_or_create(Center, name=f'Benchmark Center {index}', image={})
+        for index in range(SEED_CENTERS)
+    ]
+    db.session.commit()
+
+    db.session.execute(
+        '''
+        INSERT INTO asset (id, tag, serial, custom_attributes,
+                           asset_category_id, center_id, created_at, deleted)
+        SELECT 'bench' || lpad(i::text, 15, '0'),
+               'BENCH/' || i,
+               upper(substr(md5(i::text), 1, 12)),
+               jsonb_build_object('warranty', '2019-02-08',
+                                  'batch', i % 1000),
+               (:categories)[1 + i % :category_count],
+               (:centers)[1 + i % :center_count],
+               now() - (i || ' minutes')::interval,
+               i % 20 = 0
+        FROM generate_series(:start, :stop) AS i
+        ''', {
+            'categories': [category.id for category in categories],
+            'category_count': SEED_CATEGORIES,
+            'centers': [center.id for center in centers],
+            'center_count': SEED_CENTERS,
+            'start': existing + 1,
+            'stop': count
+        })
+    db.session.commit()
+    db.session.execute('ANALYZE')
+
+
+def hot_path_queries():
+    """
+    Returns the hot path queries as built by the api, without the page limit
+    as pagination counts every record they match
+    """
+
+    category = AssetCategory.query.first()
+    center = Center.query.first()
+    filters = {
+        'asset category': None,
+        'center': None,
+        'created_at eq': 'created_at,eq,2018-07-05',
+        'tag like': 'tag,like,BENCH/4242',
+        'serial like': 'serial,like,C4CA4238',
+        'custom attribute eq': 'batch,eq,42',
+    }
+
+    queries = {}
+    for name, where in filters.items():
+        args = ImmutableMultiDict([('where', where)] if where else [])
+        query = Asset._query(args).filter_by(deleted=False)
+        if name == 'asset category':
+            query = query.filter_by(asset_category_id=category.id)
+        elif name == 'center':
+            query = query.filter_by(center_id=center.id)
+        queries[name] = query
+
+    return queries
+
+
+def explain(query, analyze):
+    """Returns the plan of a query"""
+
+    rows = db.session.execute(Explain(query.statement, analyze=analyze))
+    return '\n'.join(f'    {row[0]}' for row in rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--assets', type=int, default=1000000)
+    parser.add_argument('--analyze', action='store_true',
+                        help='run EXPLAIN ANALYZE instead of EXPLAIN')
+    args = parser.parse_args()
+
+    app = create_app(config[getenv('FLASK_ENV', default='development')])
+
+    with app.app_context():
+        seed_assets(args.assets)
+        indexes = [
+            index.name for table in (Asset.__table__,
+                                     AssetCategory.__table__)
+            for index in table.indexes
+        ]
+
+        for name, query in hot_path_queries().items():
+            for index in indexes:
+                db.session.execute(f'DROP INDEX IF EXISTS {index}')
+            without_indexes = explain(query, args.analyze)
+            db.session.rollback()
+
+            with_indexes = explain(query, args.analyze)
+            db.session.rollback()
+
+            print(f'== {name}\n  without indexes:\n{without_indexes}\n'
+                  f'  with indexes:\n{with_indexes}\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark of the read path of the asset lists and exports.
+
+Times and traces the memory of a large page of assets and of an export of
+assets read as ORM instances, through the session and its identity map, and
+as Core rows, through Asset._query_rows, and reports the time and the peak
+memory per row.
+
+Usage:
+    FLASK_ENV=development python -m benchmarks.read_path --rows 10000
+"""
+
+import argparse
+import tracemalloc
+from os import getenv
+from time import perf_counter
+
+from main import create_app
+from config import config
+from api.models import Asset
+from api.models.database import db
+from api.utilities.constants import EXCLUDED_FIELDS
+from api.utilities.helpers.asset_export import (EXPORT_BATCH_SIZE,
+                                                get_asset_records,
+                                                get_asset_rows)
+from api.utilities.model_serializers.asset import AssetSchema
+from api.utilities.model_serializers.row_serializer import RowSerializer
+
+
+def measure(function):
+    """Returns the time in seconds and the peak traced memory of a call"""
+
+    db.session.remove()
+    tracemalloc.start()
+    started = perf_counter()
+    try:
+        function()
+        return perf_counter() - started, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        db.session.remove()
+
+
+def orm_records(asset_category_id):
+    """Generator of the csv records of assets read as ORM instances"""
+
+    assets = Asset.query.filter_by(
+        deleted=False,
+        asset_category_id=asset_category_id).yield_per(EXPORT_BATCH_SIZE)
+    for asset in assets:
+        record = dict(asset.custom_attributes or {})
+        record.update(
+            tag=asset.tag,
+            serial=asset.serial,
+            created_at=asset.created_at.date() if asset.created_at else None)
+        yield record
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rows', type=int, default=10000)
+    args = parser.parse_args()
+
+    app = create_app(config[getenv('FLASK_ENV', default='development')])
+
+    with app.app_context():
+        serializer = RowSerializer(
+            AssetSchema(many=True, exclude=EXCLUDED_FIELDS))
+        asset_category_id = db.session.query(Asset.asset_category_id).filter(
+            Asset.deleted.is_(False)).limit(1).scalar()
+        export_rows = get_asset_rows(asset_category_id).count()
+
+        cases = (
+            ('page, orm', args.rows, lambda: serializer(
+                Asset.query.filter_by(deleted=False).offset(0).limit(
+                    args.rows).all())),
+            ('page, rows', args.rows,
+             lambda: serializer(Asset._query_rows().page(0, args.rows))),
+            ('export, orm', export_rows,
+             lambda: sum(1 for _ in orm_records(asset_category_id))),
+            ('export, rows', export_rows, lambda: sum(
+                1 for _ in get_asset_records(
+                    get_asset_rows(asset_category_id)))),
+        )
+
+        print(f'{"":>12} | {"rows":>7} | {"us per row":>10} | '
+              f'{"peak bytes per row":>18}')
+        for name, count, function in cases:
+            elapsed, peak = measure(function)
+            print(f'{name:>12} | {count:>7} | {elapsed / count * 1e6:>10.1f} |'
+                  f' {peak / count:>18.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark of the serialization of pages of assets.
+
+Times the dump and the json encoding of a page of assets through the
+AssetSchema and through the RowSerializer compiled from it, over ORM
+instances and over Core rows, and reports the rows serialized per second.
+
+Usage:
+    FLASK_ENV=development python -m benchmarks.serializers --rows 10000
+"""
+
+import argparse
+import json
+from os import getenv
+from timeit import timeit
+
+from main import create_app
+from config import config
+from api.models import Asset
+from api.models.database import db
+from api.utilities.constants import EXCLUDED_FIELDS
+from api.utilities.model_serializers.asset import AssetSchema
+from api.utilities.model_serializers.row_serializer import RowSerializer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    app = create_app(config[getenv('FLASK_ENV', default='development')])
+
+    with app.app_context():
+        assets = Asset.query.filter_by(deleted=False).limit(args.rows).all()
+        rows = db.session.execute(Asset.__table__.select().where(
+            Asset.deleted.is_(False)).limit(args.rows)).fetchall()
+
+        schema = AssetSchema(many=True, exclude=EXCLUDED_FIELDS)
+        serializer = RowSerializer(schema)
+
+        assert json.dumps(serializer(assets)) == json.dumps(
+            schema.dump(assets).data)
+
+        cases = (
+            ('schema dump, orm', lambda: schema.dump(assets).data),
+            ('serializer, orm', lambda: serializer(assets)),
+            ('serializer, core', lambda: serializer(rows)),
+        )
+
+        print(f'{"":>18} | {"dump rows/s":>11} | {"dump+json rows/s":>16}')
+        for name, dump in cases:
+            dumped = args.repeat * len(assets) / timeit(dump,
+                                                         number=args.repeat)
+            encoded = args.repeat * len(assets) / timeit(
+                lambda: json.dumps(dump()), number=args.repeat)
+            print(f'{name:>18} | {dumped:>11.0f} | {encoded:>16.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,8 @@
 """Application configuration module."""
 
-from os import getenv, environ
+from os import getenv, environ, path
 from pathlib import Path  # python3 only
+from tempfile import gettempdir
 
 from dotenv import load_dotenv
 
@@ -9,12 +10,72 @@ env_path = Path('.') / '.env'
 load_dotenv(dotenv_path=env_path, verbose=True)
 
 
+def read_replica_binds(uris):
+    """
+    Returns the SQLALCHEMY_BINDS of the read replicas of a comma separated
+    list of database uris, keyed read_replica_0, read_replica_1...
+    """
+
+    return {
+        f'read_replica_{index}': uri
+        for index, uri in enumerate(uri for uri in uris.split(',') if uri)
+    }
+
+
 class Config(object):
     """App base configuration."""
 
     SQLALCHEMY_DATABASE_URI = getenv('DATABASE_URI',
         default='postgresql://localhost/activo')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Connection pool of each postgres engine, see
+    # api/models/connection_pool.py. Every gunicorn worker has its own
+    # pools, of up to DATABASE_POOL_SIZE + DATABASE_MAX_OVERFLOW connections
+    DATABASE_POOL_SIZE = int(getenv('DATABASE_POOL_SIZE', default=5))
+    DATABASE_MAX_OVERFLOW = int(getenv('DATABASE_MAX_OVERFLOW', default=10))
+    # Seconds a request waits for a connection before failing
+    DATABASE_POOL_TIMEOUT = int(getenv('DATABASE_POOL_TIMEOUT', default=30))
+    # Seconds after which a connection is replaced, -1 to keep them
+    DATABASE_POOL_RECYCLE = int(getenv('DATABASE_POOL_RECYCLE', default=-1))
+    # Tests the connections on checkout, replacing the dropped ones
+    DATABASE_POOL_PRE_PING = getenv(
+        'DATABASE_POOL_PRE_PING', default='false') == 'true'
+    # Leaves the pooling of the connections to pgbouncer
+    DATABASE_PGBOUNCER = getenv(
+        'DATABASE_PGBOUNCER', default='false') == 'true'
+    # Read replicas, a comma separated list of database uris. The reads of
+    # the GET requests are spread over the binds of READ_REPLICA_BINDS, see
+    # api/models/routing_session.py
+    SQLALCHEMY_BINDS = read_replica_binds(
+        getenv('READ_REPLICA_URIS', default=''))
+    READ_REPLICA_BINDS = sorted(SQLALCHEMY_BINDS)
+    # Seconds the reads of a user are served by the primary after it
+    # writes, so that it reads its writes despite the replication lag
+    READ_YOUR_WRITES_SECONDS = int(
+        getenv('READ_YOUR_WRITES_SECONDS', default=5))
+    # Seconds a cached pagination count is served for, see ?count=cached
+    COUNT_CACHE_TTL = int(getenv('COUNT_CACHE_TTL', default=60))
+    # Seconds the attributes of a category are cached for asset validation
+    ATTRIBUTE_SPEC_CACHE_TTL = int(
+        getenv('ATTRIBUTE_SPEC_CACHE_TTL', default=60))
+    # Bulk asset import limits, see POST /assets/bulk
+    ASSET_IMPORT_MAX_ROWS = int(getenv('ASSET_IMPORT_MAX_ROWS', default=10000))
+    ASSET_IMPORT_CHUNK_SIZE = int(
+        getenv('ASSET_IMPORT_CHUNK_SIZE', default=500))
+    # Export jobs, see POST /exports. With no workers jobs run in the request
+    EXPORT_WORKERS = int(getenv('EXPORT_WORKERS', default=2))
+    EXPORT_DIR = getenv(
+        'EXPORT_DIR', default=path.join(gettempdir(), 'activo-exports'))
+    # Hours the export files are kept for, see remove_expired_export_files,
+    # and minutes after which a pending or running job which made no
+    # progress has failed, see fail_stale_export_jobs
+    EXPORT_RETENTION_HOURS = int(getenv('EXPORT_RETENTION_HOURS', default=24))
+    EXPORT_STALE_MINUTES = int(getenv('EXPORT_STALE_MINUTES', default=60))
+    # Request instrumentation, see /metrics. A threshold of 0 disables the
+    # log of the requests exceeding it
+    METRICS_ENABLED = getenv('METRICS_ENABLED', default='true') == 'true'
+    SLOW_REQUEST_MS = int(getenv('SLOW_REQUEST_MS', default=1000))
+    REQUEST_QUERY_LIMIT = int(getenv('REQUEST_QUERY_LIMIT', default=25))
     DEBUG = False
     TESTING = False
 
@@ -22,7 +83,14 @@ class Config(object):
 class ProductionConfig(Config):
     """App production configuration."""
 
-    pass
+    # The connections idle behind load balancers and firewalls get dropped
+    DATABASE_POOL_RECYCLE = int(
+        getenv('DATABASE_POOL_RECYCLE', default=1800))
+    DATABASE_POOL_PRE_PING = getenv(
+        'DATABASE_POOL_PRE_PING', default='true') == 'true'
+    # /metrics is not authenticated, expose it on purpose only, eg to a
+    # scraper on the private network
+    METRICS_ENABLED = getenv('METRICS_ENABLED', default='false') == 'true'
 
 
 class DevelopmentConfig(Config):
@@ -35,6 +103,7 @@ class TestingConfig(Config):
     """App testing configuration."""
 
     TESTING = True
+    EXPORT_WORKERS = 0
     SQLALCHEMY_DATABASE_URI = getenv('TEST_DATABASE_URI',
                                 default='postgresql://localhost/activo_test')
     environ['JWT_SECRET_KEY'] = (
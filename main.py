@@ -5,11 +5,13 @@ from flask import Flask, jsonify
 from flask_migrate import Migrate
 from flask_restplus import Api
 from api import api_blueprint
-from flask_excel import init_excel
 from flask_cors import CORS
 
 from api.middlewares.base_validator import (middleware_blueprint,
                                             ValidationError)
+from api.middlewares.instrumentation import init_instrumentation
+from api.middlewares.plugins import init_plugins
+from api.middlewares.token_required import init_public_key
 from config import config
 from api.models.database import db
 
@@ -36,6 +38,12 @@ def create_app(config=config[config_name]):
     # bind app to db
     db.init_app(app)
 
+    # parse the public key verifying the tokens of the environment
+    init_public_key(app)
+
+    # time the requests and count their sql queries
+    init_instrumentation(app)
+
     # import all models
     from api.models import User, Asset, AssetCategory, Attribute, Center
 
@@ -45,8 +53,9 @@ def create_app(config=config[config_name]):
     # initialize migration scripts
     migrate = Migrate(app, db)
 
-    # initialize flask excel module
-    init_excel(app)
+    # image storage is registered on the first request to a route
+    # requiring it
+    init_plugins(app)
 
     return app
 
@@ -7,6 +7,9 @@ from api.middlewares.token_required import token_required
 from main import create_app
 from config import config
 from seeders import seed_db
+from api.models import AssetCount
+from api.services.export_jobs import (fail_stale_export_jobs,
+                                      remove_expired_export_files)
 
 # get flask config name from env or default to production config
 config_name = getenv('FLASK_ENV', default='production')
@@ -30,6 +33,23 @@ def health_check():
 def seed_database():
     seed_db()
 
+@app.cli.command()
+def rebuild_asset_counts():
+    """Recounts the asset_counts rollup from the asset table."""
+    AssetCount.rebuild()
+
+@app.cli.command()
+def remove_expired_exports():
+    """
+    Removes the export files older than EXPORT_RETENTION_HOURS and fails the
+    export jobs stale for EXPORT_STALE_MINUTES.
+    """
+    removed = remove_expired_export_files(app.config['EXPORT_DIR'],
+                                          app.config['EXPORT_RETENTION_HOURS'])
+    failed = fail_stale_export_jobs(app.config['EXPORT_STALE_MINUTES'])
+    print(f'Removed {removed} expired export files, '
+          f'failed {failed} stale export jobs')
+
 
 if __name__ == '__main__':
     app.run()
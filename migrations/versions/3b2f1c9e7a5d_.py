@@ -0,0 +1,64 @@
+"""add indexes for the dynamic filter hot paths
+
+Revision ID: 3b2f1c9e7a5d
+Revises: dedb89e83930
+Create Date: 2018-08-02 10:14:27.518342
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '3b2f1c9e7a5d'
+down_revision = 'dedb89e83930'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # foreign keys, only the non deleted rows are ever listed
+    op.create_index('ix_asset_asset_category_id_active', 'asset',
+                    ['asset_category_id'],
+                    postgresql_where=sa.text('deleted = false'))
+    op.create_index('ix_asset_center_id_active', 'asset', ['center_id'],
+                    postgresql_where=sa.text('deleted = false'))
+    op.create_index('ix_attribute_asset_category_id_active', 'attribute',
+                    ['asset_category_id'],
+                    postgresql_where=sa.text('deleted = false'))
+    op.create_index('ix_users_center_id_active', 'users', ['center_id'],
+                    postgresql_where=sa.text('deleted = false'))
+    op.create_index('ix_users_role_id_active', 'users', ['role_id'],
+                    postgresql_where=sa.text('deleted = false'))
+
+    # date filters compare func.date(created_at)
+    op.create_index('ix_asset_created_at_date', 'asset',
+                    [sa.text('date(created_at)')])
+
+    # like filters compare ilike '%value%'
+    op.create_index('ix_asset_tag_trgm', 'asset', ['tag'],
+                    postgresql_using='gin',
+                    postgresql_ops={'tag': 'gin_trgm_ops'})
+    op.create_index('ix_asset_serial_trgm', 'asset', ['serial'],
+                    postgresql_using='gin',
+                    postgresql_ops={'serial': 'gin_trgm_ops'})
+    op.create_index('ix_asset_categories_name_trgm', 'asset_categories',
+                    ['name'], postgresql_using='gin',
+                    postgresql_ops={'name': 'gin_trgm_ops'})
+
+
+def downgrade():
+    # the pg_trgm extension is left installed as other databases objects
+    # may depend on it
+    op.drop_index('ix_asset_categories_name_trgm',
+                  table_name='asset_categories')
+    op.drop_index('ix_asset_serial_trgm', table_name='asset')
+    op.drop_index('ix_asset_tag_trgm', table_name='asset')
+    op.drop_index('ix_asset_created_at_date', table_name='asset')
+    op.drop_index('ix_users_role_id_active', table_name='users')
+    op.drop_index('ix_users_center_id_active', table_name='users')
+    op.drop_index('ix_attribute_asset_category_id_active',
+                  table_name='attribute')
+    op.drop_index('ix_asset_center_id_active', table_name='asset')
+    op.drop_index('ix_asset_asset_category_id_active', table_name='asset')
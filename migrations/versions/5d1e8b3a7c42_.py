@@ -0,0 +1,96 @@
+"""add the asset counts rollup table and its triggers
+
+Revision ID: 5d1e8b3a7c42
+Revises: c4e7a9d2f6b1
+Create Date: 2018-08-13 09:37:52.194603
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '5d1e8b3a7c42'
+down_revision = 'c4e7a9d2f6b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('asset_counts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('asset_category_id', sa.String(length=36), nullable=True),
+    sa.Column('center_id', sa.String(length=36), nullable=True),
+    sa.Column('deleted', sa.Boolean(), nullable=False),
+    sa.Column('assets_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_asset_counts_key', 'asset_counts', [
+        sa.text("coalesce(asset_category_id, '')"),
+        sa.text("coalesce(center_id, '')"), 'deleted'
+    ], unique=True)
+
+    op.execute('''
+    CREATE OR REPLACE FUNCTION asset_counts_add(
+        category_id varchar, center varchar, is_deleted boolean, delta integer)
+    RETURNS void AS $$
+    BEGIN
+        INSERT INTO asset_counts AS counts
+            (asset_category_id, center_id, deleted, assets_count)
+        VALUES (category_id, center, coalesce(is_deleted, false), delta)
+        ON CONFLICT ((coalesce(asset_category_id, '')),
+                     (coalesce(center_id, '')), deleted)
+        DO UPDATE SET assets_count = counts.assets_count + delta;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    CREATE OR REPLACE FUNCTION asset_counts_trigger() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'TRUNCATE' THEN
+            DELETE FROM asset_counts;
+            RETURN NULL;
+        END IF;
+        IF TG_OP = 'UPDATE'
+            AND OLD.asset_category_id IS NOT DISTINCT FROM NEW.asset_category_id
+            AND OLD.center_id IS NOT DISTINCT FROM NEW.center_id
+            AND coalesce(OLD.deleted, false) = coalesce(NEW.deleted, false) THEN
+            RETURN NULL;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM asset_counts_add(
+                OLD.asset_category_id, OLD.center_id, OLD.deleted, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM asset_counts_add(
+                NEW.asset_category_id, NEW.center_id, NEW.deleted, 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS asset_counts_rows ON asset;
+    CREATE TRIGGER asset_counts_rows
+        AFTER INSERT OR DELETE OR UPDATE OF asset_category_id, center_id, deleted
+        ON asset FOR EACH ROW EXECUTE PROCEDURE asset_counts_trigger();
+
+    DROP TRIGGER IF EXISTS asset_counts_truncate ON asset;
+    CREATE TRIGGER asset_counts_truncate AFTER TRUNCATE ON asset
+        FOR EACH STATEMENT EXECUTE PROCEDURE asset_counts_trigger();
+    ''')
+
+    op.execute('''
+    INSERT INTO asset_counts
+        (asset_category_id, center_id, deleted, assets_count)
+    SELECT asset_category_id, center_id, coalesce(deleted, false), count(*)
+    FROM asset
+    GROUP BY asset_category_id, center_id, coalesce(deleted, false)
+    ''')
+
+
+def downgrade():
+    op.execute('DROP TRIGGER IF EXISTS asset_counts_truncate ON asset')
+    op.execute('DROP TRIGGER IF EXISTS asset_counts_rows ON asset')
+    op.execute('DROP FUNCTION IF EXISTS asset_counts_trigger()')
+    op.execute('DROP FUNCTION IF EXISTS asset_counts_add('
+               'varchar, varchar, boolean, integer)')
+    op.drop_index('ix_asset_counts_key', table_name='asset_counts')
+    op.drop_table('asset_counts')
@@ -0,0 +1,32 @@
+"""index the raw asset created_at and the tag prefixes
+
+Revision ID: 7a3c5e9f2d18
+Revises: 5d1e8b3a7c42
+Create Date: 2018-08-16 11:02:41.836205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '7a3c5e9f2d18'
+down_revision = '5d1e8b3a7c42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # date filters compare half open ranges of the raw created_at
+    op.drop_index('ix_asset_created_at_date', table_name='asset')
+    op.create_index('ix_asset_created_at', 'asset', ['created_at'])
+
+    # startswith filters compare like 'value%'
+    op.create_index('ix_asset_tag_pattern', 'asset', ['tag'],
+                    postgresql_ops={'tag': 'varchar_pattern_ops'})
+
+
+def downgrade():
+    op.drop_index('ix_asset_tag_pattern', table_name='asset')
+    op.drop_index('ix_asset_created_at', table_name='asset')
+    op.create_index('ix_asset_created_at_date', 'asset',
+                    [sa.text('date(created_at)')])
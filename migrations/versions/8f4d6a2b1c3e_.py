@@ -0,0 +1,36 @@
+"""migrate asset custom attributes to jsonb
+
+Revision ID: 8f4d6a2b1c3e
+Revises: 3b2f1c9e7a5d
+Create Date: 2018-08-06 15:41:09.862117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '8f4d6a2b1c3e'
+down_revision = '3b2f1c9e7a5d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column('asset', 'custom_attributes',
+                    existing_type=postgresql.JSON(astext_type=sa.Text()),
+                    type_=postgresql.JSONB(astext_type=sa.Text()),
+                    existing_nullable=True,
+                    postgresql_using='custom_attributes::jsonb')
+    op.create_index('ix_asset_custom_attributes', 'asset',
+                    ['custom_attributes'], postgresql_using='gin',
+                    postgresql_ops={'custom_attributes': 'jsonb_path_ops'})
+
+
+def downgrade():
+    op.drop_index('ix_asset_custom_attributes', table_name='asset')
+    op.alter_column('asset', 'custom_attributes',
+                    existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                    type_=postgresql.JSON(astext_type=sa.Text()),
+                    existing_nullable=True,
+                    postgresql_using='custom_attributes::json')
@@ -0,0 +1,93 @@
+"""add the full text search vector of the assets
+
+Revision ID: 9e4b2d7c1f06
+Revises: 7a3c5e9f2d18
+Create Date: 2018-08-20 14:25:09.617384
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '9e4b2d7c1f06'
+down_revision = '7a3c5e9f2d18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('asset',
+                  sa.Column('search_vector', postgresql.TSVECTOR(),
+                            nullable=True))
+
+    op.execute('''
+    CREATE OR REPLACE FUNCTION asset_search_vector(
+        asset_tag varchar, asset_serial varchar, category_name varchar,
+        attributes jsonb)
+    RETURNS tsvector AS $$
+        SELECT setweight(to_tsvector('simple', coalesce(asset_tag, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(asset_serial, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(category_name, '')), 'B') ||
+            setweight(to_tsvector('simple', coalesce(
+                (SELECT string_agg(value, ' ')
+                 FROM jsonb_each_text(CASE WHEN jsonb_typeof(attributes) = 'object'
+                                            THEN attributes END)), '')), 'C');
+    $$ LANGUAGE sql IMMUTABLE;
+
+    CREATE OR REPLACE FUNCTION asset_search_trigger() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := asset_search_vector(
+            NEW.tag, NEW.serial,
+            (SELECT name FROM asset_categories
+             WHERE id = NEW.asset_category_id),
+            NEW.custom_attributes);
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    CREATE OR REPLACE FUNCTION asset_category_search_trigger()
+    RETURNS trigger AS $$
+    BEGIN
+        UPDATE asset SET search_vector = asset_search_vector(
+            tag, serial, NEW.name, custom_attributes)
+        WHERE asset_category_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS asset_search_rows ON asset;
+    CREATE TRIGGER asset_search_rows
+        BEFORE INSERT OR UPDATE OF tag, serial, asset_category_id,
+            custom_attributes
+        ON asset FOR EACH ROW EXECUTE PROCEDURE asset_search_trigger();
+
+    DROP TRIGGER IF EXISTS asset_category_search_rows ON asset_categories;
+    CREATE TRIGGER asset_category_search_rows
+        AFTER UPDATE OF name ON asset_categories FOR EACH ROW
+        WHEN (OLD.name IS DISTINCT FROM NEW.name)
+        EXECUTE PROCEDURE asset_category_search_trigger();
+    ''')
+
+    op.execute('''
+    UPDATE asset SET search_vector = asset_search_vector(
+        asset.tag, asset.serial, asset_categories.name,
+        asset.custom_attributes)
+    FROM asset_categories
+    WHERE asset_categories.id = asset.asset_category_id
+    ''')
+
+    op.create_index('ix_asset_search_vector', 'asset', ['search_vector'],
+                    postgresql_using='gin')
+
+
+def downgrade():
+    op.drop_index('ix_asset_search_vector', table_name='asset')
+    op.execute('DROP TRIGGER IF EXISTS asset_category_search_rows '
+               'ON asset_categories')
+    op.execute('DROP TRIGGER IF EXISTS asset_search_rows ON asset')
+    op.execute('DROP FUNCTION IF EXISTS asset_category_search_trigger()')
+    op.execute('DROP FUNCTION IF EXISTS asset_search_trigger()')
+    op.execute('DROP FUNCTION IF EXISTS asset_search_vector('
+               'varchar, varchar, varchar, jsonb)')
+    op.drop_column('asset', 'search_vector')
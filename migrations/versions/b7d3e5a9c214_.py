@@ -0,0 +1,27 @@
+"""add the last write of the users
+
+Revision ID: b7d3e5a9c214
+Revises: 9e4b2d7c1f06
+Create Date: 2018-08-22 10:12:41.208316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b7d3e5a9c214'
+down_revision = '9e4b2d7c1f06'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user_writes',
+    sa.Column('user_id', sa.String(length=36), nullable=False),
+    sa.Column('written_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+
+def downgrade():
+    op.drop_table('user_writes')
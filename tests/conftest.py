@@ -226,6 +226,36 @@ def multiple_categories():
     db.session.commit()
 
 
+@pytest.fixture(scope='module')
+def value_asset_category(app, init_db):  #pylint: disable=W0613
+    """Create an asset category with text, date and choices attributes"""
+
+    asset_category = AssetCategory(name='Monitor')
+    asset_category.attributes = [
+        Attribute(
+            _key='size', label='size', is_required=False,
+            input_control='Text'),
+        Attribute(
+            _key='purchased',
+            label='purchased',
+            is_required=False,
+            input_control='Date Added'),
+        Attribute(
+            _key='color',
+            label='color',
+            is_required=False,
+            input_control='Dropdown',
+            choices='black,white'),
+        Attribute(
+            _key='ports',
+            label='ports',
+            is_required=False,
+            input_control='Checkbox',
+            choices='hdmi,vga,usb'),
+    ]
+    return asset_category.save()
+
+
 @pytest.fixture(scope='module')
 def dynamic_filter():
     """
@@ -0,0 +1,161 @@
+"""Module for asset bulk import endpoint tests."""
+from io import BytesIO
+from os import getenv
+
+from flask import json
+
+from api.utilities.constants import CHARSET
+from api.utilities.messages.error_messages import serialization_errors
+from api.models import Asset
+
+API_BASE_URL_V1 = getenv('API_BASE_URL_V1')
+
+
+class TestAssetBulkEndpoint:
+    """Class for Asset bulk import endpoint."""
+
+    def test_bulk_import_assets_from_json(  #pylint: disable=C0103
+            self,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header,
+            test_asset_category):
+        """
+        Tests that valid assets are imported and invalid ones are reported
+        with their row number
+        """
+
+        Asset(tag='AND/BULK/0', asset_category_id=test_asset_category.id)\
+            .save()
+        data = json.dumps([{
+            'tag': 'AND/BULK/1',
+            'serial': 'SN1',
+            'assetCategoryId': test_asset_category.id,
+            'customAttributes': {
+                'waranty': '2 yr'
+            }
+        }, {
+            'tag': 'AND/BULK/0',
+            'assetCategoryId': test_asset_category.id
+        }, {
+            'tag': 'AND/BULK/1',
+            'assetCategoryId': test_asset_category.id
+        }, {
+            'tag': 'AND/BULK/2',
+            'assetCategoryId': test_asset_category.id,
+            'customAttributes': {
+                'length': '12cm'
+            }
+        }, {
+            'tag': 'AND/BULK/3',
+            'assetCategoryId': '-LEiS7lgOu3VmeEBg5cUtt'
+        }, {
+            'tag': 'AND/BULK/4',
+            'assetCategoryId': test_asset_category.id
+        }])
+        response = client.post(
+            f'{API_BASE_URL_V1}/assets/bulk', headers=auth_header, data=data)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 201
+        assert response_json['status'] == 'success'
+        assert response_json['data'] == {'createdCount': 2, 'failedCount': 4}
+        assert response_json['errors'] == [{
+            'row':
+            2,
+            'message':
+            serialization_errors['duplicate_asset'].format('AND/BULK/0')
+        }, {
+            'row':
+            3,
+            'message':
+            serialization_errors['duplicate_asset'].format('AND/BULK/1')
+        }, {
+            'row':
+            4,
+            'message':
+            serialization_errors['attribute_required'].format('waranty')
+        }, {
+            'row':
+            5,
+            'message':
+            serialization_errors['not_found'].format('Asset category')
+        }]
+        assert Asset.query.filter(
+            Asset.tag.in_(['AND/BULK/1', 'AND/BULK/4'])).count() == 2
+
+    def test_bulk_import_assets_from_csv(  #pylint: disable=C0103
+            self,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header,
+            test_asset_category):
+        """
+        Tests that the columns of an uploaded CSV file other than the asset
+        fields are imported as custom attributes
+        """
+
+        csv_file = (f'tag,serial,assetCategoryId,waranty,length\r\n'
+                    f'AND/CSV/1,SN1,{test_asset_category.id},1 yr,\r\n'
+                    f'AND/CSV/2,SN2,{test_asset_category.id},2 yr,9cm\r\n')
+        response = client.post(
+            f'{API_BASE_URL_V1}/assets/bulk',
+            headers={'Authorization': auth_header['Authorization']},
+            data={'file': (BytesIO(csv_file.encode(CHARSET)), 'assets.csv')},
+            content_type='multipart/form-data')
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 201
+        assert response_json['data'] == {'createdCount': 2, 'failedCount': 0}
+        asset = Asset.query.filter_by(tag='AND/CSV/2').first()
+        assert asset.serial == 'SN2'
+        assert asset.custom_attributes == {'waranty': '2 yr', 'length': '9cm'}
+
+    def test_bulk_import_assets_with_invalid_body(  #pylint: disable=C0103
+            self,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header):
+        """
+        Tests that a body which is neither a JSON array nor a CSV file fails
+        """
+
+        response = client.post(
+            f'{API_BASE_URL_V1}/assets/bulk',
+            headers=auth_header,
+            data=json.dumps({'tag': 'AND/BULK/5'}))
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 400
+        assert response_json['status'] == 'error'
+        assert response_json['message'] == serialization_errors[
+            'bulk_import_type']
+
+    def test_bulk_import_assets_with_non_object_rows(  #pylint: disable=C0103
+            self,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header,
+            test_asset_category):
+        """
+        Tests that the rows of a JSON array which are not objects are
+        reported as invalid rows
+        """
+
+        data = json.dumps([1, 'AND/BULK/6', {
+            'tag': 'AND/BULK/6',
+            'assetCategoryId': test_asset_category.id,
+            'customAttributes': {
+                'waranty': '1 yr'
+            }
+        }])
+        response = client.post(
+            f'{API_BASE_URL_V1}/assets/bulk', headers=auth_header, data=data)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 201
+        assert response_json['data'] == {'createdCount': 1, 'failedCount': 2}
+        assert response_json['errors'] == [{
+            'row': row,
+            'message': serialization_errors['json_invalid']
+        } for row in (1, 2)]
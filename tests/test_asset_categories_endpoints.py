@@ -7,6 +7,7 @@ from flask import json  #pylint: disable=E0401
 from api.models.asset_category import AssetCategory
 from api.models.asset import Asset
 from api.models.attribute import Attribute
+from api.models.center import Center
 from api.utilities.constants import CHARSET
 from api.utilities.messages.error_messages import serialization_errors
 from .mocks.asset_category import (
@@ -519,8 +520,8 @@ class TestAssetCategoriesEndpoints:  #pylint: disable=R0904
     def test_eager_load_attributes(  #pylint: disable=R0201,C0103,C0111
             self,
             client,
-            init_db,
-            test_asset_category,  #pylint: disable=W0613
+            init_db,  #pylint: disable=W0613
+            test_asset_category,
             auth_header):
         response = client.get(
             f'{api_v1_base_url}/asset-categories?include=attributes',
@@ -529,8 +530,10 @@ class TestAssetCategoriesEndpoints:  #pylint: disable=R0904
 
         assert response.status_code == 200
         assert response_json["status"] == "success"
-        assert isinstance(response_json["data"][0]["customAttributes"], list)
-        assert len(response_json["data"][0]["customAttributes"]) is not 0
+        asset_category = next(category for category in response_json["data"]
+                              if category["id"] == test_asset_category.id)
+        assert isinstance(asset_category["customAttributes"], list)
+        assert len(asset_category["customAttributes"]) is not 0
 
     def test_eager_load_attributes_with_invalid_param(  #pylint: disable=R0201,W0613,C0103,C0111
             self, client, auth_header, test_asset_category):  #pylint: disable=W0613
@@ -542,3 +545,118 @@ class TestAssetCategoriesEndpoints:  #pylint: disable=R0904
         assert response.status_code == 200
         assert response_json["status"] == "success"
         assert "customAttributes" in response_json["data"][0]
+
+    def test_include_expansions(  #pylint: disable=R0201,C0103
+            self,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header):
+        """
+        Should dump the expansions of the include query string only, the
+        deleted attributes left out
+        """
+
+        asset_category = AssetCategory(name='Docking Station')
+        asset_category.attributes.append(
+            Attribute(_key='ports', label='ports', is_required=False,
+                      input_control='Text'))
+        asset_category.attributes.append(
+            Attribute(_key='dock', label='dock', is_required=False,
+                      input_control='Text', deleted=True))
+        asset_category.save()
+        Asset(tag='AND/DOCK/1', asset_category_id=asset_category.id).save()
+        url = (f'{api_v1_base_url}/asset-categories'
+               '?where=name,eq,Docking Station')
+
+        response = client.get(f'{url}&include=attributes',
+                              headers=auth_header)
+        data = json.loads(response.data.decode(CHARSET))['data']
+
+        assert response.status_code == 200
+        assert set(data[0]) == {'id', 'name', 'customAttributes'}
+        assert [attribute['key']
+                for attribute in data[0]['customAttributes']] == ['ports']
+
+        response = client.get(f'{url}&include=assets_count,attributes',
+                              headers=auth_header)
+        data = json.loads(response.data.decode(CHARSET))['data']
+
+        assert data[0]['assetsCount'] == 1
+        assert len(data[0]['customAttributes']) == 1
+
+        response = client.get(
+            f'{api_v1_base_url}/asset-categories/{asset_category.id}'
+            '?include=assets_count',
+            headers=auth_header)
+        data = json.loads(response.data.decode(CHARSET))['data']
+
+        assert data == {'name': 'Docking Station', 'assetsCount': 1}
+
+        response = client.get(
+            f'{api_v1_base_url}/asset-categories/{asset_category.id}',
+            headers=auth_header)
+        data = json.loads(response.data.decode(CHARSET))['data']
+
+        assert [attribute['key']
+                for attribute in data['customAttributes']] == ['ports']
+
+        response = client.get(f'{url}&include=assets',
+                              headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 400
+        assert response_json['message'] == serialization_errors[
+            'invalid_query_strings'].format('include', 'assets')
+
+    def test_asset_categories_stats_breakdown(  #pylint: disable=R0201,C0103
+            self,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header):
+        """
+        Should count the assets of a category per center and the deleted ones
+        apart
+        """
+
+        asset_category = AssetCategory(name='Projector')
+        asset_category.save()
+        lagos = Center(name='Lagos Stats', image={})
+        lagos.save()
+        nairobi = Center(name='Nairobi Stats', image={})
+        nairobi.save()
+        for tag, center, deleted in (('AND/STATS/1', lagos, False),
+                                     ('AND/STATS/2', lagos, False),
+                                     ('AND/STATS/3', nairobi, False),
+                                     ('AND/STATS/4', nairobi, True)):
+            Asset(tag=tag, asset_category_id=asset_category.id,
+                  center_id=center.id, deleted=deleted).save()
+
+        response = client.get(
+            f'{api_v1_base_url}/asset-categories/stats'
+            '?breakdown=center,deleted&where=name,eq,Projector',
+            headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 200
+        assert response_json['data'] == [{
+            'id': asset_category.id,
+            'name': 'Projector',
+            'assetsCount': 3,
+            'deletedAssetsCount': 1,
+            'centers': [{
+                'centerId': lagos.id,
+                'assetsCount': 2
+            }, {
+                'centerId': nairobi.id,
+                'assetsCount': 1
+            }]
+        }]
+
+        response = client.get(
+            f'{api_v1_base_url}/asset-categories/stats?breakdown=users',
+            headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 400
+        assert response_json['message'] == serialization_errors[
+            'invalid_query_strings'].format('breakdown', 'users')
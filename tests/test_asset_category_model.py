@@ -45,6 +45,11 @@ class TestAssetCategoryModel:
         assert category_query.count() == 1
         assert isinstance(category_query.all(), list)
 
+    def test_attributes_not_loaded_by_default(self, new_asset_category):
+        assert 'JOIN' not in str(AssetCategory.query)
+        assert AssetCategory.query.get(
+            new_asset_category.id).eager_loaded_attributes == []
+
     def test_delete_asset_category_with_child_relationships(self, new_asset_category):
         with pytest.raises(ValidationError):
             new_asset_category.delete()
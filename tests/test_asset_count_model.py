@@ -0,0 +1,51 @@
+"""Module for asset counts rollup tests"""
+
+from api.models import Asset, AssetCategory, AssetCount, Center
+from api.models.database import db
+
+
+def get_counts():
+    """Returns the non zero asset counts by category, center and state"""
+    return {(count.asset_category_id, count.center_id, count.deleted):
+            count.assets_count
+            for count in AssetCount.query.all() if count.assets_count}
+
+
+class TestAssetCountModel:
+    def test_asset_counts_follow_assets(self, init_db):
+        asset_category = AssetCategory(name='Monitor')
+        asset_category.save()
+        center = Center(name='Kampala', image={})
+        center.save()
+        first_asset = Asset(tag='AND/COUNT/1',
+                            asset_category_id=asset_category.id)
+        second_asset = Asset(tag='AND/COUNT/2',
+                             asset_category_id=asset_category.id)
+        first_asset.save()
+        second_asset.save()
+
+        assert get_counts() == {(asset_category.id, None, False): 2}
+
+        first_asset._update(center_id=center.id)
+        second_asset._update(deleted=True)
+
+        assert get_counts() == {
+            (asset_category.id, center.id, False): 1,
+            (asset_category.id, None, True): 1
+        }
+
+        db.session.delete(second_asset)
+        db.session.commit()
+
+        assert get_counts() == {(asset_category.id, center.id, False): 1}
+        assert AssetCategory.query.get(asset_category.id).assets_count == 1
+
+    def test_rebuild(self, init_db):
+        expected_counts = get_counts()
+        db.session.execute(
+            'UPDATE asset_counts SET assets_count = assets_count + 10')
+        db.session.commit()
+
+        AssetCount.rebuild()
+
+        assert get_counts() == expected_counts
@@ -96,3 +96,33 @@ class TestAssetCsvResource:
         assert response.status_code == 200
         assert response.headers['Content-Type'] == 'text/csv'
         assert b'color,created_at,serial,tag,warranty\r\n' in response.data
+
+    def test_export_assets_as_csv_rows(self, init_db, client, auth_header):  # pylint: disable=W0613
+        """
+        Should stream a csv row per non deleted asset with its custom
+        attributes as columns
+        """
+
+        asset_category = AssetCategory.query.filter_by(name='iPhone').first()
+        Asset(
+            tag='AND/5/DEL',
+            asset_category_id=asset_category.id,
+            custom_attributes={'size': '5in'},
+            deleted=True).save()
+
+        response = client.get(
+            f'{API_BASE_URL_V1}/asset-categories/{asset_category.id}/assets/export',  # noqa
+            headers=auth_header)
+        lines = response.data.decode(CHARSET).split('\r\n')
+
+        assert response.status_code == 200
+        assert response.headers['Content-Disposition'].startswith(
+            'attachment; filename=iPhone%20Assets%20Export%20-%20')
+        assert lines[0] == 'color,created_at,serial,tag,warranty'
+        assert len(lines) == 4 and lines[3] == ''
+        assert sorted(line.split(',')[3] for line in lines[1:3]) == [
+            'AND/1/ERR', 'AND/4/FHE'
+        ]
+        assert all(
+            line.startswith('indigo,') and line.endswith(',expired')
+            for line in lines[1:3])
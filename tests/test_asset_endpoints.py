@@ -3,11 +3,13 @@
 from os import getenv
 
 from flask import json
+from sqlalchemy import event
 
 from api.utilities.constants import CHARSET
 from api.utilities.messages.error_messages import serialization_errors
 from api.utilities.messages.error_messages import filter_errors
 from api.models import Asset
+from api.models.database import db
 from .mocks.asset import (ASSET_NO_CUSTOM_ATTRS, ASSET_NO_TAG, ASSET_NO_SERIAL,
                           ASSET_NONEXISTENT_CATEGORY,
                           ASSET_INVALID_CATEGORY_ID, ASSET_EMPTY_CUSTOM_ATTRS,
@@ -372,6 +374,186 @@ class TestAssetEndpoints:
         assert response_json['status'] == 'success'
         assert isinstance(response_json['data'], list)
 
+    def test_get_assets_endpoint_with_estimated_count(
+            self, client, init_db, auth_header):  # noqa
+        """
+        Should return the planner's estimate of the assets count
+        """
+
+        response = client.get(
+            f'{api_v1_base_url}/assets?count=estimated', headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 200
+        assert response_json['meta']['countStrategy'] == 'estimated'
+        assert isinstance(response_json['meta']['totalCount'], int)
+
+    def test_get_assets_endpoint_with_cached_count(
+            self, client, init_db, auth_header, new_asset_category):  # noqa
+        """
+        Should return the exact assets count and refresh it when an asset
+        is saved
+        """
+
+        response = client.get(
+            f'{api_v1_base_url}/assets?count=cached', headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+        total_count = Asset._query().count()
+
+        assert response.status_code == 200
+        assert response_json['meta']['countStrategy'] == 'cached'
+        assert response_json['meta']['totalCount'] == total_count
+
+        Asset(tag='AND/CACHED/1', asset_category_id=new_asset_category.id)\
+            .save()
+        response = client.get(
+            f'{api_v1_base_url}/assets?count=cached', headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response_json['meta']['totalCount'] == total_count + 1
+
+    def test_get_assets_endpoint_with_invalid_count(
+            self, client, init_db, auth_header):  # noqa
+        """
+        Should fail when requesting for assets with an unknown count strategy
+        """
+
+        response = client.get(
+            f'{api_v1_base_url}/assets?count=guessed', headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 400
+        assert response_json['message'] == serialization_errors[
+            'invalid_query_strings'].format('count', 'guessed')
+
+    def test_get_assets_endpoint_cursor_pagination(self, client, init_db,
+                                                   auth_header):
+        """
+        Should return assets paginated by cursor without a total count and
+        walk back to the same page with the previous cursor
+        """
+
+        response = client.get(
+            f'{api_v1_base_url}/assets?cursor=&limit=2', headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+        first_page_ids = [asset['id'] for asset in response_json['data']]
+
+        assert response.status_code == 200
+        assert len(first_page_ids) == 2
+        assert response_json['meta']['prevCursor'] == ''
+        assert response_json['meta']['previousPage'] == ''
+        assert response_json['meta']['nextCursor'] != ''
+        assert response_json['meta']['firstPage'].endswith('cursor=&limit=2')
+        assert 'totalCount' not in response_json['meta']
+
+        next_cursor = response_json['meta']['nextCursor']
+        response = client.get(
+            f'{api_v1_base_url}/assets?cursor={next_cursor}&limit=2',
+            headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+        second_page_ids = [asset['id'] for asset in response_json['data']]
+
+        assert response.status_code == 200
+        assert second_page_ids
+        assert not set(first_page_ids) & set(second_page_ids)
+        assert response_json['meta']['prevCursor'] != ''
+
+        prev_cursor = response_json['meta']['prevCursor']
+        response = client.get(
+            f'{api_v1_base_url}/assets?cursor={prev_cursor}&limit=2',
+            headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 200
+        assert [asset['id']
+                for asset in response_json['data']] == first_page_ids
+        assert response_json['meta']['prevCursor'] == ''
+        assert response_json['meta']['nextCursor'] != ''
+
+    def test_get_assets_endpoint_with_invalid_cursor(self, client, init_db,
+                                                     auth_header):
+        """
+        Should fail when requesting for assets with a tampered cursor
+        """
+
+        response = client.get(
+            f'{api_v1_base_url}/assets?cursor=invalid&limit=2',
+            headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 400
+        assert response_json['status'] == 'error'
+        assert response_json['message'] == serialization_errors[
+            'invalid_cursor'].format('invalid')
+
+    def test_get_assets_endpoint_with_fields(self, client, init_db,
+                                             auth_header):
+        """
+        Should return and select only the fields given, by name or by the
+        key they are dumped to
+        """
+
+        statements = []
+
+        def record_statement(conn, cursor, statement, *args):  #pylint: disable=W0613
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', record_statement)
+        try:
+            response = client.get(
+                f'{api_v1_base_url}/assets?fields=tag,customAttributes',
+                headers=auth_header)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record_statement)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 200
+        assert response_json['data']
+        assert all(
+            set(asset) == {'tag', 'customAttributes'}
+            for asset in response_json['data'])
+
+        page_statement = statements[-1]
+        assert 'asset.custom_attributes' in page_statement
+        assert 'asset.serial' not in page_statement
+
+        response = client.get(
+            f'{api_v1_base_url}/assets?cursor=&limit=2&fields=serial',
+            headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 200
+        assert all(set(asset) == {'serial'} for asset in response_json['data'])
+        assert response_json['meta']['nextCursor']
+        assert response_json['meta']['nextPage'].endswith(
+            f'/assets?fields=serial&cursor='
+            f'{response_json["meta"]["nextCursor"]}&limit=2')
+
+        response = client.get(
+            f'{api_v1_base_url}/assets?limit=1&fields=tag&count=cached',
+            headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response_json['meta']['nextPage'].endswith(
+            '/assets?fields=tag&count=cached&page=2&limit=1')
+
+    def test_get_assets_endpoint_with_invalid_fields(self, client, init_db,
+                                                     auth_header):
+        """
+        Should fail when requesting for fields the assets do not have or
+        which are never returned
+        """
+
+        for fields in ('tag,age', 'deleted_by'):
+            response = client.get(
+                f'{api_v1_base_url}/assets?fields={fields}',
+                headers=auth_header)
+            response_json = json.loads(response.data.decode(CHARSET))
+
+            assert response.status_code == 400
+            assert response_json['message'] == serialization_errors[
+                'invalid_query_strings'].format('fields', fields)
+
     def test_search_asset_endpoint(self, client, init_db, auth_header,
                                    new_asset_category):
         """
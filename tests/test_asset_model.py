@@ -1,3 +1,7 @@
+import pytest
+from werkzeug.datastructures import ImmutableMultiDict
+
+from api.middlewares.base_validator import ValidationError
 from api.models import Asset, AssetCategory
 
 
@@ -16,6 +20,34 @@ class TestAssetModel:
         assert asset_query.count() == 1
         assert isinstance(asset_query.all(), list)
 
+    def test_query_rows(self):
+        asset_rows = Asset._query_rows()
+        assert asset_rows.count() == 1
+        row = asset_rows.all()[0]
+        assert not isinstance(row, Asset)
+        assert row.tag == 'AND/345/EWR'
+        assert row['serial'] == 'GRGR334TG'
+
+    def test_query_rows_with_filters_and_columns(self, new_asset_category):
+        asset_rows = Asset._query_rows(
+            ImmutableMultiDict([('where', 'tag,startswith,AND/345')]),
+            columns=['tag'],
+            asset_category_id=new_asset_category.id)
+        assert [tuple(row) for row in asset_rows.page(0, 10)] == [
+            ('AND/345/EWR', )
+        ]
+        assert list(asset_rows.stream(1)) == asset_rows.all()
+
+        other_rows = Asset._query_rows(
+            ImmutableMultiDict([('where', 'tag,startswith,XYZ')]),
+            columns=['tag'],
+            asset_category_id=new_asset_category.id)
+        assert other_rows.select is asset_rows.select
+        assert other_rows.count() == 0
+
+        with pytest.raises(ValidationError):
+            Asset._query_rows(columns=['age'])
+
     def test_update(self, new_asset_category):
         new_asset_category.assets[0]._update(serial='FFE323DF')
         assert new_asset_category.assets[0].serial == 'FFE323DF'
@@ -0,0 +1,154 @@
+"""Module for the full text asset search tests."""
+from datetime import datetime
+from os import getenv
+from urllib.parse import urlsplit
+
+from flask import json
+
+from api.models import Asset, AssetCategory
+from api.utilities.constants import CHARSET
+from api.utilities.messages.error_messages import filter_errors
+
+API_BASE_URL_V1 = getenv('API_BASE_URL_V1')
+
+
+class TestAssetSearch:
+    """Class for the full text asset search tests."""
+
+    def test_search_ranks_tag_serial_category_and_attributes(  #pylint: disable=C0103
+            self,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header):
+        """
+        Tests that the search matches the tags, serials, category names and
+        custom attribute values by word prefix, the tag and serial first
+        """
+
+        laptop = AssetCategory(name='Laptop')
+        laptop.save()
+        tablet = AssetCategory(name='Tablet')
+        tablet.save()
+        for tag, serial, category, custom_attributes in (
+                ('AND/LAP/1', 'C02XK1ABJG5H', laptop, {'color': 'silver'}),
+                ('AND/LAP/2', 'C02YR7', laptop, {'note': 'tablet stand'}),
+                ('AND/TAB/1', 'DMPX1', tablet, {'color': 'space grey'}),
+                ('AND/TAB/2', "O'NEIL", tablet, None)):
+            Asset(tag=tag, serial=serial, asset_category_id=category.id,
+                  custom_attributes=custom_attributes).save()
+        Asset(tag='AND/LAP/3', serial='C02ZZ', asset_category_id=laptop.id,
+              deleted=True).save()
+
+        def search(search_query):
+            response = client.get(
+                f'{API_BASE_URL_V1}/assets/search',
+                query_string={'q': search_query},
+                headers=auth_header)
+            assert response.status_code == 200
+            return json.loads(response.data.decode(CHARSET))
+
+        assert [asset['tag'] for asset in search('c02x')['data']] == [
+            'AND/LAP/1'
+        ]
+        assert [asset['tag'] for asset in search('C02')['data']] == [
+            'AND/LAP/1', 'AND/LAP/2'
+        ]
+        assert [asset['tag'] for asset in search('tablet')['data']] == [
+            'AND/TAB/1', 'AND/TAB/2', 'AND/LAP/2'
+        ]
+        assert [asset['tag'] for asset in search('grey space')['data']] == [
+            'AND/TAB/1'
+        ]
+        assert [asset['tag'] for asset in search("o'neil")['data']] == [
+            'AND/TAB/2'
+        ]
+        assert [
+            asset['tag'] for asset in search('laptop & !silver:*')['data']
+        ] == ['AND/LAP/1']
+
+        category = AssetCategory.get(laptop.id)
+        category._update(name='Notebook')  #pylint: disable=W0212
+        assert len(search('notebook')['data']) == 2
+
+    def test_search_paginates_with_the_search_query(  #pylint: disable=C0103
+            self, client, auth_header):
+        """
+        Tests that the search results are paginated and that the page urls
+        keep the search query
+        """
+
+        response = client.get(
+            f'{API_BASE_URL_V1}/assets/search?q=AND&limit=3&page=1',
+            headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 200
+        assert len(response_json['data']) == 3
+        assert response_json['meta']['totalCount'] == 4
+        assert response_json['meta']['pagesCount'] == 2
+        assert response_json['meta']['nextPage'].endswith(
+            '/assets/search?q=AND&page=2&limit=3')
+
+    def test_search_pages_keep_the_filters(  #pylint: disable=C0103
+            self, client, auth_header):
+        """
+        Tests that the page urls of a search keep its date filters, which
+        apply to the following pages
+        """
+
+        category = AssetCategory.query.filter_by(name='Tablet').first()
+        Asset(tag='AND/OLD/1', serial='OLD1', asset_category_id=category.id,
+              created_at=datetime(2017, 1, 1)).save()
+
+        response = client.get(
+            f'{API_BASE_URL_V1}/assets/search?q=AND&limit=3',
+            headers=auth_header)
+        assert json.loads(
+            response.data.decode(CHARSET))['meta']['totalCount'] == 5
+
+        response = client.get(
+            f'{API_BASE_URL_V1}/assets/search?q=AND&limit=3&start=2018-01-01',
+            headers=auth_header)
+        next_page = json.loads(
+            response.data.decode(CHARSET))['meta']['nextPage']
+
+        assert next_page.endswith(
+            '/assets/search?q=AND&start=2018-01-01&page=2&limit=3')
+
+        next_page_url = urlsplit(next_page)
+        response = client.get(
+            f'{next_page_url.path}?{next_page_url.query}',
+            headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 200
+        assert response_json['meta']['page'] == 2
+        assert response_json['meta']['totalCount'] == 4
+        assert [asset['tag'] for asset in response_json['data']] == [
+            'AND/TAB/2'
+        ]
+
+    def test_search_without_matches(self, client, auth_header):  #pylint: disable=C0103
+        """Tests that a search matching no assets returns an empty page"""
+
+        for page in (1, 3):
+            response = client.get(
+                f'{API_BASE_URL_V1}/assets/search?q=unmatched&page={page}',
+                headers=auth_header)
+            response_json = json.loads(response.data.decode(CHARSET))
+
+            assert response.status_code == 200
+            assert response_json['data'] == []
+            assert response_json['meta']['page'] == 1
+            assert response_json['meta']['totalCount'] == 0
+
+    def test_search_without_words_fails(self, client, auth_header):
+        """Tests that a search query of blanks is rejected"""
+
+        response = client.get(
+            f'{API_BASE_URL_V1}/assets/search?q=%20', headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 400
+        assert response_json['message'] == filter_errors[
+            'INVALID_SEARCH_QUERY']
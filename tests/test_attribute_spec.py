@@ -0,0 +1,108 @@
+"""Module for the attribute spec cache tests."""
+from os import getenv
+
+from flask import json
+from sqlalchemy import event
+
+from api.models.database import db
+from api.utilities.attribute_spec import (attribute_spec_cache,
+                                          get_attribute_spec)
+from api.utilities.constants import CHARSET
+from api.utilities.messages.error_messages import serialization_errors
+
+API_BASE_URL_V1 = getenv('API_BASE_URL_V1')
+
+
+class TestAttributeSpec:
+    """Class for the attribute spec cache tests."""
+
+    def test_asset_post_with_cached_spec_queries_no_attributes(  #pylint: disable=C0103
+            self,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header,
+            test_asset_category):
+        """
+        Tests that an asset write validates its custom attributes without
+        querying the attributes once the spec of its category is cached
+        """
+
+        statements = []
+
+        def record_statement(conn, cursor, statement, *args):  #pylint: disable=W0613
+            statements.append(statement)
+
+        def post_asset(tag):
+            return client.post(
+                f'{API_BASE_URL_V1}/assets',
+                headers=auth_header,
+                data=json.dumps({
+                    'tag': tag,
+                    'assetCategoryId': test_asset_category.id,
+                    'customAttributes': {
+                        'waranty': '1 yr'
+                    }
+                }))
+
+        attribute_spec_cache.invalidate(test_asset_category.id)
+        assert post_asset('AND/SPEC/1').status_code == 201
+
+        event.listen(db.engine, 'before_cursor_execute', record_statement)
+        try:
+            assert post_asset('AND/SPEC/2').status_code == 201
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record_statement)
+
+        assert statements
+        assert not [
+            statement for statement in statements
+            if 'FROM attribute' in statement
+        ]
+
+    def test_asset_category_patch_invalidates_spec(  #pylint: disable=C0103
+            self,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header,
+            test_asset_category):
+        """
+        Tests that the attributes patched through the asset category
+        endpoint are used by the following asset writes
+        """
+
+        data = json.dumps({
+            'tag': 'AND/SPEC/3',
+            'assetCategoryId': test_asset_category.id,
+            'customAttributes': {
+                'length': '9cm'
+            }
+        })
+        response = client.post(
+            f'{API_BASE_URL_V1}/assets', headers=auth_header, data=data)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 400
+        assert response_json['message'] == serialization_errors[
+            'attribute_required'].format('waranty')
+        assert 'waranty' in get_attribute_spec(
+            test_asset_category.id).required_keys
+
+        waranty = test_asset_category.attributes.filter_by(
+            _key='waranty').first()
+        response = client.patch(
+            f'{API_BASE_URL_V1}/asset-categories/{test_asset_category.id}',
+            headers=auth_header,
+            data=json.dumps({
+                'customAttributes': [{
+                    'id': waranty.id,
+                    'isRequired': False
+                }]
+            }))
+        assert response.status_code == 200
+
+        response = client.post(
+            f'{API_BASE_URL_V1}/assets', headers=auth_header, data=data)
+
+        assert response.status_code == 201
+        assert get_attribute_spec(test_asset_category.id).required_keys == \
+            frozenset()
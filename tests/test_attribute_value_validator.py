@@ -0,0 +1,115 @@
+"""Module for the custom attribute values validation tests."""
+from os import getenv
+
+import pytest
+from flask import json
+
+from api.utilities.constants import CHARSET
+from api.utilities.messages.error_messages import serialization_errors
+
+API_BASE_URL_V1 = getenv('API_BASE_URL_V1')
+
+
+class TestAttributeValueValidator:
+    """Class for the custom attribute values validation tests."""
+
+    @pytest.mark.parametrize('custom_attributes', [{
+        'size': 27
+    }, {
+        'purchased': '2018-08-02'
+    }, {
+        'color': 'Black'
+    }, {
+        'ports': ['hdmi', 'usb']
+    }, {
+        'ports': 'vga'
+    }])
+    def test_create_asset_with_valid_values(  #pylint: disable=C0103
+            self, client, auth_header, value_asset_category,
+            custom_attributes):
+        """Tests that values matching their input controls are accepted"""
+
+        response = client.post(
+            f'{API_BASE_URL_V1}/assets',
+            headers=auth_header,
+            data=json.dumps({
+                'tag': f'AND/VALUE/{json.dumps(custom_attributes)}',
+                'assetCategoryId': value_asset_category.id,
+                'customAttributes': custom_attributes
+            }))
+
+        assert response.status_code == 201
+
+    @pytest.mark.parametrize('custom_attributes, message', [
+        ({
+            'size': {
+                'inches': 27
+            }
+        }, serialization_errors['attribute_value'].format('size', 'a text')),
+        ({
+            'purchased': '02/08/2018'
+        }, serialization_errors['attribute_value'].format(
+            'purchased', 'a date in the YYYY-MM-DD format')),
+        ({
+            'color': 'red'
+        }, serialization_errors['attribute_choice'].format(
+            'color', 'black, white')),
+        ({
+            'color': ['black']
+        }, serialization_errors['attribute_choice'].format(
+            'color', 'black, white')),
+        ({
+            'ports': ['hdmi', 'dvi']
+        }, serialization_errors['attribute_choice'].format(
+            'ports', 'hdmi, usb, vga')),
+    ])
+    def test_create_asset_with_invalid_values(  #pylint: disable=C0103
+            self, client, auth_header, value_asset_category,
+            custom_attributes, message):
+        """Tests that values not matching their input controls fail"""
+
+        response = client.post(
+            f'{API_BASE_URL_V1}/assets',
+            headers=auth_header,
+            data=json.dumps({
+                'tag': 'AND/VALUE/INVALID',
+                'assetCategoryId': value_asset_category.id,
+                'customAttributes': custom_attributes
+            }))
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 400
+        assert response_json['message'] == message
+
+    def test_bulk_import_assets_with_invalid_values(  #pylint: disable=C0103
+            self, client, auth_header, value_asset_category):
+        """Tests that the bulk import reports the rows with invalid values"""
+
+        response = client.post(
+            f'{API_BASE_URL_V1}/assets/bulk',
+            headers=auth_header,
+            data=json.dumps([{
+                'tag': 'AND/VALUE/BULK/1',
+                'assetCategoryId': value_asset_category.id,
+                'customAttributes': {
+                    'color': 'white',
+                    'purchased': '2018-08-02'
+                }
+            }, {
+                'tag': 'AND/VALUE/BULK/2',
+                'assetCategoryId': value_asset_category.id,
+                'customAttributes': {
+                    'purchased': 'yesterday'
+                }
+            }]))
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 201
+        assert response_json['data'] == {'createdCount': 1, 'failedCount': 1}
+        assert response_json['errors'] == [{
+            'row':
+            2,
+            'message':
+            serialization_errors['attribute_value'].format(
+                'purchased', 'a date in the YYYY-MM-DD format')
+        }]
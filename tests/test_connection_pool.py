@@ -0,0 +1,84 @@
+"""Module for testing the connection pools of the database engines"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+from api.models.connection_pool import InstrumentedQueuePool, pool_options
+from api.models.database import db
+
+
+class TestConnectionPool:
+    """Tests the connection pools of the database engines"""
+
+    def test_engine_pool_options(self, app):  #pylint: disable=R0201
+        """Should pool the connections of the engine as configured"""
+
+        pool = db.engine.pool
+
+        assert isinstance(pool, InstrumentedQueuePool)
+        assert pool.size() == app.config['DATABASE_POOL_SIZE']
+
+    def test_pgbouncer_mode(self, app):  #pylint: disable=R0201
+        """Should leave the pooling of the connections to pgbouncer"""
+
+        config = dict(app.config, DATABASE_PGBOUNCER=True)
+        engine = create_engine(app.config['SQLALCHEMY_DATABASE_URI'],
+                               **pool_options(config))
+
+        assert isinstance(engine.pool, NullPool)
+        assert engine.execute('SELECT 1').scalar() == 1
+        engine.dispose()
+
+    def test_checkout_stats(self, app):  #pylint: disable=R0201
+        """Should record the checkouts, in use and overflow connections"""
+
+        config = dict(
+            app.config,
+            DATABASE_POOL_SIZE=1,
+            DATABASE_MAX_OVERFLOW=1,
+            DATABASE_POOL_TIMEOUT=0.1)
+        engine = create_engine(app.config['SQLALCHEMY_DATABASE_URI'],
+                               **pool_options(config))
+        pool = engine.pool
+        connections = [engine.connect(), engine.connect()]
+
+        assert pool.checkedout() == 2
+        assert pool.overflow() == 1
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+        buckets, total, count, timeouts = pool.checkout_stats.snapshot()
+        assert count == 3
+        assert timeouts == 1
+        assert total >= 0.1
+        assert buckets[-1] == 3
+
+        for connection in connections:
+            connection.close()
+        engine.dispose()
+
+    def test_checkout_retries_recorded_once(  #pylint: disable=R0201,C0103
+            self, app, monkeypatch):
+        """Should record a checkout once when QueuePool retries it"""
+
+        engine = create_engine(app.config['SQLALCHEMY_DATABASE_URI'],
+                               **pool_options(app.config))
+        pool = engine.pool
+        do_get = QueuePool._do_get
+        retries = []
+
+        def retrying_do_get(self):
+            # As the retry paths of QueuePool._do_get
+            if not retries:
+                retries.append(self)
+                return self._do_get()
+            return do_get(self)
+
+        monkeypatch.setattr(QueuePool, '_do_get', retrying_do_get)
+        engine.connect().close()
+
+        assert retries == [pool]
+        assert pool.checkout_stats.snapshot()[2] == 1
+        engine.dispose()
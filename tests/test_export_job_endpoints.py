@@ -0,0 +1,198 @@
+"""Module for export job endpoints tests."""
+from datetime import datetime, timedelta
+from os import getenv, utime
+from time import time
+
+from flask import json
+
+from api.models import Asset, ExportJob
+from api.models.database import db
+from api.services.export_jobs import (fail_stale_export_jobs,
+                                      remove_expired_export_files)
+from api.utilities.constants import CHARSET
+from api.utilities.enums import ExportStatusEnum
+from api.utilities.messages.error_messages import serialization_errors
+
+API_BASE_URL_V1 = getenv('API_BASE_URL_V1')
+
+
+class TestExportJobEndpoints:
+    """Class for export job endpoints tests."""
+
+    def test_export_assets_job(  #pylint: disable=C0103
+            self,
+            app,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header,
+            test_asset_category,
+            tmpdir):
+        """
+        Tests that an assets export job writes its file, reports its progress
+        and serves the file once done
+        """
+
+        app.config['EXPORT_DIR'] = str(tmpdir)
+        asset = Asset(
+            tag='AND/EXP/1',
+            serial='SN1',
+            asset_category_id=test_asset_category.id,
+            custom_attributes={'waranty': '1 yr'})
+        asset.save()
+
+        response = client.post(
+            f'{API_BASE_URL_V1}/exports',
+            headers=auth_header,
+            data=json.dumps({
+                'type': 'assets',
+                'assetCategoryId': test_asset_category.id
+            }))
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 202
+        assert response_json['status'] == 'success'
+        job_id = response_json['data']['id']
+
+        response = client.get(
+            f'{API_BASE_URL_V1}/exports/{job_id}', headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 200
+        assert response_json['data']['type'] == 'assets'
+        assert response_json['data']['status'] == 'done'
+        assert response_json['data']['processedRows'] == 1
+        assert response_json['data']['totalRows'] == 1
+        assert response_json['data']['downloadUrl'].endswith(
+            f'/exports/{job_id}/download')
+
+        response = client.get(
+            f'{API_BASE_URL_V1}/exports/{job_id}/download',
+            headers=auth_header)
+
+        assert response.status_code == 200
+        assert response.headers['Content-Type'].startswith('text/csv')
+        assert 'Laptop100 Assets Export' in response.headers[
+            'Content-Disposition']
+        assert response.data.decode(CHARSET).split('\r\n')[:2] == [
+            'created_at,serial,tag,waranty',
+            f'{asset.created_at.date()},SN1,AND/EXP/1,1 yr'
+        ]
+
+    def test_export_asset_categories_job(  #pylint: disable=C0103
+            self,
+            app,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header,
+            test_asset_category,
+            tmpdir):
+        """Tests that the filters of an asset categories export apply"""
+
+        app.config['EXPORT_DIR'] = str(tmpdir)
+        response = client.post(
+            f'{API_BASE_URL_V1}/exports',
+            headers=auth_header,
+            data=json.dumps({
+                'type': 'asset-categories',
+                'where': ['name,like,Laptop']
+            }))
+        job_id = json.loads(response.data.decode(CHARSET))['data']['id']
+
+        response = client.get(
+            f'{API_BASE_URL_V1}/exports/{job_id}/download',
+            headers=auth_header)
+
+        assert response.status_code == 200
+        assert response.data == b'name,assets_count\r\nLaptop100,1\r\n'
+
+    def test_remove_expired_export_files(  #pylint: disable=C0103
+            self, app, tmpdir):
+        """Tests that the export files older than the retention are removed"""
+
+        expired_file = tmpdir.join('expired.csv')
+        expired_file.write('name,assets_count\r\n')
+        expired_at = time() - (app.config['EXPORT_RETENTION_HOURS'] + 1) * 3600
+        utime(str(expired_file), (expired_at, expired_at))
+        kept_file = tmpdir.join('kept.csv')
+        kept_file.write('name,assets_count\r\n')
+
+        assert remove_expired_export_files(
+            str(tmpdir), app.config['EXPORT_RETENTION_HOURS']) == 1
+        assert not expired_file.exists()
+        assert kept_file.exists()
+        assert remove_expired_export_files(
+            str(tmpdir.join('missing')),
+            app.config['EXPORT_RETENTION_HOURS']) == 0
+
+    def test_fail_stale_export_jobs(  #pylint: disable=C0103
+            self, app, init_db):  #pylint: disable=W0613
+        """
+        Tests that the pending and running export jobs which made no progress
+        for the stale minutes are failed
+        """
+
+        stale_at = datetime.utcnow() - timedelta(
+            minutes=app.config['EXPORT_STALE_MINUTES'] + 1)
+        jobs = [
+            ExportJob(
+                export_type='assets',
+                file_name='Assets Export.csv',
+                created_by='-LGtBIO0dcgRIHyy3pHe',
+                status=status,
+                created_at=created_at)
+            for status, created_at in (
+                (ExportStatusEnum.PENDING.value, stale_at),
+                (ExportStatusEnum.RUNNING.value, stale_at),
+                (ExportStatusEnum.RUNNING.value, datetime.utcnow()),
+                (ExportStatusEnum.DONE.value, stale_at))
+        ]
+        for job in jobs:
+            job.save()
+
+        assert fail_stale_export_jobs(app.config['EXPORT_STALE_MINUTES']) == 2
+
+        statuses = []
+        for job in jobs:
+            db.session.refresh(job)
+            statuses.append(job.status)
+
+        assert statuses == ['failed', 'failed', 'running', 'done']
+        assert jobs[0].error == serialization_errors['export_stale']
+
+    def test_export_job_with_invalid_type(  #pylint: disable=C0103
+            self,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header):
+        """Tests that an unknown export type is rejected"""
+
+        response = client.post(
+            f'{API_BASE_URL_V1}/exports',
+            headers=auth_header,
+            data=json.dumps({'type': 'users'}))
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 400
+        assert response_json['message'] == serialization_errors[
+            'export_type'].format('asset-categories, assets')
+
+    def test_get_export_job_of_another_user(  #pylint: disable=C0103
+            self,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header):
+        """Tests that the export jobs of other users are not found"""
+
+        export_job = ExportJob(
+            export_type='assets',
+            file_name='Assets Export.csv',
+            created_by='-LGtBIO0dcgRIHyy3pHe')
+        export_job.save()
+
+        response = client.get(
+            f'{API_BASE_URL_V1}/exports/{export_job.id}', headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 404
+        assert response_json['message'] == serialization_errors[
+            'not_found'].format('Export job')
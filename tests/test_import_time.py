@@ -0,0 +1,48 @@
+"""Module for the start up of the app"""
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Creates the app and prints the names of the modules then loaded. The time
+# taken is checked against its budget by benchmarks.import_time in CI.
+PROBE = '''
+import sys
+from main import create_app
+create_app()
+print(' '.join(sorted(sys.modules)))
+'''
+
+# Heavy dependencies only imported by the views that use them
+LAZY_MODULES = ('numpy', 'cloudinary')
+
+
+def modules_loaded_by_create_app():
+    """Returns the modules loaded by a fresh interpreter creating the app"""
+
+    env = dict(os.environ)
+    env.setdefault('FLASK_ENV', 'testing')
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE],
+        cwd=ROOT_DIR,
+        env=env,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True)
+
+    return set(result.stdout.strip().split('\n')[-1].split())
+
+
+class TestImportTime:
+    """Class for the cold start up of the app"""
+
+    def test_create_app_leaves_heavy_modules_unimported(self):  #pylint: disable=C0103
+        """
+        Tests that creating the app does not import the heavy dependencies
+        """
+
+        assert not [
+            module for module in modules_loaded_by_create_app()
+            if module.split('.')[0] in LAZY_MODULES
+        ]
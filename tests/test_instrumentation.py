@@ -0,0 +1,81 @@
+"""Module for request instrumentation tests."""
+from os import getenv
+
+from api.models import Asset
+from api.utilities.constants import CHARSET
+
+API_BASE_URL_V1 = getenv('API_BASE_URL_V1')
+
+
+class TestInstrumentation:
+    """Class for request instrumentation tests."""
+
+    def test_server_timing_header(  #pylint: disable=C0103
+            self,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header,
+            test_asset_category):
+        """Tests that a response reports the time spent in its phases"""
+
+        Asset(tag='AND/TIMING/1', asset_category_id=test_asset_category.id)\
+            .save()
+        response = client.get(
+            f'{API_BASE_URL_V1}/assets?where=tag,like,TIMING&limit=10&page=1',
+            headers=auth_header)
+        server_timing = response.headers['Server-Timing']
+
+        assert response.status_code == 200
+        assert server_timing.startswith('total;dur=')
+        assert 'db;dur=' in server_timing
+        for phase in ('dump', 'filter', 'jwt'):
+            assert f'{phase};dur=' in server_timing
+
+    def test_metrics_endpoint(  #pylint: disable=C0103
+            self,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header):
+        """Tests that the metrics are exported in prometheus text format"""
+
+        client.get(f'{API_BASE_URL_V1}/asset-categories', headers=auth_header)
+        response = client.get('/metrics')
+        metrics = response.data.decode(CHARSET)
+
+        assert response.status_code == 200
+        assert response.headers['Content-Type'].startswith('text/plain')
+        assert '# TYPE activo_http_requests_total counter' in metrics
+        assert (f'activo_http_requests_total{{method="GET",'
+                f'endpoint="{API_BASE_URL_V1}/asset-categories",status="200"}}'
+                ) in metrics
+        assert (f'activo_http_request_duration_seconds_count{{method="GET",'
+                f'endpoint="{API_BASE_URL_V1}/asset-categories"}}') in metrics
+        assert 'activo_db_queries_total{' in metrics
+        assert 'activo_token_cache_hits_total ' in metrics
+        assert 'activo_db_pool_checked_out{bind="primary"} ' in metrics
+        assert 'activo_db_pool_overflow{bind="primary"} 0' in metrics
+        assert ('activo_db_pool_checkout_wait_seconds_count'
+                '{bind="primary"} ') in metrics
+
+    def test_request_over_query_limit_is_logged(  #pylint: disable=C0103
+            self,
+            app,
+            client,
+            init_db,  #pylint: disable=W0613
+            auth_header,
+            caplog):
+        """Tests that a request running too many queries is logged"""
+
+        app.config['REQUEST_QUERY_LIMIT'] = 1
+        try:
+            # counts then selects the page of assets
+            client.get(
+                f'{API_BASE_URL_V1}/assets?limit=10&page=1',
+                headers=auth_header)
+        finally:
+            app.config['REQUEST_QUERY_LIMIT'] = 25
+
+        assert any(
+            record.getMessage().startswith(
+                f'Slow request GET {API_BASE_URL_V1}/assets?limit=10&page=1')
+            for record in caplog.records)
@@ -0,0 +1,42 @@
+"""Module for lazily registered plugins tests."""
+from api.middlewares.plugins import IMAGE_STORAGE, LazyPlugins, plugins
+
+
+class TestPlugins:
+    """Class for lazily registered plugins tests."""
+
+    def test_plugin_registered_on_first_request(self, app):  #pylint: disable=C0103
+        """
+        Tests that a plugin is registered on the first call of a view
+        requiring it and reused by the following ones
+        """
+
+        lazy_plugins = LazyPlugins()
+        loaded_apps = []
+
+        @lazy_plugins.plugin('counter')
+        def load_counter(app):  #pylint: disable=W0612
+            loaded_apps.append(app)
+            return len(loaded_apps)
+
+        @lazy_plugins.requires('counter')
+        def view():
+            return lazy_plugins.get('counter')
+
+        with app.test_request_context():
+            app.extensions['plugins'].pop('counter', None)
+            assert loaded_apps == []
+            assert view() == 1
+            assert view() == 1
+
+        assert loaded_apps == [app]
+        app.extensions['plugins'].pop('counter')
+
+    def test_image_storage_plugin_configures_cloudinary(self, app):  #pylint: disable=C0103
+        """Tests that the image storage plugin configures cloudinary"""
+
+        import cloudinary
+
+        assert plugins.load(app, IMAGE_STORAGE) is cloudinary
+        assert app.extensions['plugins'][IMAGE_STORAGE] is cloudinary
+        app.extensions['plugins'].pop(IMAGE_STORAGE)
@@ -0,0 +1,36 @@
+"""Module for PushID generator tests"""
+
+from time import time
+
+from api.models.push_id import PUSH_CHARS, PushID
+
+
+class TestPushID:
+    def test_ids_are_monotonic(self):
+        push_id = PushID()
+        ids = [push_id.next_id() for _ in range(100)]
+        ids += push_id.next_ids(1000) + [push_id.next_id()]
+
+        assert all(len(id_) == 20 for id_ in ids)
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_id_starts_with_the_timestamp(self):
+        before = int(time() * 1000)
+        id_ = PushID().next_id()
+        after = int(time() * 1000)
+
+        timestamp = 0
+        for char in id_[:8]:
+            timestamp = timestamp * 64 + PUSH_CHARS.index(char)
+
+        assert before <= timestamp <= after
+
+    def test_increment_carries_over(self):
+        push_id = PushID()
+        push_id.last_id = (int(time() * 1000) + 1000 << 72) | (2**72 - 2)
+        first_id, second_id = push_id.next_ids(2)
+
+        assert first_id[8:] == 'zzzzzzzzzzzz'
+        assert second_id[8:] == '------------'
+        assert first_id < second_id
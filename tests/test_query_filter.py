@@ -9,6 +9,10 @@ from api.utilities.constants import CHARSET
 from api.utilities.messages.error_messages import filter_errors
 from api.middlewares.base_validator import ValidationError
 from api.models.asset_category import AssetCategory
+from api.models.asset import Asset
+from api.models.attribute import Attribute
+from api.utilities.attribute_spec import input_control_cache
+from api.utilities.dynamic_filter import DynamicFilter
 
 api_v1_base_url = getenv("API_BASE_URL_V1")
 
@@ -158,3 +162,152 @@ class TestDynamicFilterClass:
         assert 'Apple' in names
         assert 'Laptop' in names
         assert 'Chromebook' not in names
+
+    def test_filters_share_the_plan_of_their_signature(  #pylint: disable=C0103
+            self, dynamic_filter):
+        """
+        Assert that filters on the same columns with the same operators, in
+        any order, share their plan and only bind different values
+        """
+        plan, params = dynamic_filter.plan(
+            ImmutableMultiDict([('where', 'name,like,ap'),
+                                ('where', 'deleted,ne,true')]))
+        other_plan, other_params = dynamic_filter.plan(
+            ImmutableMultiDict([('where', 'deleted,ne,true'),
+                                ('where', 'name,like,chrome')]))
+
+        assert other_plan is plan
+        assert params['asset_categories_where_1'] == '%ap%'
+        assert other_params['asset_categories_where_1'] == '%chrome%'
+
+        result = dynamic_filter.filter_query(
+            ImmutableMultiDict([('where', 'name,like,chrome')])).all()
+        assert [record.name for record in result] == ['Chromebook']
+
+    def test_custom_attribute_eq_filter_uses_containment(self, init_db):
+        """
+        Assert that eq filters on custom attributes are compiled to jsonb
+        containment and match both string and numeric values
+        """
+        asset_category = AssetCategory(name='Monitor')
+        asset_category.save()
+        for tag, custom_attributes in (('MON/1', {'color': 'indigo'}),
+                                       ('MON/2', {'color': 'red'}),
+                                       ('MON/3', {'size': 24}),
+                                       ('MON/4', {'size': '24'})):
+            Asset(tag=tag, asset_category_id=asset_category.id,
+                  custom_attributes=custom_attributes).save()
+
+        query = DynamicFilter(Asset).filter_query(
+            ImmutableMultiDict([('where', 'color,eq,indigo')]))
+
+        assert '@>' in str(query.statement)
+        assert [asset.tag for asset in query.all()] == ['MON/1']
+
+        result = DynamicFilter(Asset).filter_query(
+            ImmutableMultiDict([('where', 'size,eq,24')])).all()
+
+        assert sorted(asset.tag for asset in result) == ['MON/3', 'MON/4']
+
+    def test_in_between_isnull_and_startswith_filters(self, init_db):
+        """
+        Assert that the in, between, isnull and startswith operators filter
+        the assets and that startswith matches its value literally
+        """
+        asset_category = AssetCategory(name='Dock')
+        asset_category.save()
+        for tag, serial in (('DOCK/1', 'A1'), ('DOCK/2', None),
+                            ('DOCK/3', 'C3'), ('DO%K/4', 'D4')):
+            Asset(tag=tag, serial=serial,
+                  asset_category_id=asset_category.id).save()
+
+        def tags(*wheres):
+            query = DynamicFilter(Asset).filter_query(
+                ImmutableMultiDict([('where', where) for where in wheres]))
+            return sorted(asset.tag for asset in query.all())
+
+        assert tags('tag,in,DOCK/1,DOCK/3') == ['DOCK/1', 'DOCK/3']
+        assert tags('tag,in,DOCK/2') == ['DOCK/2']
+        assert tags('tag,between,DOCK/2,DOCK/3') == ['DOCK/2', 'DOCK/3']
+        assert tags('tag,startswith,DOCK/', 'serial,isnull,true') == [
+            'DOCK/2'
+        ]
+        assert tags('tag,startswith,DO%', 'serial,isnull,false') == ['DO%K/4']
+        assert tags('tag,startswith,DO', 'deleted,eq,false') == [
+            'DO%K/4', 'DOCK/1', 'DOCK/2', 'DOCK/3'
+        ]
+        assert tags('tag,startswith,DO', 'deleted,eq,true') == []
+
+    @pytest.mark.parametrize('where', [
+        'tag,between,DOCK/1', 'tag,eq,DOCK/1,DOCK/2', 'serial,isnull,yes',
+        'deleted,gt,true', 'created_at,like,2018-01-01'
+    ])
+    def test_invalid_operator_values(self, init_db, where):
+        """
+        Assert that operators given the wrong number or kind of values, or
+        not applicable to their column, are rejected
+        """
+        with pytest.raises(ValidationError):
+            DynamicFilter(Asset).filter_query(
+                ImmutableMultiDict([('where', where)]))
+
+    def test_datetime_filters_are_half_open_ranges(self, init_db):
+        """
+        Assert that the date filters of datetime columns compare the raw
+        column to the bounds of the days given
+        """
+        result = DynamicFilter(Asset).filter_query(ImmutableMultiDict([
+            ('where', 'created_at,le,2018-01-31')
+        ]))
+
+        assert 'date(' not in str(result.statement).lower()
+
+        today = Asset.query.first().created_at.date()
+        for where, count in ((f'created_at,eq,{today}', 1),
+                             (f'created_at,le,{today}', 1),
+                             (f'created_at,lt,{today}', 0),
+                             (f'created_at,gt,{today}', 0),
+                             (f'created_at,ne,{today}', 0),
+                             (f'created_at,between,2018-01-01,{today}', 1)):
+            assets = DynamicFilter(Asset).filter_query(
+                ImmutableMultiDict([('where', where),
+                                    ('where', 'tag,eq,DOCK/1')])).all()
+            assert len(assets) == count, where
+
+    def test_custom_attribute_range_filters_cast_by_input_control(  #pylint: disable=C0103
+            self, init_db):
+        """
+        Assert that range filters on custom attributes compare dates for
+        date input controls, numbers for numeric values and skip the values
+        which cannot be cast
+        """
+        input_control_cache.clear()
+        asset_category = AssetCategory(name='Display')
+        asset_category.attributes = [
+            Attribute(_key='inches', label='inches', is_required=False,
+                      input_control='Text'),
+            Attribute(_key='bought', label='bought', is_required=False,
+                      input_control='Date Added'),
+        ]
+        asset_category.save()
+        for tag, custom_attributes in (
+                ('DIS/1', {'inches': '9', 'bought': '2018-02-01'}),
+                ('DIS/2', {'inches': 24, 'bought': '2018-10-01'}),
+                ('DIS/3', {'inches': 'wide', 'bought': 'unknown'})):
+            Asset(tag=tag, asset_category_id=asset_category.id,
+                  custom_attributes=custom_attributes).save()
+
+        def tags(where):
+            query = DynamicFilter(Asset).filter_query(
+                ImmutableMultiDict([('where', where)]))
+            return sorted(asset.tag for asset in query.all())
+
+        assert tags('inches,gt,10') == ['DIS/2']
+        assert tags('inches,between,5,30') == ['DIS/1', 'DIS/2']
+        assert tags('bought,ge,2018-03-01') == ['DIS/2']
+        assert tags('bought,lt,2018-10-01') == ['DIS/1']
+        assert tags('inches,isnull,false') == ['DIS/1', 'DIS/2', 'DIS/3']
+        assert tags('inches,eq,1e400') == []
+
+        with pytest.raises(ValidationError):
+            tags('bought,gt,yesterday')
@@ -0,0 +1,187 @@
+"""Module for testing the routing of the reads to the read replicas"""
+
+from os import getenv
+
+import pytest
+from flask import json, request  #pylint: disable=E0401
+from flask_sqlalchemy import get_state
+from sqlalchemy import event
+
+from api.models import AssetCategory, UserWrite
+from api.models.database import db
+from .mocks.asset_category import valid_asset_category_data
+from .mocks.user import user_one
+
+api_v1_base_url = getenv('API_BASE_URL_V1')  #pylint: disable=C0103
+
+REPLICA_BINDS = ('read_replica_0', 'read_replica_1')
+
+WRITER_ID = '-LJzRmBUhsm7lBbYJvMj'
+
+
+@pytest.fixture(scope='function')
+def read_replicas(app, tmpdir):
+    """
+    Configures two read replicas, one sqlite file each, yielding their
+    engines keyed by bind
+    """
+
+    app.config['SQLALCHEMY_BINDS'] = {
+        bind: f'sqlite:///{tmpdir.join(bind)}.db'
+        for bind in REPLICA_BINDS
+    }
+    app.config['READ_REPLICA_BINDS'] = list(REPLICA_BINDS)
+    db.session.remove()
+
+    yield {bind: db.get_engine(app, bind=bind) for bind in REPLICA_BINDS}
+
+    db.session.remove()
+    for bind in REPLICA_BINDS:
+        get_state(app).connectors.pop(bind).get_engine().dispose()
+    app.config['SQLALCHEMY_BINDS'] = {}
+    app.config['READ_REPLICA_BINDS'] = []
+
+
+@pytest.fixture(scope='function')
+def primary_replica(app):
+    """
+    Configures a replica which is a second engine of the test database,
+    yielding the statements it runs
+    """
+
+    app.config['SQLALCHEMY_BINDS'] = {
+        'read_replica_0': app.config['SQLALCHEMY_DATABASE_URI']
+    }
+    app.config['READ_REPLICA_BINDS'] = ['read_replica_0']
+    db.session.remove()
+    replica = db.get_engine(app, bind='read_replica_0')
+    statements = []
+
+    def record_statement(conn, cursor, statement, *args):  #pylint: disable=W0613
+        statements.append(statement)
+
+    event.listen(replica, 'before_cursor_execute', record_statement)
+
+    yield statements
+
+    event.remove(replica, 'before_cursor_execute', record_statement)
+    db.session.remove()
+    get_state(app).connectors.pop('read_replica_0')
+    replica.dispose()
+    app.config['SQLALCHEMY_BINDS'] = {}
+    app.config['READ_REPLICA_BINDS'] = []
+
+
+def set_request_user(user_id):
+    """Sets the token of the current request to one of the user"""
+
+    setattr(request, 'decoded_token', {'UserInfo': {'id': user_id}})
+
+
+def session_bind(app, method, user_id=None):
+    """Returns the engine the session reads from in a request of the user"""
+
+    with app.test_request_context(method=method):
+        if user_id is not None:
+            set_request_user(user_id)
+        bind = db.session.get_bind()
+        # Checks the replica is actually read from
+        assert db.session.execute('SELECT 1').scalar() == 1
+        db.session.rollback()
+        return bind
+
+
+class TestRoutingSession:
+    """Tests the routing of the reads to the read replicas"""
+
+    def test_reads_of_get_requests_round_robin(  #pylint: disable=R0201,C0103
+            self, app, init_db, read_replicas):  #pylint: disable=W0613
+        """Should spread the reads of the GET requests over the replicas"""
+
+        binds = {session_bind(app, 'GET') for _ in REPLICA_BINDS}
+
+        assert binds == set(read_replicas.values())
+        assert session_bind(app, 'POST') is db.engine
+
+        with app.test_request_context(method='GET'):
+            assert db.session.get_bind() is db.session.get_bind()
+
+    def test_reads_without_replicas(  #pylint: disable=R0201,C0103
+            self, app, init_db):  #pylint: disable=W0613
+        """Should read from the primary without replicas"""
+
+        assert session_bind(app, 'GET') is db.engine
+
+    def test_read_your_writes(  #pylint: disable=R0201,C0103
+            self, app, init_db, read_replicas):  #pylint: disable=W0613
+        """
+        Should write to the primary and read the writes of a user from it
+        for the read your writes window, whichever request follows
+        """
+
+        with app.test_request_context(method='GET'):
+            set_request_user(WRITER_ID)
+            assert db.session.get_bind() in read_replicas.values()
+
+            AssetCategory(name='Routed Category').save()
+
+            assert db.session.get_bind() is db.engine
+
+        assert AssetCategory.query.filter_by(
+            name='Routed Category').count() == 1
+        assert UserWrite.query.get(WRITER_ID) is not None
+        assert session_bind(app, 'GET', WRITER_ID) is db.engine
+        assert session_bind(app, 'GET', user_one.id) in read_replicas.values()
+        assert session_bind(app, 'GET') in read_replicas.values()
+
+        db.session.execute(
+            "UPDATE user_writes SET written_at = now() - interval '1 minute'")
+        db.session.commit()
+
+        assert session_bind(app, 'GET', WRITER_ID) in read_replicas.values()
+
+    def test_writes_without_replicas(  #pylint: disable=R0201,C0103
+            self, app, init_db):  #pylint: disable=W0613
+        """Should not record the writes of the users without replicas"""
+
+        with app.test_request_context(method='POST'):
+            set_request_user(user_one.id)
+            AssetCategory(name='Unrouted Category').save()
+
+        assert UserWrite.query.get(user_one.id) is None
+
+    def test_get_endpoint_reads_from_replica(  #pylint: disable=R0201,C0103
+            self, client, init_db, auth_header,  #pylint: disable=W0613
+            primary_replica):
+        """Should run the queries of a GET endpoint on a replica"""
+
+        response = client.get(
+            f'{api_v1_base_url}/asset-categories/stats', headers=auth_header)
+
+        assert response.status_code == 200
+        assert json.loads(response.data)['status'] == 'success'
+        assert any('asset_categories' in statement
+                   for statement in primary_replica)
+
+    def test_get_endpoint_reads_writes_of_user(  #pylint: disable=R0201,C0103
+            self, app, init_db, auth_header,  #pylint: disable=W0613
+            primary_replica):
+        """
+        Should run the queries of a GET endpoint following a write of its
+        user on the primary, the client sending no cookies back
+        """
+
+        client = app.test_client(use_cookies=False)
+        response = client.post(
+            f'{api_v1_base_url}/asset-categories',
+            data=json.dumps(valid_asset_category_data),
+            headers=auth_header)
+
+        assert response.status_code == 201
+        assert 'Set-Cookie' not in response.headers
+
+        response = client.get(
+            f'{api_v1_base_url}/asset-categories/stats', headers=auth_header)
+
+        assert response.status_code == 200
+        assert primary_replica == []
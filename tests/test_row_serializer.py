@@ -0,0 +1,123 @@
+"""Module for the golden tests of the serializers compiled from schemas."""
+import json
+
+import pytest
+
+from api.models import Asset, AssetCategory, Attribute
+from api.models.database import db
+from api.utilities.constants import EXCLUDED_FIELDS
+from api.utilities.model_serializers.asset import AssetSchema
+from api.utilities.model_serializers.asset_category import (
+    AssetCategorySchema, EagerLoadAssetCategoryAttributesSchema)
+from api.utilities.model_serializers.attribute import AttributeSchema
+from api.utilities.model_serializers.row_serializer import RowSerializer
+
+
+@pytest.fixture(scope='module')
+def golden_category(app, init_db):  #pylint: disable=W0613
+    """Create an asset category with attributes and assets of every kind"""
+
+    asset_category = AssetCategory(name='Golden')
+    asset_category.attributes = [
+        Attribute(
+            _key='color',
+            label='color',
+            is_required=True,
+            input_control='Dropdown',
+            choices='black,white'),
+        Attribute(
+            _key='note', label='note', is_required=False,
+            input_control='Text'),
+        Attribute(
+            _key='bought',
+            label='bought',
+            is_required=False,
+            input_control='Date Added',
+            choices=''),
+    ]
+    asset_category.save()
+    for tag, serial, custom_attributes in (
+            ('GOLD/1', 'S1', {
+                'color': 'black',
+                'note': 'a "quoted" \\ note'
+            }),
+            ('GOLD/2', None, {'color': 'white', 'size': 24.5}),
+            ('GOLD/3', '', None)):
+        Asset(tag=tag, serial=serial, asset_category_id=asset_category.id,
+              custom_attributes=custom_attributes).save()
+    Asset.query.filter_by(tag='GOLD/3').first()._update(  #pylint: disable=W0212
+        serial='S3', created_by='-LOq8XGSOvWVx9Nh1B3v')
+    return asset_category
+
+
+def encode(data):
+    """Encodes data as restplus and jsonify do, keeping the key order"""
+    return json.dumps(data).encode('utf-8')
+
+
+class TestRowSerializer:
+    """Class for the golden tests of the row serializers."""
+
+    @pytest.mark.parametrize('only,exclude', [
+        (None, ()),
+        (None, EXCLUDED_FIELDS),
+        (['tag', 'custom_attributes'], EXCLUDED_FIELDS),
+    ])
+    def test_assets_dump_as_their_schema(self, golden_category, only,
+                                         exclude):
+        """
+        Tests that ORM assets and Core rows dump to the bytes of the dump of
+        the AssetSchema
+        """
+
+        assets = Asset.query.filter_by(
+            asset_category_id=golden_category.id).order_by(Asset.tag).all()
+        rows = db.session.execute(Asset.__table__.select().where(
+            Asset.asset_category_id == golden_category.id).order_by(
+                Asset.tag)).fetchall()
+        schema = AssetSchema(many=True, only=only, exclude=exclude)
+        golden = encode(schema.dump(assets).data)
+
+        assert encode(RowSerializer(schema)(assets)) == golden
+        assert encode(RowSerializer(schema)(rows)) == golden
+
+    def test_attributes_dump_as_their_schema(self, golden_category):
+        """
+        Tests that attributes dump to the bytes of the dump of the
+        AttributeSchema, its post dump processor included
+        """
+
+        attributes = golden_category.attributes.order_by(
+            Attribute.label).all()
+        rows = db.session.execute(Attribute.__table__.select().where(
+            Attribute.asset_category_id == golden_category.id).order_by(
+                Attribute.label)).fetchall()
+        schema = AttributeSchema(many=True, exclude=['deleted'])
+        golden = encode(schema.dump(attributes).data)
+
+        assert b'"choices": ["black", "white"]' in golden
+        assert encode(RowSerializer(schema)(attributes)) == golden
+        assert encode(RowSerializer(schema)(rows)) == golden
+
+    @pytest.mark.parametrize(
+        'schema_class',
+        [AssetCategorySchema, EagerLoadAssetCategoryAttributesSchema])
+    def test_asset_categories_dump_as_their_schema(  #pylint: disable=C0103
+            self, golden_category, schema_class):
+        """
+        Tests that asset categories dump to the bytes of the dump of their
+        schemas, the fields computed by methods included
+        """
+
+        asset_categories = AssetCategory.query.filter_by(
+            id=golden_category.id).all()
+        schema = schema_class(
+            many=True,
+            exclude=['deleted'],
+            context={'assets_counts': {
+                golden_category.id: 3
+            }})
+        golden = encode(schema.dump(asset_categories).data)
+
+        assert b'"assetsCount": 3' in golden
+        assert encode(RowSerializer(schema)(asset_categories)) == golden
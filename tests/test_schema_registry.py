@@ -0,0 +1,38 @@
+"""Module for the schema registry tests."""
+from api.utilities.model_serializers.asset import AssetSchema
+from api.utilities.model_serializers.schema_registry import (SchemaRegistry,
+                                                             parse_fields)
+
+
+class TestSchemaRegistry:
+    """Class for the schema registry tests."""
+
+    def test_schemas_are_shared_by_their_options(self):  #pylint: disable=C0103
+        """
+        Tests that a schema instance is built once per class and options,
+        whatever the order of its only and exclude fields
+        """
+
+        schemas = SchemaRegistry()
+        schema = schemas.get(
+            AssetSchema, many=True, only=['tag', 'serial'], exclude=['id'])
+
+        assert schemas.get(
+            AssetSchema, many=True, only=['serial', 'tag'],
+            exclude=['id']) is schema
+        assert schemas.get(AssetSchema, many=True) is not schema
+        assert schemas.get(AssetSchema) is not schemas.get(
+            AssetSchema, many=True)
+        assert schemas.cache.stats()['entries'] == 3
+
+    def test_parse_fields_maps_dump_keys_to_fields(self):  #pylint: disable=C0103
+        """
+        Tests that the fields query string selects the schema fields by
+        their name or their dump key, once each
+        """
+
+        assert parse_fields(AssetSchema, None) is None
+        assert parse_fields(
+            AssetSchema, 'tag,customAttributes,custom_attributes,tag') == [
+                'tag', 'custom_attributes'
+            ]
@@ -1,10 +1,13 @@
 from os import getenv
 
+import jwt
 from flask import json
 
+from api.middlewares.token_required import token_cache
 from api.utilities.messages.error_messages import jwt_errors
 from api.utilities.constants import CHARSET
 from .helpers.generate_token import generate_token
+from .mocks.user import user_one
 
 api_v1_base_url = getenv('API_BASE_URL_V1')
 
@@ -40,3 +43,42 @@ class TestTokenRequiredMiddleware:
 
         assert response.status_code == 401
         assert response_json['message'] == jwt_errors['EXPIRED_TOKEN_MSG']
+
+    def test_token_required_caches_verified_tokens(self, client, init_db):
+        token = generate_token()
+        token_cache.clear()
+        stats = token_cache.stats()
+
+        for _ in range(2):
+            response = client.get(
+                f'{api_v1_base_url}/asset-categories/stats',
+                headers={'Authorization': token})
+            assert response.status_code == 200
+
+        assert token_cache.stats() == {
+            'hits': stats['hits'] + 1,
+            'misses': stats['misses'] + 1,
+            'entries': 1
+        }
+
+    def test_token_required_with_audience(self, client, init_db):
+        payload = {'UserInfo': user_one.to_dict(), 'aud': 'andela.com'}
+        token = jwt.encode(payload, getenv('JWT_SECRET_KEY'),
+                           algorithm='RS256').decode(CHARSET)
+
+        response = client.get(f'{api_v1_base_url}/asset-categories/stats',
+                              headers={'Authorization': f'Bearer {token}'})
+
+        assert response.status_code == 200
+
+    def test_token_required_with_invalid_audience(self, client):
+        payload = {'UserInfo': user_one.to_dict(), 'aud': 'example.com'}
+        token = jwt.encode(payload, getenv('JWT_SECRET_KEY'),
+                           algorithm='RS256').decode(CHARSET)
+
+        response = client.get(f'{api_v1_base_url}/asset-categories/stats',
+                              headers={'Authorization': f'Bearer {token}'})
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 401
+        assert response_json['message'] == jwt_errors['INVALID_TOKEN_MSG']